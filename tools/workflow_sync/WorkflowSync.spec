@@ -14,7 +14,7 @@ block_cipher = None
 base_path = Path(SPECPATH)
 
 a = Analysis(
-    ['interactive.py'],
+    ['cli.py'],
     pathex=[str(base_path)],
     binaries=[],
     datas=[],
@@ -32,10 +32,10 @@ if ! python3 -c "import PyInstaller" 2>/dev/null; then
     echo -e "${GREEN}✓ PyInstaller instalado${NC}"
 fi
 
-# Verificar/instalar PyGithub
-if ! python3 -c "import github" 2>/dev/null; then
+# Verificar/instalar PyGithub (>= 2.6, con Requester.getStream) y requests
+if ! python3 -c "import requests; from github.Requester import Requester; Requester.getStream" 2>/dev/null; then
     echo -e "${YELLOW}Instalando PyGithub...${NC}"
-    pip3 install PyGithub --quiet
+    pip3 install "PyGithub>=2.6" requests --quiet
     echo -e "${GREEN}✓ PyGithub instalado${NC}"
 fi
 
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Workflow Sync Tool - Punto de entrada de línea de comandos.
+
+Sin argumentos abre la interfaz interactiva. Con --resume continúa una
+ejecución interrumpida a partir de su diario, sin prompts. Con --org,
+--topic y --source-repo ejecuta una sincronización sin prompts (p. ej. en
+el CI del propio repo fuente, con --source-path apuntando al checkout).
+Con --gc-branches, --org y --topic elimina los branches de sync sobrantes.
+Con --drift FILE, --org, --topic y --source-repo genera el informe de
+drift (CSV o JSON). Con --plan FILE (y los argumentos de sincronización) guarda un plan sin
+escribir nada; con --apply FILE lo aplica sin volver a descubrir repos.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+# Agregar el directorio actual al path para imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+import interactive
+from exceptions import ValidationError
+from models import DiscoveryMode, MergeMode, SourceMode, SyncConfig
+from services.run_journal import RunJournal
+from validators.input_validator import InputValidator
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Construye el parser de argumentos."""
+    parser = argparse.ArgumentParser(
+        prog="workflow-sync",
+        description="Sincroniza GitHub Actions workflows entre repositorios por topic",
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        help="Reanudar una ejecución interrumpida a partir de su diario",
+    )
+    parser.add_argument(
+        "--list-runs",
+        action="store_true",
+        help="Listar las ejecuciones registradas",
+    )
+    parser.add_argument(
+        "--apply",
+        metavar="FILE",
+        help="Aplicar un plan guardado con --plan",
+    )
+    parser.add_argument(
+        "--drift",
+        metavar="FILE",
+        help=(
+            "Informe repo × workflow de drift en FILE (.json o CSV) "
+            "(con --org, --topic y --source-repo)"
+        ),
+    )
+    parser.add_argument(
+        "--gc-branches",
+        action="store_true",
+        help="Eliminar los branches de sync sin PR abierto (con --org y --topic)",
+    )
+
+    run = parser.add_argument_group("sincronización sin prompts")
+    run.add_argument("--org", help="Organización de GitHub")
+    run.add_argument("--topic", help="Topic para filtrar repositorios")
+    run.add_argument("--source-repo", help="Repositorio fuente (sin org)")
+    run.add_argument(
+        "--source-path",
+        help="Checkout local del repo fuente (evita descargar los workflows)",
+    )
+    run.add_argument(
+        "--source-range",
+        metavar="BASE..HEAD",
+        help=(
+            "Solo sincronizar los repos que usan workflows afectados por los cambios "
+            "de la fuente en el rango (directamente o por sus composite actions)"
+        ),
+    )
+    run.add_argument(
+        "--delta",
+        action="store_true",
+        help=(
+            "Con --source-range, comparar solo los workflows añadidos, modificados o "
+            "eliminados en el rango y dejar el resto de archivos como están"
+        ),
+    )
+    run.add_argument("--files", nargs="+", default=[], help="Archivos específicos")
+    run.add_argument("--dry-run", action="store_true", help="Solo mostrar cambios")
+    run.add_argument(
+        "--plan",
+        metavar="FILE",
+        help="Guardar el plan de cambios en FILE sin escribir nada (ver --apply)",
+    )
+    run.add_argument("--auto-merge", action="store_true", help="Mergear los PRs")
+    run.add_argument(
+        "--merge-mode",
+        choices=[m.value for m in MergeMode],
+        default=MergeMode.BLOCKING.value,
+        help=(
+            "blocking: mergear en el worker; native: auto-merge de GitHub y cola de merge; "
+            "wait_green: esperar los checks de todos los PRs y mergear los verdes"
+        ),
+    )
+    run.add_argument("--workers", type=int, default=4, help="Repos en paralelo")
+    run.add_argument(
+        "--org-listing",
+        action="store_true",
+        help=(
+            "Recorrer todos los repos de la org en lugar de la Search API "
+            "(sin su límite de 1.000 resultados); también con --gc-branches"
+        ),
+    )
+    return parser
+
+
+def build_config(args: argparse.Namespace, token: str) -> SyncConfig:
+    """Construye la configuración de una sincronización sin prompts.
+
+    Raises:
+        ValidationError: Si algún argumento no es válido.
+    """
+    if not (args.org and args.topic and args.source_repo):
+        raise ValidationError("--org, --topic y --source-repo son obligatorios")
+    InputValidator.validate_organization(args.org)
+    InputValidator.validate_topic(args.topic)
+    InputValidator.validate_repository(args.source_repo)
+    if args.files:
+        InputValidator.validate_workflow_files(args.files)
+    if args.workers < 1:
+        raise ValidationError("--workers debe ser un entero positivo")
+    if args.source_path and not Path(args.source_path).is_dir():
+        raise ValidationError(f"No existe el directorio {args.source_path}")
+    if args.source_range:
+        InputValidator.validate_commit_range(args.source_range)
+    elif args.delta:
+        raise ValidationError("--delta requiere --source-range")
+
+    return SyncConfig(
+        token=token,
+        org=args.org,
+        topic=args.topic,
+        source_repo=args.source_repo,
+        dry_run=args.dry_run,
+        files_filter=args.files,
+        max_workers=args.workers,
+        auto_merge=args.auto_merge,
+        merge_mode=MergeMode(args.merge_mode),
+        source_mode=SourceMode.LOCAL if args.source_path else SourceMode.ARCHIVE,
+        source_path=args.source_path,
+        source_range=args.source_range,
+        delta=args.delta,
+        discovery=discovery_mode(args),
+    )
+
+
+def discovery_mode(args: argparse.Namespace) -> DiscoveryMode:
+    """Modo de descubrimiento de repos indicado en los argumentos."""
+    return DiscoveryMode.ORG_LISTING if args.org_listing else DiscoveryMode.SEARCH
+
+
+def resolve_token() -> str | None:
+    """Token de los comandos sin prompts: GITHUB_TOKEN y, si no, el guardado.
+
+    Un token exportado explícitamente siempre tiene prioridad, también al
+    reanudar una ejecución (el diario no guarda el token).
+    """
+    token = os.environ.get("GITHUB_TOKEN", "") or interactive.load_saved_token()
+    if not token:
+        interactive.print_error("Se requiere un token (en GITHUB_TOKEN o guardado)")
+    return token or None
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Punto de entrada principal.
+
+    Returns:
+        Código de salida (0 = éxito).
+    """
+    args = build_parser().parse_args(argv)
+
+    if args.list_runs:
+        for run_id in RunJournal.list_runs(interactive.RUNS_DIR):
+            print(run_id)
+        return 0
+
+    if args.resume:
+        token = resolve_token()
+        if not token:
+            return 1
+
+        try:
+            return 0 if interactive.resume_run(token, args.resume) else 1
+        except KeyboardInterrupt:
+            print()
+            interactive.print_warning("Operación cancelada")
+            return 130
+
+    if args.apply:
+        token = resolve_token()
+        if not token:
+            return 1
+
+        try:
+            return 0 if interactive.apply_plan(token, args.apply) else 1
+        except KeyboardInterrupt:
+            print()
+            interactive.print_warning("Operación cancelada")
+            return 130
+
+    if args.drift:
+        token = resolve_token()
+        if not token:
+            return 1
+
+        try:
+            if not (args.org and args.topic and args.source_repo):
+                raise ValidationError("--org, --topic y --source-repo son obligatorios")
+            InputValidator.validate_organization(args.org)
+            InputValidator.validate_topic(args.topic)
+            InputValidator.validate_repository(args.source_repo)
+            if args.files:
+                InputValidator.validate_workflow_files(args.files)
+        except ValidationError as e:
+            interactive.print_error(str(e))
+            return 2
+
+        ok = interactive.run_drift_report(
+            token, args.org, args.topic, args.source_repo, args.drift, args.files
+        )
+        return 0 if ok else 1
+
+    if args.gc_branches:
+        token = resolve_token()
+        if not token:
+            return 1
+
+        try:
+            if not (args.org and args.topic):
+                raise ValidationError("--org y --topic son obligatorios")
+            InputValidator.validate_organization(args.org)
+            InputValidator.validate_topic(args.topic)
+            if args.workers < 1:
+                raise ValidationError("--workers debe ser un entero positivo")
+        except ValidationError as e:
+            interactive.print_error(str(e))
+            return 2
+
+        ok = interactive.run_branch_gc(
+            token,
+            args.org,
+            args.topic,
+            args.dry_run,
+            workers=args.workers,
+            discovery=discovery_mode(args),
+        )
+        return 0 if ok else 1
+
+    if args.org or args.topic or args.source_repo:
+        token = resolve_token()
+        if not token:
+            return 1
+
+        try:
+            config = build_config(args, token)
+        except ValidationError as e:
+            interactive.print_error(str(e))
+            return 2
+
+        try:
+            return 0 if interactive.run_sync(config, plan_path=args.plan) else 1
+        except KeyboardInterrupt:
+            print()
+            interactive.print_warning("Operación cancelada")
+            return 130
+
+    interactive.main()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,16 @@
 """Módulo de clientes para APIs externas."""
 
+from .async_github_client import AsyncGitHubClient
+from .git_transport_client import GitTransportClient
 from .github_client import GitHubClient, IGitHubClient
+from .http_cache import HttpCache
+from .rate_limiter import RateLimiter
 
-__all__ = ["GitHubClient", "IGitHubClient"]
+__all__ = [
+    "AsyncGitHubClient",
+    "GitHubClient",
+    "GitTransportClient",
+    "HttpCache",
+    "IGitHubClient",
+    "RateLimiter",
+]
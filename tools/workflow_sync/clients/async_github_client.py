@@ -0,0 +1,206 @@
+"""
+Cliente de GitHub sobre un stack HTTP asíncrono (asyncio + aiohttp).
+
+Principio SOLID: Liskov Substitution
+- Cumple el mismo contrato IGitHubClient que GitHubClient, por lo que el
+  servicio de sincronización lo usa sin cambios.
+
+Principio SOLID: Open/Closed
+- Solo reemplaza el transporte (GitHubClient._send); reintentos, caché y
+  lógica de cada operación se heredan.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from typing import Any, Coroutine, TypeVar
+from urllib.parse import urljoin, urlsplit
+
+try:
+    import aiohttp
+except ImportError:  # Dependencia opcional: pip install "workflow-sync[async]"
+    aiohttp = None
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from exceptions import WorkflowSyncError
+
+from .github_client import GitHubClient
+from .http_cache import HttpCache
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncGitHubClient(GitHubClient):
+    """Cliente de GitHub con I/O asíncrono y pool de conexiones compartido.
+
+    Un event loop dedicado (en su propio hilo) multiplexa todas las
+    peticiones sobre una única sesión aiohttp con conexiones keep-alive.
+    Un semáforo global limita las peticiones en vuelo y todas reutilizan las
+    conexiones del pool, sin abrir un socket por hilo que llama.
+
+    Los métodos de IGitHubClient son síncronos (bloquean al hilo que llama
+    hasta que la corrutina termina); `request` es la variante nativa para
+    código asyncio. No deben invocarse los métodos síncronos desde el propio
+    event loop del cliente.
+    """
+
+    API_URL = "https://api.github.com"
+    DEFAULT_MAX_CONCURRENCY = 100
+    MAX_REDIRECTS = 5
+
+    def __init__(
+        self,
+        token: str,
+        timeout: int = 30,
+        cache: HttpCache | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        base_url: str = API_URL,
+    ) -> None:
+        """Inicializa el cliente y arranca su event loop.
+
+        Args:
+            token: Token de autenticación de GitHub.
+            timeout: Timeout para llamadas API en segundos.
+            cache: Caché HTTP persistente para lecturas condicionales (opcional).
+            max_concurrency: Máximo de peticiones HTTP en vuelo.
+            base_url: URL base de la API REST.
+
+        Raises:
+            WorkflowSyncError: Si aiohttp no está instalado.
+        """
+        if aiohttp is None:
+            raise WorkflowSyncError(
+                "AsyncGitHubClient requiere aiohttp: pip install 'workflow-sync[async]'"
+            )
+
+        super().__init__(token, timeout=timeout, cache=cache)
+        self._token = token
+        self._base_url = base_url.rstrip("/")
+        self._max_concurrency = max_concurrency
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="github-async-io",
+            daemon=True,
+        )
+        self._thread.start()
+
+        self._semaphore: asyncio.Semaphore | None = None
+        self._session: aiohttp.ClientSession | None = None
+        self._run(self._open_session())
+
+    async def request(
+        self,
+        verb: str,
+        url: str,
+        parameters: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        input: Any = None,
+    ) -> tuple[int, dict[str, str], str]:
+        """Envía una petición de forma asíncrona y retorna (status, cabeceras, cuerpo).
+
+        Debe ejecutarse en el event loop del cliente.
+        """
+        params = {k: str(v) for k, v in (parameters or {}).items()}
+        url = self._absolute_url(url)
+
+        async with self._semaphore:
+            for _ in range(self.MAX_REDIRECTS + 1):
+                async with self._session.request(
+                    verb,
+                    url,
+                    params=params or None,
+                    headers=headers or None,
+                    json=input,
+                    allow_redirects=False,
+                ) as response:
+                    body = await response.text()
+                    location = self._redirect_location(url, response)
+                    if location is None:
+                        return response.status, dict(response.headers), body
+
+                # Repo renombrado o transferido: se repite la petición en la
+                # nueva URL, que ya incluye los parámetros
+                logger.debug("Redirección %d: %s -> %s", response.status, url, location)
+                url = location
+                params = {}
+
+        return response.status, dict(response.headers), body
+
+    @staticmethod
+    def _redirect_location(url: str, response: "aiohttp.ClientResponse") -> str | None:
+        """URL a la que seguir una redirección (None si no hay que seguirla).
+
+        Como el transporte de PyGithub, solo se siguen redirecciones al mismo
+        host para no enviar el token a otro servidor.
+        """
+        if response.status not in (301, 302, 307, 308):
+            return None
+        location = response.headers.get("Location")
+        if not location:
+            return None
+        target = urljoin(url, location)
+        if urlsplit(target)[:2] != urlsplit(url)[:2]:
+            logger.warning("Redirección a otro host ignorada: %s", target)
+            return None
+        return target
+
+    def close(self) -> None:
+        """Cierra la sesión HTTP y detiene el event loop."""
+        if not self._loop.is_running():
+            return
+        self._run(self._session.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop.close()
+
+    def _send(
+        self,
+        verb: str,
+        url: str,
+        parameters: dict[str, Any] | None,
+        headers: dict[str, str],
+        input: Any,
+    ) -> tuple[int, dict[str, str], str]:
+        """Envía la petición a través del event loop del cliente."""
+        return self._run(self.request(verb, url, parameters, headers, input))
+
+    async def _open_session(self) -> None:
+        """Crea la sesión aiohttp dentro del event loop."""
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        connector = aiohttp.TCPConnector(
+            limit=self._max_concurrency,
+            ttl_dns_cache=300,
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self._timeout),
+            headers={
+                "Authorization": f"Bearer {self._token}",
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+                "User-Agent": "workflow-sync",
+            },
+        )
+        logger.debug(
+            "Sesión HTTP asíncrona abierta (máx. %d conexiones)",
+            self._max_concurrency,
+        )
+
+    def _run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Ejecuta una corrutina en el event loop del cliente y espera el resultado."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def _absolute_url(self, url: str) -> str:
+        """Convierte rutas relativas (/repos/...) en URLs absolutas."""
+        if url.startswith("/"):
+            return f"{self._base_url}{url}"
+        return url
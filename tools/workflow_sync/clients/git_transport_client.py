@@ -0,0 +1,450 @@
+"""
+Cliente de GitHub con transporte git sobre clones parciales locales.
+
+Las lecturas y escrituras de contenido de los repos destino se hacen con git
+sobre clones bare sin blobs (`--filter=blob:none`) guardados en un directorio
+de caché: el listado de workflows y la comparación son locales, y todos los
+cambios de un repo se publican con un único `git push`. La API REST solo se
+usa para descubrir repos, abrir PRs y mergearlos.
+
+Principio SOLID: Liskov Substitution
+- Cumple el mismo contrato IGitHubClient que GitHubClient, por lo que el
+  servicio de sincronización lo usa sin cambios.
+
+Principio SOLID: Open/Closed
+- Solo reemplaza las operaciones de contenido y refs; reintentos, rate
+  limiting y el resto de la API se heredan de GitHubClient.
+"""
+
+from __future__ import annotations
+
+import base64
+import logging
+import os
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+from urllib.parse import urlsplit
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from exceptions import BranchExistsError, RepositoryAccessError
+from models import FileChange, RepositoryInfo
+
+from .github_client import GitHubClient
+from .http_cache import HttpCache
+from .rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class GitTransportClient(GitHubClient):
+    """Cliente que lee y escribe el contenido de los repos con git.
+
+    Cada repo destino se mantiene como un clon bare parcial en
+    `<mirror_dir>/<owner>/<repo>.git`. Solo se descargan commits y árboles;
+    los blobs se piden bajo demanda cuando hace falta comparar un archivo.
+    El clon se actualiza como máximo una vez por ejecución, y `prefetch`
+    permite actualizar lotes de repos en paralelo antes de procesarlos.
+
+    El token viaja en una cabecera HTTP pasada por variables de entorno, de
+    modo que nunca se escribe en la configuración de los clones.
+    """
+
+    REMOTE_URL = "https://github.com/{full_name}.git"
+    PARTIAL_CLONE_FILTER = "blob:none"
+    PREFETCH_BATCH_SIZE = 50
+    FETCH_JOBS = 8
+    GIT_TIMEOUT = 600
+    INDEX_FILE = "workflow-sync.index"
+    COMMITTER_NAME = "workflow-sync"
+    COMMITTER_EMAIL = "workflow-sync@users.noreply.github.com"
+
+    def __init__(
+        self,
+        token: str,
+        mirror_dir: str | Path,
+        timeout: int = 30,
+        cache: HttpCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        remote_url: str = REMOTE_URL,
+        fetch_jobs: int = FETCH_JOBS,
+    ) -> None:
+        """Inicializa el cliente.
+
+        Args:
+            token: Token de autenticación de GitHub.
+            mirror_dir: Directorio donde se guardan los clones parciales.
+            timeout: Timeout para llamadas API en segundos.
+            cache: Caché HTTP persistente para lecturas condicionales (opcional).
+            rate_limiter: Limitador compartido (se crea uno si no se indica).
+            remote_url: Plantilla de la URL git de cada repo ({full_name});
+                permite usar repos bare locales (file://) en lugar de GitHub.
+            fetch_jobs: Clones o fetches simultáneos en `prefetch`.
+        """
+        super().__init__(token, timeout=timeout, cache=cache, rate_limiter=rate_limiter)
+        self._mirror_dir = Path(mirror_dir)
+        self._mirror_dir.mkdir(parents=True, exist_ok=True)
+        self._remote_url = remote_url
+        self._fetch_jobs = fetch_jobs
+        self._env = self._build_env(token)
+        # Repos actualizados en esta ejecución y lock por repo
+        self._fresh: set[str] = set()
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def prefetch(self, repos: Iterable[RepositoryInfo]) -> None:
+        """Clona o actualiza en paralelo los clones de un lote de repos.
+
+        Los errores solo se registran: el repo se reintenta (y el error se
+        reporta) cuando se procesa.
+        """
+        pending = [r for r in repos if not r.archived and r.full_name not in self._fresh]
+        if not pending:
+            return
+
+        def fetch(repo: RepositoryInfo) -> None:
+            try:
+                self._ensure_mirror(repo)
+            except RepositoryAccessError as e:
+                logger.debug("Prefetch fallido para %s: %s", repo.full_name, e)
+
+        with ThreadPoolExecutor(
+            max_workers=self._fetch_jobs, thread_name_prefix="git-fetch"
+        ) as executor:
+            list(executor.map(fetch, pending))
+        logger.debug("Prefetch de %d repo(s) completado", len(pending))
+
+    def get_file_content(self, repo: RepositoryInfo, path: str) -> tuple[str, str] | None:
+        """Obtiene (contenido, SHA) de un archivo de la rama por defecto."""
+        mirror = self._ensure_mirror(repo)
+        sha = self._rev_parse(mirror, f"refs/heads/{repo.default_branch}:{path}")
+        if sha is None:
+            return None
+
+        # En un clon parcial git descarga el blob bajo demanda
+        content = self._run(mirror, "cat-file", "blob", sha)
+        return content.decode("utf-8"), sha
+
+    def get_workflow_tree(
+        self, repo: RepositoryInfo, path: str, ref: str | None = None
+    ) -> dict[str, str] | None:
+        """Obtiene {nombre: SHA del blob} de los workflows desde el clon local.
+
+        Solo lee árboles, que el clon parcial ya tiene: no descarga blobs.
+        Otras ramas (`ref`) se traen al clon bajo demanda, también sin blobs.
+        """
+        mirror = self._ensure_mirror(repo)
+        branch = ref or repo.default_branch
+        if branch != repo.default_branch:
+            with self._lock_for(repo):
+                self._fetch(repo, mirror, branch)
+
+        tree = self._rev_parse(mirror, f"refs/heads/{branch}:{path.strip('/')}")
+        if tree is None or self._git(mirror, "cat-file", "-t", tree) != "tree":
+            return None
+
+        workflows: dict[str, str] = {}
+        for entry in self._run(mirror, "ls-tree", "-z", tree).decode("utf-8").split("\0"):
+            if not entry:
+                continue
+            info, _, name = entry.partition("\t")
+            _, kind, sha = info.split()
+            if kind == "blob" and name.endswith((".yml", ".yaml")):
+                workflows[name] = sha
+        return workflows
+
+    def has_workflows_folder(self, repo: RepositoryInfo, path: str) -> bool:
+        """Verifica si el repositorio tiene la carpeta de workflows."""
+        return self.get_workflow_tree(repo, path) is not None
+
+    def get_base_sha(self, repo: RepositoryInfo, branch: str) -> str:
+        """Obtiene el SHA del HEAD de una rama.
+
+        Si el clon ya se actualizó en esta ejecución se lee localmente; si
+        no, se consulta el remoto con `git ls-remote` sin descargar nada.
+        """
+        if branch == repo.default_branch and repo.full_name in self._fresh:
+            sha = self._rev_parse(self._mirror_path(repo), f"refs/heads/{branch}")
+            if sha:
+                return sha
+
+        sha = self._ls_remote(repo, branch)
+        if sha is None:
+            raise RepositoryAccessError(f"La rama {branch} no existe en {repo.full_name}")
+        return sha
+
+    def branch_exists(self, repo: RepositoryInfo, branch_name: str) -> bool:
+        """Verifica si una rama existe en el remoto."""
+        return self._ls_remote(repo, branch_name) is not None
+
+    def commit_changes(
+        self,
+        repo: RepositoryInfo,
+        base_sha: str,
+        changes: list[FileChange],
+        message: str,
+        path: str,
+    ) -> str:
+        """Crea un único commit local con todos los cambios y retorna su SHA.
+
+        El árbol se construye con un índice temporal sobre el árbol base; el
+        commit se publica cuando se crea la rama (create_branch).
+        """
+        mirror = self._ensure_mirror(repo)
+
+        with self._lock_for(repo):
+            if self._rev_parse(mirror, f"{base_sha}^{{commit}}") is None:
+                # El HEAD avanzó después de actualizar el clon
+                self._fetch(repo, mirror)
+
+            entries = []
+            for change in changes:
+                file_path = f"{path}/{change.filename}"
+                if change.is_deletion:
+                    entries.append(f"0 {'0' * 40}\t{file_path}")
+                else:
+                    blob = self._git(
+                        mirror,
+                        "hash-object",
+                        "-w",
+                        "--stdin",
+                        input=change.content.encode("utf-8"),
+                    )
+                    entries.append(f"100644 {blob}\t{file_path}")
+
+            # Índice temporal: el clon es bare y el lock del repo lo protege
+            index_path = mirror / self.INDEX_FILE
+            env = {"GIT_INDEX_FILE": str(index_path)}
+            try:
+                self._git(mirror, "read-tree", base_sha, env=env)
+                self._git(
+                    mirror,
+                    "update-index",
+                    "--index-info",
+                    input="".join(f"{e}\n" for e in entries).encode("utf-8"),
+                    env=env,
+                )
+                # --missing-ok: el clon no tiene los blobs que no cambian
+                tree = self._git(mirror, "write-tree", "--missing-ok", env=env)
+            finally:
+                index_path.unlink(missing_ok=True)
+
+            commit = self._git(
+                mirror,
+                "commit-tree",
+                tree,
+                "-p",
+                base_sha,
+                "-F",
+                "-",
+                input=message.encode("utf-8"),
+            )
+
+        logger.debug(
+            "Commit %s creado en %s con %d cambio(s)",
+            commit[:7],
+            repo.name,
+            len(changes),
+        )
+        return commit
+
+    def create_branch(self, repo: RepositoryInfo, branch_name: str, base_sha: str) -> None:
+        """Crea la rama en el remoto con un único push del commit."""
+        mirror = self._ensure_mirror(repo)
+        with self._lock_for(repo):
+            try:
+                # Lease vacío: el push solo se acepta si la rama no existe
+                self._git(
+                    mirror,
+                    "push",
+                    "--quiet",
+                    f"--force-with-lease=refs/heads/{branch_name}:",
+                    "origin",
+                    f"{base_sha}:refs/heads/{branch_name}",
+                )
+            except RepositoryAccessError as e:
+                if "stale info" in str(e):
+                    raise BranchExistsError(
+                        f"La rama {branch_name} ya existe en {repo.full_name}"
+                    ) from e
+                raise
+        logger.debug("Branch %s publicado en %s", branch_name, repo.name)
+
+    def reset_branch(self, repo: RepositoryInfo, branch_name: str, sha: str) -> None:
+        """Reescribe la rama en el remoto con un force push del commit."""
+        mirror = self._ensure_mirror(repo)
+        with self._lock_for(repo):
+            self._git(
+                mirror,
+                "push",
+                "--quiet",
+                "--force",
+                "origin",
+                f"{sha}:refs/heads/{branch_name}",
+            )
+        logger.debug("Branch %s reescrito en %s", branch_name, repo.name)
+
+    def delete_branch(self, repo: RepositoryInfo, branch_name: str) -> bool:
+        """Elimina una rama del remoto. Retorna True si se eliminó."""
+        try:
+            mirror = self._ensure_mirror(repo)
+            with self._lock_for(repo):
+                self._git(mirror, "push", "--quiet", "origin", f":refs/heads/{branch_name}")
+            logger.info("Branch eliminado: %s en %s", branch_name, repo.name)
+            return True
+        except RepositoryAccessError as e:
+            logger.warning(
+                "No se pudo eliminar branch %s en %s: %s",
+                branch_name,
+                repo.name,
+                str(e),
+            )
+            return False
+
+    def _ensure_mirror(self, repo: RepositoryInfo) -> Path:
+        """Clona o actualiza (una vez por ejecución) el clon parcial del repo."""
+        mirror = self._mirror_path(repo)
+        with self._lock_for(repo):
+            if repo.full_name in self._fresh:
+                return mirror
+
+            if (mirror / "HEAD").exists():
+                self._fetch(repo, mirror)
+            else:
+                mirror.parent.mkdir(parents=True, exist_ok=True)
+                self._git(
+                    mirror.parent,
+                    "clone",
+                    "--bare",
+                    "--quiet",
+                    f"--filter={self.PARTIAL_CLONE_FILTER}",
+                    "--no-tags",
+                    "--single-branch",
+                    "--branch",
+                    repo.default_branch,
+                    self._url(repo),
+                    mirror.name,
+                )
+                logger.debug("Clon parcial creado para %s", repo.full_name)
+
+            self._fresh.add(repo.full_name)
+        return mirror
+
+    def _fetch(self, repo: RepositoryInfo, mirror: Path, branch: str | None = None) -> None:
+        """Actualiza una rama del clon (por defecto, la rama por defecto) sin blobs."""
+        branch = branch or repo.default_branch
+        self._git(
+            mirror,
+            "fetch",
+            "--quiet",
+            f"--filter={self.PARTIAL_CLONE_FILTER}",
+            "--no-tags",
+            "origin",
+            f"+refs/heads/{branch}:refs/heads/{branch}",
+        )
+
+    def _ls_remote(self, repo: RepositoryInfo, branch: str) -> str | None:
+        """SHA de una rama en el remoto (None si no existe)."""
+        output = self._git(
+            self._mirror_dir, "ls-remote", self._url(repo), f"refs/heads/{branch}"
+        )
+        for line in output.splitlines():
+            sha, _, ref = line.partition("\t")
+            if ref == f"refs/heads/{branch}":
+                return sha
+        return None
+
+    def _rev_parse(self, mirror: Path, revision: str) -> str | None:
+        """Resuelve una revisión en el clon (None si no existe)."""
+        result = subprocess.run(
+            ["git", "rev-parse", "--verify", "--quiet", revision],
+            cwd=mirror,
+            env=self._env,
+            capture_output=True,
+        )
+        if result.returncode != 0:
+            return None
+        return result.stdout.decode("utf-8").strip()
+
+    def _git(
+        self,
+        cwd: Path,
+        *args: str,
+        input: bytes | None = None,
+        env: dict[str, str] | None = None,
+    ) -> str:
+        """Ejecuta un comando git y retorna su salida como texto."""
+        return self._run(cwd, *args, input=input, env=env).decode("utf-8").strip()
+
+    def _run(
+        self,
+        cwd: Path,
+        *args: str,
+        input: bytes | None = None,
+        env: dict[str, str] | None = None,
+    ) -> bytes:
+        """Ejecuta un comando git y retorna su salida.
+
+        Raises:
+            RepositoryAccessError: Si el comando falla.
+        """
+        try:
+            result = subprocess.run(
+                ["git", *args],
+                cwd=cwd,
+                env={**self._env, **env} if env else self._env,
+                input=input,
+                capture_output=True,
+                timeout=self.GIT_TIMEOUT,
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            raise RepositoryAccessError(f"git {args[0]} falló: {e}") from e
+
+        if result.returncode != 0:
+            stderr = result.stderr.decode("utf-8", errors="replace").strip()
+            raise RepositoryAccessError(f"git {args[0]} falló: {stderr}")
+        return result.stdout
+
+    def _mirror_path(self, repo: RepositoryInfo) -> Path:
+        """Ruta del clon parcial de un repo."""
+        owner, _, name = repo.full_name.partition("/")
+        return self._mirror_dir / owner / f"{name}.git"
+
+    def _url(self, repo: RepositoryInfo) -> str:
+        """URL git del repo."""
+        return self._remote_url.format(full_name=repo.full_name)
+
+    def _lock_for(self, repo: RepositoryInfo) -> threading.Lock:
+        """Lock que serializa las operaciones git sobre el clon de un repo."""
+        with self._locks_guard:
+            return self._locks.setdefault(repo.full_name, threading.Lock())
+
+    def _build_env(self, token: str) -> dict[str, str]:
+        """Entorno de git: credenciales por cabecera e identidad del commit.
+
+        La cabecera se limita al host de `remote_url` (GitHub, GHES...); los
+        remotos locales (file://) no llevan credenciales.
+        """
+        env = {
+            **os.environ,
+            "GIT_TERMINAL_PROMPT": "0",
+            "GIT_AUTHOR_NAME": self.COMMITTER_NAME,
+            "GIT_AUTHOR_EMAIL": self.COMMITTER_EMAIL,
+            "GIT_COMMITTER_NAME": self.COMMITTER_NAME,
+            "GIT_COMMITTER_EMAIL": self.COMMITTER_EMAIL,
+        }
+        remote = urlsplit(self._remote_url)
+        if remote.scheme in ("http", "https") and remote.netloc:
+            credentials = base64.b64encode(f"x-access-token:{token}".encode()).decode()
+            env.update(
+                {
+                    "GIT_CONFIG_COUNT": "1",
+                    "GIT_CONFIG_KEY_0": f"http.{remote.scheme}://{remote.netloc}/.extraheader",
+                    "GIT_CONFIG_VALUE_0": f"Authorization: Basic {credentials}",
+                }
+            )
+        return env
@@ -12,12 +12,15 @@ Principio SOLID: Single Responsibility
 from __future__ import annotations
 
 import base64
+import hashlib
+import json
 import logging
 import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+from typing import Any, Callable, Iterable, Iterator
+from urllib.parse import quote
 
+import requests
 from github import Github, GithubException, RateLimitExceededException
 
 import sys
@@ -26,14 +29,24 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from exceptions import (
     AuthenticationError,
+    BranchExistsError,
     RateLimitError,
     RepositoryAccessError,
     SourceRepoError,
 )
-from models import FileChange, RepositoryInfo
+from models import (
+    ApiCallEvent,
+    ApiCallOutcome,
+    BranchRef,
+    FileChange,
+    MergeState,
+    PullRequestStatus,
+    RepoPrecheck,
+    RepositoryInfo,
+)
 
-if TYPE_CHECKING:
-    from github.Repository import Repository
+from .http_cache import HttpCache
+from .rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -49,41 +62,81 @@ class IGitHubClient(ABC):
     """
 
     @abstractmethod
-    def get_repository(self, full_name: str) -> Repository:
+    def get_repository(self, full_name: str) -> RepositoryInfo:
         """Obtiene un repositorio por nombre completo."""
         pass
 
     @abstractmethod
     def search_repositories_by_topic(
         self, org: str, topic: str
-    ) -> list[RepositoryInfo]:
-        """Busca repositorios por topic en una organización."""
+    ) -> Iterator[RepositoryInfo]:
+        """Busca repositorios por topic, entregándolos a medida que llega cada página."""
+        pass
+
+    @abstractmethod
+    def list_org_repositories_by_topic(
+        self, org: str, topic: str
+    ) -> Iterator[RepositoryInfo]:
+        """Recorre todos los repos de la organización y filtra el topic localmente."""
         pass
 
     @abstractmethod
-    def get_file_content(self, repo: Repository, path: str) -> tuple[str, str] | None:
+    def get_file_content(self, repo: RepositoryInfo, path: str) -> tuple[str, str] | None:
         """Obtiene contenido y SHA de un archivo. Retorna None si no existe."""
         pass
 
     @abstractmethod
-    def get_workflow_files(self, repo: Repository, path: str) -> dict[str, str]:
+    def get_workflow_files(self, repo: RepositoryInfo, path: str) -> dict[str, str]:
         """Obtiene todos los archivos de workflow de un repositorio."""
         pass
 
     @abstractmethod
-    def create_branch(self, repo: Repository, branch_name: str, base_sha: str) -> None:
-        """Crea una nueva rama."""
+    def resolve_commit_sha(self, repo: RepositoryInfo, ref: str) -> str:
+        """Resuelve un ref (branch, tag o SHA) al SHA de su commit."""
+        pass
+
+    @abstractmethod
+    def get_archive(self, repo: RepositoryInfo, ref: str) -> Iterator[bytes]:
+        """Descarga en streaming el tarball (tar.gz) del repo en `ref`."""
+        pass
+
+    @abstractmethod
+    def compare_commits(
+        self, repo: RepositoryInfo, base: str, head: str
+    ) -> list[str] | None:
+        """Archivos cambiados entre dos commits (None si la lista está truncada)."""
+        pass
+
+    @abstractmethod
+    def create_branch(self, repo: RepositoryInfo, branch_name: str, base_sha: str) -> None:
+        """Crea una nueva rama.
+
+        Raises:
+            BranchExistsError: Si la rama ya existe.
+        """
+        pass
+
+    @abstractmethod
+    def delete_branch(self, repo: RepositoryInfo, branch_name: str) -> bool:
+        """Elimina una rama. Retorna True si se eliminó."""
         pass
 
     @abstractmethod
-    def delete_branch(self, repo: Repository, branch_name: str) -> None:
-        """Elimina una rama."""
+    def get_branches_with_prefix(
+        self, repos: list[RepositoryInfo], branch_prefix: str
+    ) -> list[BranchRef]:
+        """Lista en lote las ramas de varios repos que empiezan con el prefijo."""
+        pass
+
+    @abstractmethod
+    def reset_branch(self, repo: RepositoryInfo, branch_name: str, sha: str) -> None:
+        """Apunta una rama existente a otro commit (reescribe su historia)."""
         pass
 
     @abstractmethod
     def create_or_update_file(
         self,
-        repo: Repository,
+        repo: RepositoryInfo,
         path: str,
         content: str,
         message: str,
@@ -93,10 +146,26 @@ class IGitHubClient(ABC):
         """Crea o actualiza un archivo."""
         pass
 
+    @abstractmethod
+    def commit_changes(
+        self,
+        repo: RepositoryInfo,
+        base_sha: str,
+        changes: list[FileChange],
+        message: str,
+        path: str,
+    ) -> str:
+        """Crea un único commit con todos los cambios y retorna su SHA.
+
+        El commit no queda referenciado por ninguna rama; el llamador debe
+        apuntar una rama a él (ej: con create_branch).
+        """
+        pass
+
     @abstractmethod
     def create_pull_request(
         self,
-        repo: Repository,
+        repo: RepositoryInfo,
         title: str,
         body: str,
         head: str,
@@ -105,32 +174,70 @@ class IGitHubClient(ABC):
         """Crea un PR y retorna (URL, número del PR)."""
         pass
 
+    @abstractmethod
+    def update_pull_request(self, repo: RepositoryInfo, pr_number: int, body: str) -> None:
+        """Reemplaza la descripción de un PR."""
+        pass
+
     @abstractmethod
     def get_open_prs_with_prefix(
-        self, repo: Repository, branch_prefix: str
-    ) -> list[str]:
-        """Obtiene URLs de PRs abiertos cuyo branch empieza con el prefijo."""
+        self, repo: RepositoryInfo, branch_prefix: str
+    ) -> dict[str, str]:
+        """Obtiene {branch: URL} de PRs abiertos cuyo branch empieza con el prefijo."""
+        pass
+
+    @abstractmethod
+    def get_org_open_prs_with_prefix(
+        self, org: str, branch_prefix: str
+    ) -> dict[str, dict[str, str]] | None:
+        """Obtiene los PRs abiertos de toda la org cuyo branch empieza con el prefijo.
+
+        Retorna {full_name: {branch: URL}}, o None si el resultado no es
+        completo y hay que consultar repo a repo.
+        """
         pass
 
     @abstractmethod
     def check_rate_limit(self, is_search: bool = False) -> None:
-        """Verifica y maneja el rate limit."""
+        """Espera si el presupuesto de rate limit está agotado."""
         pass
 
     @abstractmethod
-    def has_workflows_folder(self, repo: Repository, path: str) -> bool:
+    def has_workflows_folder(self, repo: RepositoryInfo, path: str) -> bool:
         """Verifica si el repositorio tiene la carpeta de workflows."""
         pass
 
     @abstractmethod
-    def get_workflow_filenames(self, repo: Repository, path: str) -> list[str]:
+    def get_workflow_filenames(self, repo: RepositoryInfo, path: str) -> list[str]:
         """Obtiene la lista de nombres de archivos workflow en el repositorio."""
         pass
 
+    @abstractmethod
+    def get_workflow_tree(
+        self, repo: RepositoryInfo, path: str, ref: str | None = None
+    ) -> dict[str, str] | None:
+        """Obtiene {nombre: SHA del blob} de los workflows con un único listado.
+
+        Lee la rama `ref` (None = rama por defecto). Retorna None si la
+        carpeta no existe.
+        """
+        pass
+
+    @abstractmethod
+    def get_repo_prechecks(
+        self, repos: list[RepositoryInfo], path: str, branch_prefix: str
+    ) -> dict[str, RepoPrecheck]:
+        """Obtiene en lote HEAD, workflows y PRs de sync abiertos de varios repos.
+
+        Retorna {full_name: RepoPrecheck}; los repos ausentes del resultado
+        deben verificarse con las llamadas individuales.
+        """
+        pass
+
     @abstractmethod
     def delete_file(
         self,
-        repo: Repository,
+        repo: RepositoryInfo,
         path: str,
         message: str,
         branch: str,
@@ -142,29 +249,86 @@ class IGitHubClient(ABC):
     @abstractmethod
     def merge_pull_request(
         self,
-        repo: Repository,
+        repo: RepositoryInfo,
         pr_number: int,
         merge_method: str = "squash",
     ) -> bool:
         """Mergea un PR. Retorna True si tuvo éxito."""
         pass
 
+    @abstractmethod
+    def enable_auto_merge(
+        self,
+        repo: RepositoryInfo,
+        pr_number: int,
+        merge_method: str = "squash",
+    ) -> bool:
+        """Activa el auto-merge nativo de GitHub en un PR.
+
+        Retorna False si el repo no lo permite o el PR no lo admite.
+        """
+        pass
+
+    @abstractmethod
+    def get_merge_state(self, repo: RepositoryInfo, pr_number: int) -> MergeState:
+        """Obtiene el estado de merge de un PR."""
+        pass
+
+    @abstractmethod
+    def get_pull_request_statuses(
+        self, pulls: list[tuple[RepositoryInfo, int]]
+    ) -> dict[tuple[str, int], PullRequestStatus]:
+        """Obtiene en lote el estado de checks, merge y revisiones de varios PRs.
+
+        Retorna {(full_name, número): PullRequestStatus} de los PRs encontrados.
+        """
+        pass
+
     @abstractmethod
     def update_branch(
         self,
-        repo: Repository,
+        repo: RepositoryInfo,
         pr_number: int,
     ) -> bool:
         """Actualiza el branch del PR con los cambios de base. Retorna True si tuvo éxito."""
         pass
 
+    @abstractmethod
+    def get_base_sha(self, repo: RepositoryInfo, branch: str) -> str:
+        """Obtiene el SHA del HEAD de una rama."""
+        pass
+
+    @abstractmethod
+    def branch_exists(self, repo: RepositoryInfo, branch_name: str) -> bool:
+        """Verifica si una rama existe."""
+        pass
+
+    # Repos por lote que conviene preparar con prefetch (0 = no aplica)
+    PREFETCH_BATCH_SIZE = 0
+
+    def prefetch(self, repos: Iterable[RepositoryInfo]) -> None:
+        """Prepara por adelantado el acceso a un lote de repos (opcional)."""
+        pass
+
+    def add_call_listener(self, listener: Callable[[ApiCallEvent], None]) -> None:
+        """Registra un observador de cada intento de llamada a la API."""
+        pass
+
+    def remove_call_listener(self, listener: Callable[[ApiCallEvent], None]) -> None:
+        """Elimina un observador registrado con add_call_listener."""
+        pass
+
+    def close(self) -> None:
+        """Libera los recursos del cliente (conexiones, hilos)."""
+        pass
+
 
 class GitHubClient(IGitHubClient):
     """Implementación concreta del cliente de GitHub.
 
     Incluye:
     - Reintentos con backoff exponencial
-    - Manejo de rate limiting
+    - Rate limiting compartido entre hilos a partir de las cabeceras
     - Logging estructurado
     """
 
@@ -173,26 +337,88 @@ class GitHubClient(IGitHubClient):
     RETRY_DELAY_BASE = 2
     RATE_LIMIT_THRESHOLD = 50
     SEARCH_RATE_LIMIT_THRESHOLD = 5
-    MAX_RATE_LIMIT_WAIT = 300
-
-    def __init__(self, token: str, timeout: int = 30) -> None:
+    SECONDARY_RATE_LIMIT_WAIT = 60
+    PAGE_SIZE = 100
+    # PRs abiertos que se revisan por repo en la pre-verificación en lote
+    PRECHECK_PR_LIMIT = 100
+    # PRs por consulta en el sondeo de estado en lote
+    STATUS_BATCH_SIZE = 50
+    PULL_STATUS_FIELDS = (
+        "number url state merged isDraft mergeable mergeStateStatus reviewDecision "
+        "baseRef { branchProtectionRule { requiresStatusChecks } } "
+        "commits(last: 1) { nodes { commit { statusCheckRollup { state } } } }"
+    )
+    # Repos por consulta GraphQL al listar ramas
+    BRANCH_BATCH_SIZE = 50
+    # Archivos máximos que devuelve una comparación de commits
+    COMPARE_FILES_LIMIT = 300
+    # Resultados máximos que devuelve una búsqueda (REST o GraphQL)
+    SEARCH_MAX_RESULTS = 1000
+    # Conexiones keep-alive; debe cubrir la concurrencia máxima de las estrategias
+    POOL_SIZE = 64
+    STREAM_CHUNK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        token: str,
+        timeout: int = 30,
+        cache: HttpCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
         """Inicializa el cliente.
 
         Args:
             token: Token de autenticación de GitHub.
             timeout: Timeout para llamadas API en segundos.
+            cache: Caché HTTP persistente para lecturas condicionales (opcional).
+            rate_limiter: Limitador compartido (se crea uno si no se indica).
         """
-        self._github = Github(token, timeout=timeout, retry=3)
+        # El ritmo lo marca el limitador compartido: sin pausas fijas de PyGithub
+        self._github = Github(
+            token,
+            timeout=timeout,
+            retry=3,
+            pool_size=self.POOL_SIZE,
+            seconds_between_requests=None,
+            seconds_between_writes=None,
+        )
         self._timeout = timeout
+        self._cache = cache
+        self._rate_limiter = rate_limiter or RateLimiter(
+            reserves={
+                "core": self.RATE_LIMIT_THRESHOLD,
+                "search": self.SEARCH_RATE_LIMIT_THRESHOLD,
+            }
+        )
+        # Huella del token para las claves de caché (nunca el token en claro)
+        self._identity = hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+        self._call_listeners: list[Callable[[ApiCallEvent], None]] = []
+        self._pull_node_ids: dict[tuple[str, int], str | None] = {}
+
+    def add_call_listener(self, listener: Callable[[ApiCallEvent], None]) -> None:
+        """Registra un observador de cada intento de llamada a la API.
+
+        Los listeners se invocan desde el hilo que hizo la llamada y deben
+        ser rápidos y seguros entre hilos.
+        """
+        self._call_listeners.append(listener)
+
+    def remove_call_listener(self, listener: Callable[[ApiCallEvent], None]) -> None:
+        """Elimina un observador registrado con add_call_listener."""
+        if listener in self._call_listeners:
+            self._call_listeners.remove(listener)
 
-    def get_repository(self, full_name: str) -> Repository:
+    def get_repository(self, full_name: str) -> RepositoryInfo:
         """Obtiene un repositorio por nombre completo."""
         try:
-            return self._api_call_with_retry(
-                self._github.get_repo,
-                full_name,
+            data = self._api_call_with_retry(
+                self._request_json,
+                "GET",
+                f"/repos/{full_name}",
+                cacheable=True,
                 operation_name=f"get_repo({full_name})",
             )
+            return self._repository_info(data)
         except GithubException as e:
             if e.status == 404:
                 raise SourceRepoError(f"Repository not found: {full_name}") from e
@@ -204,109 +430,202 @@ class GitHubClient(IGitHubClient):
 
     def search_repositories_by_topic(
         self, org: str, topic: str
-    ) -> list[RepositoryInfo]:
-        """Busca repositorios por topic en una organización."""
-        repos = []
+    ) -> Iterator[RepositoryInfo]:
+        """Busca repositorios por topic, entregándolos a medida que llega cada página.
+
+        Los RepositoryInfo se construyen con el payload de la búsqueda, que ya
+        incluye rama por defecto, archivado y permisos: no hace falta pedir
+        cada repositorio por separado.
+        """
         try:
             query = f"org:{org} topic:{topic}"
-            search_results = self._api_call_with_retry(
-                self._github.search_repositories,
-                query=query,
+            search_results = self._request_paginated(
+                "/search/repositories",
+                {"q": query},
+                items_key="items",
                 operation_name="search_repositories",
             )
 
             for repo in search_results:
-                if repo.archived:
-                    logger.debug("Saltando repo archivado: %s", repo.name)
+                if repo.get("archived"):
+                    logger.debug("Saltando repo archivado: %s", repo["name"])
                     continue
 
-                has_push = True
-                try:
-                    if repo.permissions and not repo.permissions.push:
-                        logger.debug("Saltando repo sin permisos push: %s", repo.name)
-                        continue
-                except Exception:
-                    logger.debug(
-                        "No se pudieron verificar permisos para %s", repo.name
-                    )
-
-                repos.append(
-                    RepositoryInfo(
-                        name=repo.name,
-                        full_name=repo.full_name,
-                        default_branch=repo.default_branch or "main",
-                        archived=repo.archived,
-                        has_push_permission=has_push,
-                    )
-                )
+                info = self._repository_info(repo)
+                if not info.has_push_permission:
+                    logger.debug("Saltando repo sin permisos push: %s", info.name)
+                    continue
 
-            return repos
+                yield info
 
         except GithubException as e:
             logger.error("Error buscando repos: %s", self._extract_error(e))
-            return []
 
-    def get_file_content(self, repo: Repository, path: str) -> tuple[str, str] | None:
+    def list_org_repositories_by_topic(
+        self, org: str, topic: str
+    ) -> Iterator[RepositoryInfo]:
+        """Recorre todos los repos de la organización y filtra el topic localmente.
+
+        Alternativa a la Search API, que corta en 1.000 resultados y admite
+        unas 30 peticiones por minuto. Cada página trae 100 repos con rama
+        por defecto, archivado, permisos y topics, así que el coste es
+        predecible: ceil(repos / 100) peticiones core, y las páginas sin
+        cambios se resuelven con 304 si hay caché HTTP.
+        """
+        topic = topic.lower()
+        self._log_org_listing_estimate(org)
+
+        try:
+            listing = self._request_paginated(
+                f"/orgs/{quote(org, safe='')}/repos",
+                {"type": "all", "sort": "full_name"},
+                operation_name="list_org_repos",
+            )
+
+            for repo in listing:
+                if repo.get("archived") or repo.get("disabled"):
+                    continue
+
+                info = self._repository_info(repo)
+                if topic not in info.topics:
+                    continue
+
+                if not info.has_push_permission:
+                    logger.debug("Saltando repo sin permisos push: %s", info.name)
+                    continue
+
+                yield info
+
+        except GithubException as e:
+            logger.error("Error listando repos de %s: %s", org, self._extract_error(e))
+
+    def get_file_content(self, repo: RepositoryInfo, path: str) -> tuple[str, str] | None:
         """Obtiene contenido y SHA de un archivo."""
         try:
             content = self._api_call_with_retry(
-                repo.get_contents,
-                path,
+                self._request_json,
+                "GET",
+                self._contents_url(repo, path),
+                cacheable=True,
                 operation_name=f"get_contents({path})",
             )
             if isinstance(content, list):
                 return None
 
-            decoded = base64.b64decode(content.content).decode("utf-8")
-            return decoded, content.sha
+            decoded = base64.b64decode(content["content"]).decode("utf-8")
+            return decoded, content["sha"]
 
         except GithubException as e:
             if e.status == 404:
                 return None
             raise
 
-    def get_workflow_files(self, repo: Repository, path: str) -> dict[str, str]:
+    def get_workflow_files(self, repo: RepositoryInfo, path: str) -> dict[str, str]:
         """Obtiene todos los archivos de workflow de un repositorio."""
         workflows: dict[str, str] = {}
 
-        try:
-            contents = self._api_call_with_retry(
-                repo.get_contents,
-                path,
-                operation_name=f"get_contents({path})",
-            )
+        entries = self._list_directory(repo, path)
+        if entries is None:
+            raise SourceRepoError(f"Workflows path not found: {path}")
+
+        for entry in entries:
+            if entry["type"] == "file" and entry["name"].endswith((".yml", ".yaml")):
+                result = self.get_file_content(repo, entry["path"])
+                if result is not None:
+                    workflows[entry["name"]] = result[0]
+
+        return workflows
+
+    def resolve_commit_sha(self, repo: RepositoryInfo, ref: str) -> str:
+        """Resuelve un ref (branch, tag o SHA) al SHA de su commit."""
+        commit = self._api_call_with_retry(
+            self._request_json,
+            "GET",
+            f"/repos/{repo.full_name}/commits/{quote(ref, safe='')}",
+            cacheable=True,
+            operation_name=f"get_commit({ref})",
+        )
+        return commit["sha"]
 
-            if not isinstance(contents, list):
-                contents = [contents]
+    def get_archive(self, repo: RepositoryInfo, ref: str) -> Iterator[bytes]:
+        """Descarga en streaming el tarball (tar.gz) del repo en `ref`.
 
-            for content in contents:
-                if content.type == "file" and content.name.endswith((".yml", ".yaml")):
-                    file_content = base64.b64decode(content.content).decode("utf-8")
-                    workflows[content.name] = file_content
+        GitHub responde con un redirect a codeload; el cuerpo se entrega en
+        bloques a medida que llega, sin escribirlo en disco.
+        """
+        return self._api_call_with_retry(
+            self._request_stream,
+            f"/repos/{repo.full_name}/tarball/{quote(ref, safe='')}",
+            operation_name=f"get_tarball({ref[:12]})",
+        )
 
-            return workflows
+    def compare_commits(
+        self, repo: RepositoryInfo, base: str, head: str
+    ) -> list[str] | None:
+        """Archivos cambiados entre dos commits (incluye el nombre previo de los renombrados).
 
+        GitHub corta la lista en COMPARE_FILES_LIMIT archivos; en ese caso
+        retorna None porque no se puede saber qué más cambió.
+        """
+        comparison = self._api_call_with_retry(
+            self._request_json,
+            "GET",
+            f"/repos/{repo.full_name}/compare/"
+            f"{quote(base, safe='')}...{quote(head, safe='')}",
+            cacheable=True,
+            operation_name=f"compare({base[:12]}...{head[:12]})",
+        )
+        files = comparison.get("files") or []
+        if len(files) >= self.COMPARE_FILES_LIMIT:
+            return None
+
+        changed = []
+        for entry in files:
+            changed.append(entry["filename"])
+            if entry.get("previous_filename"):
+                changed.append(entry["previous_filename"])
+        return changed
+
+    def create_branch(self, repo: RepositoryInfo, branch_name: str, base_sha: str) -> None:
+        """Crea una nueva rama."""
+        try:
+            self._api_call_with_retry(
+                self._request_json,
+                "POST",
+                f"/repos/{repo.full_name}/git/refs",
+                input={"ref": f"refs/heads/{branch_name}", "sha": base_sha},
+                operation_name=f"create_branch({branch_name})",
+            )
         except GithubException as e:
-            if e.status == 404:
-                raise SourceRepoError(f"Workflows path not found: {path}") from e
+            if e.status == 422 and "already exists" in self._extract_error(e):
+                raise BranchExistsError(
+                    f"La rama {branch_name} ya existe en {repo.full_name}"
+                ) from e
             raise
+        logger.debug("Branch %s creado en %s", branch_name, repo.name)
 
-    def create_branch(self, repo: Repository, branch_name: str, base_sha: str) -> None:
-        """Crea una nueva rama."""
+    def reset_branch(self, repo: RepositoryInfo, branch_name: str, sha: str) -> None:
+        """Apunta una rama existente a otro commit (force push)."""
         self._api_call_with_retry(
-            repo.create_git_ref,
-            ref=f"refs/heads/{branch_name}",
-            sha=base_sha,
-            operation_name=f"create_branch({branch_name})",
+            self._request_json,
+            "PATCH",
+            f"/repos/{repo.full_name}/git/refs/heads/{quote(branch_name)}",
+            input={"sha": sha, "force": True},
+            operation_name=f"reset_branch({branch_name})",
         )
-        logger.debug("Branch %s creado en %s", branch_name, repo.name)
+        logger.debug("Branch %s reescrito en %s", branch_name, repo.name)
 
-    def delete_branch(self, repo: Repository, branch_name: str) -> None:
-        """Elimina una rama."""
+    def delete_branch(self, repo: RepositoryInfo, branch_name: str) -> bool:
+        """Elimina una rama. Retorna True si se eliminó."""
         try:
-            ref = repo.get_git_ref(f"heads/{branch_name}")
-            ref.delete()
+            self._api_call_with_retry(
+                self._request_json,
+                "DELETE",
+                f"/repos/{repo.full_name}/git/refs/heads/{quote(branch_name)}",
+                operation_name=f"delete_branch({branch_name})",
+            )
             logger.info("Branch eliminado: %s en %s", branch_name, repo.name)
+            return True
         except GithubException as e:
             logger.warning(
                 "No se pudo eliminar branch %s en %s: %s",
@@ -314,10 +633,85 @@ class GitHubClient(IGitHubClient):
                 repo.name,
                 str(e),
             )
+            return False
+
+    def get_branches_with_prefix(
+        self, repos: list[RepositoryInfo], branch_prefix: str
+    ) -> list[BranchRef]:
+        """Lista en lote las ramas de varios repos que empiezan con el prefijo.
+
+        Cada consulta GraphQL cubre BRANCH_BATCH_SIZE repos con un alias por
+        repo e indica, para cada rama, si algún PR abierto la usa como head.
+        Los repos con más de 100 ramas coincidentes se vuelven a consultar
+        con su cursor hasta completarlas.
+        """
+        branches: list[BranchRef] = []
+        for start in range(0, len(repos), self.BRANCH_BATCH_SIZE):
+            # {full_name: cursor} de los repos con ramas por listar
+            pending: dict[str, str | None] = {
+                repo.full_name: None for repo in repos[start : start + self.BRANCH_BATCH_SIZE]
+            }
+            while pending:
+                pending = self._list_branch_page(pending, branch_prefix, branches)
+        return branches
+
+    def _list_branch_page(
+        self,
+        cursors: dict[str, str | None],
+        branch_prefix: str,
+        branches: list[BranchRef],
+    ) -> dict[str, str | None]:
+        """Lista una página de ramas de cada repo y retorna los cursores pendientes."""
+        declarations = ["$q: String!"]
+        fields = []
+        variables: dict[str, Any] = {"q": branch_prefix}
+        names = list(cursors)
+        for i, full_name in enumerate(names):
+            owner, _, name = full_name.partition("/")
+            variables.update({f"o{i}": owner, f"n{i}": name, f"a{i}": cursors[full_name]})
+            declarations.append(f"$o{i}: String!, $n{i}: String!, $a{i}: String")
+            fields.append(
+                f"r{i}: repository(owner: $o{i}, name: $n{i}) {{ "
+                f'refs(refPrefix: "refs/heads/", query: $q, first: 100, after: $a{i}) {{ '
+                "pageInfo { hasNextPage endCursor } "
+                "nodes { name target { oid } "
+                "associatedPullRequests(states: OPEN) { totalCount } } } }"
+            )
+
+        query = f"query({', '.join(declarations)}) {{\n" + "\n".join(fields) + "\n}"
+        response = self._api_call_with_retry(
+            self._request_json,
+            "POST",
+            "/graphql",
+            input={"query": query, "variables": variables},
+            operation_name=f"graphql_branches({len(names)})",
+        )
+
+        data = (response or {}).get("data") or {}
+        pending: dict[str, str | None] = {}
+        for i, full_name in enumerate(names):
+            refs = (data.get(f"r{i}") or {}).get("refs")
+            if refs is None:
+                logger.debug("No se pudieron listar las ramas de %s", full_name)
+                continue
+            for node in refs["nodes"]:
+                # `query` filtra por subcadena: el prefijo se confirma localmente
+                if node["name"].startswith(branch_prefix):
+                    branches.append(
+                        BranchRef(
+                            repo=full_name,
+                            name=node["name"],
+                            sha=node["target"]["oid"],
+                            has_open_pr=node["associatedPullRequests"]["totalCount"] > 0,
+                        )
+                    )
+            if refs["pageInfo"]["hasNextPage"]:
+                pending[full_name] = refs["pageInfo"]["endCursor"]
+        return pending
 
     def create_or_update_file(
         self,
-        repo: Repository,
+        repo: RepositoryInfo,
         path: str,
         content: str,
         message: str,
@@ -325,29 +719,85 @@ class GitHubClient(IGitHubClient):
         sha: str | None = None,
     ) -> None:
         """Crea o actualiza un archivo."""
+        payload = {
+            "message": message,
+            "content": base64.b64encode(content.encode("utf-8")).decode("ascii"),
+            "branch": branch,
+        }
         if sha:
-            self._api_call_with_retry(
-                repo.update_file,
-                path=path,
-                message=message,
-                content=content,
-                sha=sha,
-                branch=branch,
-                operation_name=f"update_file({path})",
-            )
-        else:
-            self._api_call_with_retry(
-                repo.create_file,
-                path=path,
-                message=message,
-                content=content,
-                branch=branch,
-                operation_name=f"create_file({path})",
-            )
+            payload["sha"] = sha
+
+        self._api_call_with_retry(
+            self._request_json,
+            "PUT",
+            self._contents_url(repo, path),
+            input=payload,
+            operation_name=f"{'update' if sha else 'create'}_file({path})",
+        )
+
+    def commit_changes(
+        self,
+        repo: RepositoryInfo,
+        base_sha: str,
+        changes: list[FileChange],
+        message: str,
+        path: str,
+    ) -> str:
+        """Crea un único commit con todos los cambios y retorna su SHA.
+
+        Usa la Git Data API: un árbol con todas las altas, modificaciones y
+        bajas sobre el árbol base, y un commit sobre él. El número de
+        escrituras es constante (árbol + commit) sin importar cuántos
+        archivos cambien.
+        """
+        # Los commits son inmutables: la lectura condicional siempre acierta
+        base_commit = self._api_call_with_retry(
+            self._request_json,
+            "GET",
+            f"/repos/{repo.full_name}/git/commits/{base_sha}",
+            cacheable=True,
+            operation_name=f"get_commit({base_sha[:7]})",
+        )
+
+        elements = []
+        for change in changes:
+            element = {
+                "path": f"{path}/{change.filename}",
+                "mode": "100644",
+                "type": "blob",
+            }
+            if change.is_deletion:
+                # sha=None elimina la entrada del árbol base
+                element["sha"] = None
+            else:
+                element["content"] = change.content
+            elements.append(element)
+
+        tree = self._api_call_with_retry(
+            self._request_json,
+            "POST",
+            f"/repos/{repo.full_name}/git/trees",
+            input={"base_tree": base_commit["tree"]["sha"], "tree": elements},
+            operation_name="create_tree",
+        )
+        commit = self._api_call_with_retry(
+            self._request_json,
+            "POST",
+            f"/repos/{repo.full_name}/git/commits",
+            input={"message": message, "tree": tree["sha"], "parents": [base_sha]},
+            operation_name="create_commit",
+        )
+        logger.debug(
+            "Commit %s creado en %s con %d cambio(s)",
+            commit["sha"][:7],
+            repo.name,
+            len(changes),
+        )
+        return commit["sha"]
 
     def create_pull_request(
         self,
-        repo: Repository,
+        repo: RepositoryInfo,
         title: str,
         body: str,
         head: str,
@@ -355,92 +805,130 @@ class GitHubClient(IGitHubClient):
     ) -> tuple[str, int]:
         """Crea un PR y retorna (URL, número del PR)."""
         pr = self._api_call_with_retry(
-            repo.create_pull,
-            title=title,
-            body=body,
-            head=head,
-            base=base,
+            self._request_json,
+            "POST",
+            f"/repos/{repo.full_name}/pulls",
+            input={"title": title, "body": body, "head": head, "base": base},
             operation_name="create_pull",
         )
-        return pr.html_url, pr.number
+        # El node_id permite activar el auto-merge sin volver a leer el PR
+        self._pull_node_ids[(repo.full_name, pr["number"])] = pr.get("node_id")
+        return pr["html_url"], pr["number"]
+
+    def update_pull_request(self, repo: RepositoryInfo, pr_number: int, body: str) -> None:
+        """Reemplaza la descripción de un PR."""
+        self._api_call_with_retry(
+            self._request_json,
+            "PATCH",
+            f"/repos/{repo.full_name}/pulls/{pr_number}",
+            input={"body": body},
+            operation_name=f"update_pull({pr_number})",
+        )
 
     def get_open_prs_with_prefix(
-        self, repo: Repository, branch_prefix: str
-    ) -> list[str]:
-        """Obtiene URLs de PRs abiertos cuyo branch empieza con el prefijo."""
-        urls = []
+        self, repo: RepositoryInfo, branch_prefix: str
+    ) -> dict[str, str]:
+        """Obtiene {branch: URL} de PRs abiertos cuyo branch empieza con el prefijo."""
+        prs: dict[str, str] = {}
         try:
-            pulls = repo.get_pulls(state="open")
+            pulls = self._request_paginated(
+                f"/repos/{repo.full_name}/pulls",
+                {"state": "open"},
+                operation_name="get_pulls",
+            )
             for pr in pulls:
-                if pr.head.ref.startswith(branch_prefix):
-                    urls.append(pr.html_url)
+                if pr["head"]["ref"].startswith(branch_prefix):
+                    prs[pr["head"]["ref"]] = pr["html_url"]
         except GithubException as e:
             logger.debug(
                 "No se pudieron verificar PRs existentes para %s: %s",
                 repo.name,
                 str(e),
             )
-        return urls
+        return prs
 
-    def check_rate_limit(self, is_search: bool = False) -> None:
-        """Verifica y maneja el rate limit."""
-        try:
-            rate_limit = self._github.get_rate_limit()
+    def get_org_open_prs_with_prefix(
+        self, org: str, branch_prefix: str
+    ) -> dict[str, dict[str, str]] | None:
+        """Obtiene los PRs abiertos de toda la org cuyo branch empieza con el prefijo.
 
-            # PyGithub >= 2.x usa rate.core, versiones anteriores usan core directamente
-            core_limit = getattr(rate_limit, "core", None) or getattr(rate_limit.rate, "core", rate_limit.rate)
-            search_limit = getattr(rate_limit, "search", None) or core_limit
+        Usa la búsqueda de GraphQL (`head:` filtra por prefijo del branch),
+        100 PRs por página, y confirma el prefijo localmente. La búsqueda
+        devuelve como máximo SEARCH_MAX_RESULTS resultados: si hay más, el
+        índice no es completo y se retorna None.
+        """
+        query = (
+            "query($q: String!, $after: String) { "
+            "search(query: $q, type: ISSUE, first: 100, after: $after) { "
+            "issueCount pageInfo { hasNextPage endCursor } "
+            "nodes { ... on PullRequest { headRefName url "
+            "repository { nameWithOwner } } } } }"
+        )
+        variables: dict[str, Any] = {
+            "q": f"org:{org} is:pr is:open head:{branch_prefix}",
+            "after": None,
+        }
+
+        index: dict[str, dict[str, str]] = {}
+        page = 1
+        while True:
+            response = self._api_call_with_retry(
+                self._request_json,
+                "POST",
+                "/graphql",
+                input={"query": query, "variables": variables},
+                operation_name=f"graphql_search_pulls[{page}]",
+            )
+            search = ((response or {}).get("data") or {}).get("search")
+            if search is None:
+                logger.debug("Búsqueda de PRs de sync sin datos: %s", response)
+                return None
+            if search["issueCount"] > self.SEARCH_MAX_RESULTS:
+                logger.info(
+                    "%d PRs de sync abiertos en %s: se verifican repo a repo",
+                    search["issueCount"],
+                    org,
+                )
+                return None
 
-            if is_search:
-                remaining = search_limit.remaining
-                reset_time = search_limit.reset
-                threshold = self.SEARCH_RATE_LIMIT_THRESHOLD
-                limit_type = "Search API"
-            else:
-                remaining = core_limit.remaining
-                reset_time = core_limit.reset
-                threshold = self.RATE_LIMIT_THRESHOLD
-                limit_type = "Core API"
+            for pr in search["nodes"]:
+                if pr and pr["headRefName"].startswith(branch_prefix):
+                    repo_prs = index.setdefault(pr["repository"]["nameWithOwner"], {})
+                    repo_prs[pr["headRefName"]] = pr["url"]
 
-            logger.debug(
-                "Rate limit check - %s: %d remaining, resets at %s",
-                limit_type,
-                remaining,
-                reset_time,
-            )
+            if not search["pageInfo"]["hasNextPage"]:
+                return index
+            variables["after"] = search["pageInfo"]["endCursor"]
+            page += 1
 
-            if remaining < threshold:
-                self._wait_for_rate_limit_reset(reset_time, remaining, limit_type)
+    def check_rate_limit(self, is_search: bool = False) -> None:
+        """Espera si el presupuesto de rate limit está agotado.
 
-        except GithubException as e:
-            logger.warning("No se pudo verificar rate limit: %s", str(e))
+        No consulta /rate_limit: el estado proviene de las cabeceras de las
+        respuestas anteriores.
+        """
+        self._rate_limiter.wait_if_exhausted("search" if is_search else "core")
 
-    def get_base_sha(self, repo: Repository, branch: str) -> str:
+    def get_base_sha(self, repo: RepositoryInfo, branch: str) -> str:
         """Obtiene el SHA del HEAD de una rama."""
         ref = self._api_call_with_retry(
-            repo.get_git_ref,
-            f"heads/{branch}",
+            self._request_json,
+            "GET",
+            self._ref_url(repo, branch),
+            cacheable=True,
             operation_name=f"get_ref({branch})",
         )
-        return ref.object.sha
+        return ref["object"]["sha"]
 
-    def branch_exists(self, repo: Repository, branch_name: str) -> bool:
+    def branch_exists(self, repo: RepositoryInfo, branch_name: str) -> bool:
         """Verifica si una rama existe."""
-        try:
-            repo.get_git_ref(f"heads/{branch_name}")
-            return True
-        except GithubException as e:
-            if e.status == 404:
-                return False
-            raise
-
-    def has_workflows_folder(self, repo: Repository, path: str) -> bool:
-        """Verifica si el repositorio tiene la carpeta de workflows."""
         try:
             self._api_call_with_retry(
-                repo.get_contents,
-                path,
-                operation_name=f"check_folder({path})",
+                self._request_json,
+                "GET",
+                self._ref_url(repo, branch_name),
+                cacheable=True,
+                operation_name=f"get_ref({branch_name})",
             )
             return True
         except GithubException as e:
@@ -448,33 +936,152 @@ class GitHubClient(IGitHubClient):
                 return False
             raise
 
-    def get_workflow_filenames(self, repo: Repository, path: str) -> list[str]:
+    def has_workflows_folder(self, repo: RepositoryInfo, path: str) -> bool:
+        """Verifica si el repositorio tiene la carpeta de workflows."""
+        return self._list_directory(repo, path) is not None
+
+    def get_workflow_filenames(self, repo: RepositoryInfo, path: str) -> list[str]:
         """Obtiene la lista de nombres de archivos workflow en el repositorio."""
-        filenames: list[str] = []
-        try:
-            contents = self._api_call_with_retry(
-                repo.get_contents,
-                path,
-                operation_name=f"list_workflows({path})",
+        tree = self.get_workflow_tree(repo, path)
+        return list(tree) if tree else []
+
+    def get_workflow_tree(
+        self, repo: RepositoryInfo, path: str, ref: str | None = None
+    ) -> dict[str, str] | None:
+        """Obtiene {nombre: SHA del blob} de los workflows con un único listado.
+
+        El listado de directorio ya incluye el SHA de cada blob, por lo que
+        no hace falta descargar ningún archivo para compararlo.
+        """
+        entries = self._list_directory(repo, path, ref)
+        if entries is None:
+            return None
+
+        return {
+            entry["name"]: entry["sha"]
+            for entry in entries
+            if entry["type"] == "file" and entry["name"].endswith((".yml", ".yaml"))
+        }
+
+    def get_repo_prechecks(
+        self, repos: list[RepositoryInfo], path: str, branch_prefix: str
+    ) -> dict[str, RepoPrecheck]:
+        """Obtiene en lote HEAD, workflows y PRs de sync abiertos de varios repos.
+
+        Una única consulta GraphQL con un alias por repo sustituye a las
+        llamadas REST individuales (ref, listado de la carpeta y PRs). Los
+        PRs se filtran por prefijo localmente entre los PRECHECK_PR_LIMIT
+        más recientes; si un repo tiene más, sus PRs quedan sin determinar.
+        """
+        if not repos:
+            return {}
+
+        declarations = []
+        fields = []
+        variables: dict[str, str] = {}
+        for i, repo in enumerate(repos):
+            owner, _, name = repo.full_name.partition("/")
+            variables.update(
+                {
+                    f"o{i}": owner,
+                    f"n{i}": name,
+                    f"e{i}": f"refs/heads/{repo.default_branch}:{path}",
+                }
+            )
+            declarations.append(f"$o{i}: String!, $n{i}: String!, $e{i}: String!")
+            fields.append(
+                f"r{i}: repository(owner: $o{i}, name: $n{i}) "
+                f"{{ {self._precheck_fields(i)} }}"
             )
 
-            if not isinstance(contents, list):
-                contents = [contents]
+        query = f"query({', '.join(declarations)}) {{\n" + "\n".join(fields) + "\n}"
+        response = self._api_call_with_retry(
+            self._request_json,
+            "POST",
+            "/graphql",
+            input={"query": query, "variables": variables},
+            operation_name=f"graphql_prechecks({len(repos)})",
+        )
 
-            for content in contents:
-                if content.type == "file" and content.name.endswith((".yml", ".yaml")):
-                    filenames.append(content.name)
+        data = (response or {}).get("data") or {}
+        if response and response.get("errors"):
+            logger.debug(
+                "Pre-verificación en lote con %d error(es): %s",
+                len(response["errors"]),
+                response["errors"][0].get("message"),
+            )
+
+        prechecks: dict[str, RepoPrecheck] = {}
+        for i, repo in enumerate(repos):
+            node = data.get(f"r{i}")
+            if not node:
+                continue
+            prechecks[repo.full_name] = self._parse_precheck(node, branch_prefix)
+        return prechecks
+
+    def _precheck_fields(self, i: int) -> str:
+        """Campos GraphQL de la pre-verificación de un repo (alias r{i})."""
+        return (
+            "defaultBranchRef { target { oid } } "
+            f"workflows: object(expression: $e{i}) "
+            "{ __typename ... on Tree { entries { name type oid } } } "
+            f"pullRequests(states: OPEN, first: {self.PRECHECK_PR_LIMIT}, "
+            "orderBy: {field: CREATED_AT, direction: DESC}) "
+            "{ pageInfo { hasNextPage } nodes { headRefName url } }"
+        )
 
-            return filenames
+    @staticmethod
+    def _parse_precheck(node: dict, branch_prefix: str) -> RepoPrecheck:
+        """Convierte el resultado GraphQL de un repo en un RepoPrecheck."""
+        head = (node.get("defaultBranchRef") or {}).get("target") or {}
+
+        tree = None
+        workflows = node.get("workflows")
+        if workflows and workflows.get("__typename") == "Tree":
+            tree = {
+                entry["name"]: entry["oid"]
+                for entry in workflows["entries"]
+                if entry["type"] == "blob" and entry["name"].endswith((".yml", ".yaml"))
+            }
+
+        pulls = node.get("pullRequests") or {}
+        open_prs = None
+        if not (pulls.get("pageInfo") or {}).get("hasNextPage"):
+            open_prs = {
+                pr["headRefName"]: pr["url"]
+                for pr in pulls.get("nodes") or []
+                if pr["headRefName"].startswith(branch_prefix)
+            }
+
+        return RepoPrecheck(
+            head_sha=head.get("oid"), workflow_tree=tree, open_sync_prs=open_prs
+        )
 
+    def _list_directory(
+        self, repo: RepositoryInfo, path: str, ref: str | None = None
+    ) -> list[dict] | None:
+        """Lista un directorio (lectura condicional). Retorna None si no existe."""
+        try:
+            contents = self._api_call_with_retry(
+                self._request_json,
+                "GET",
+                self._contents_url(repo, path),
+                {"ref": ref} if ref else None,
+                cacheable=True,
+                operation_name=f"list_contents({path})",
+            )
         except GithubException as e:
             if e.status == 404:
-                return []
+                return None
             raise
 
+        if not isinstance(contents, list):
+            contents = [contents]
+        return contents
+
     def delete_file(
         self,
-        repo: Repository,
+        repo: RepositoryInfo,
         path: str,
         message: str,
         branch: str,
@@ -482,17 +1089,16 @@ class GitHubClient(IGitHubClient):
     ) -> None:
         """Elimina un archivo del repositorio."""
         self._api_call_with_retry(
-            repo.delete_file,
-            path=path,
-            message=message,
-            sha=sha,
-            branch=branch,
+            self._request_json,
+            "DELETE",
+            self._contents_url(repo, path),
+            input={"message": message, "sha": sha, "branch": branch},
             operation_name=f"delete_file({path})",
         )
 
     def merge_pull_request(
         self,
-        repo: Repository,
+        repo: RepositoryInfo,
         pr_number: int,
         merge_method: str = "squash",
         max_retries: int = 3,
@@ -502,12 +1108,12 @@ class GitHubClient(IGitHubClient):
         Si el merge falla porque el branch está desactualizado,
         intenta actualizar el branch y reintentar el merge.
         """
-        pr = repo.get_pull(pr_number)
+        pr = self._get_pull(repo, pr_number)
 
         for attempt in range(max_retries):
             try:
                 # Verificar si es mergeable
-                if pr.mergeable is False:
+                if pr.get("mergeable") is False:
                     logger.warning(
                         "PR #%d no es mergeable (posible conflicto)",
                         pr_number,
@@ -515,8 +1121,12 @@ class GitHubClient(IGitHubClient):
                     return False
 
                 # Intentar merge
-                result = pr.merge(merge_method=merge_method)
-                return result.merged
+                result = self._request_json(
+                    "PUT",
+                    f"/repos/{repo.full_name}/pulls/{pr_number}/merge",
+                    input={"merge_method": merge_method},
+                )
+                return bool(result and result.get("merged"))
 
             except GithubException as e:
                 error_msg = self._extract_error(e).lower()
@@ -541,7 +1151,7 @@ class GitHubClient(IGitHubClient):
                     if self.update_branch(repo, pr_number):
                         # Esperar un momento y refrescar PR
                         time.sleep(2)
-                        pr = repo.get_pull(pr_number)
+                        pr = self._get_pull(repo, pr_number)
                         continue
                     else:
                         logger.warning("No se pudo actualizar el branch")
@@ -556,20 +1166,157 @@ class GitHubClient(IGitHubClient):
 
         return False
 
+    def enable_auto_merge(
+        self,
+        repo: RepositoryInfo,
+        pr_number: int,
+        merge_method: str = "squash",
+    ) -> bool:
+        """Activa el auto-merge nativo de GitHub en un PR.
+
+        GitHub mergea el PR cuando se cumplen las protecciones del branch,
+        sin que el cliente tenga que esperar. Retorna False si el repo no
+        permite auto-merge o si el PR ya se puede mergear directamente
+        (estado "clean"), casos en los que hay que mergearlo aparte.
+        """
+        node_id = self._pull_node_ids.get((repo.full_name, pr_number))
+        if node_id is None:
+            node_id = self._get_pull(repo, pr_number)["node_id"]
+
+        response = self._api_call_with_retry(
+            self._request_json,
+            "POST",
+            "/graphql",
+            input={
+                "query": (
+                    "mutation($id: ID!, $method: PullRequestMergeMethod!) { "
+                    "enablePullRequestAutoMerge(input: "
+                    "{pullRequestId: $id, mergeMethod: $method}) "
+                    "{ pullRequest { number } } }"
+                ),
+                "variables": {"id": node_id, "method": merge_method.upper()},
+            },
+            operation_name=f"enable_auto_merge({pr_number})",
+        )
+
+        errors = (response or {}).get("errors")
+        if errors:
+            logger.debug(
+                "Auto-merge no activado en %s#%d: %s",
+                repo.name,
+                pr_number,
+                errors[0].get("message"),
+            )
+            return False
+        return True
+
+    def get_merge_state(self, repo: RepositoryInfo, pr_number: int) -> MergeState:
+        """Obtiene el estado de merge de un PR.
+
+        `mergeable` se calcula de forma asíncrona: mientras es null, o si
+        las protecciones del branch aún bloquean el merge, el PR está
+        pendiente.
+        """
+        pr = self._get_pull(repo, pr_number)
+        if pr.get("merged"):
+            return MergeState.MERGED
+        if pr.get("state") == "closed":
+            return MergeState.CLOSED
+        if pr.get("mergeable") is False or pr.get("mergeable_state") == "dirty":
+            return MergeState.CONFLICT
+        if pr.get("mergeable") is None or pr.get("mergeable_state") in ("blocked", "draft"):
+            return MergeState.PENDING
+        return MergeState.MERGEABLE
+
+    def get_pull_request_statuses(
+        self, pulls: list[tuple[RepositoryInfo, int]]
+    ) -> dict[tuple[str, int], PullRequestStatus]:
+        """Obtiene en lote el estado de checks, merge y revisiones de varios PRs.
+
+        Una consulta GraphQL con un alias por PR cubre STATUS_BATCH_SIZE PRs,
+        así que el coste crece con el número de páginas y no con el de PRs.
+        """
+        statuses: dict[tuple[str, int], PullRequestStatus] = {}
+        for start in range(0, len(pulls), self.STATUS_BATCH_SIZE):
+            page = pulls[start : start + self.STATUS_BATCH_SIZE]
+
+            declarations = []
+            fields = []
+            variables: dict[str, Any] = {}
+            for i, (repo, number) in enumerate(page):
+                owner, _, name = repo.full_name.partition("/")
+                variables.update({f"o{i}": owner, f"n{i}": name, f"p{i}": number})
+                declarations.append(f"$o{i}: String!, $n{i}: String!, $p{i}: Int!")
+                fields.append(
+                    f"r{i}: repository(owner: $o{i}, name: $n{i}) "
+                    f"{{ pullRequest(number: $p{i}) {{ {self.PULL_STATUS_FIELDS} }} }}"
+                )
+
+            query = f"query({', '.join(declarations)}) {{\n" + "\n".join(fields) + "\n}"
+            response = self._api_call_with_retry(
+                self._request_json,
+                "POST",
+                "/graphql",
+                input={"query": query, "variables": variables},
+                operation_name=f"graphql_pull_statuses({len(page)})",
+            )
+
+            data = (response or {}).get("data") or {}
+            for i, (repo, number) in enumerate(page):
+                pr = (data.get(f"r{i}") or {}).get("pullRequest")
+                if pr:
+                    statuses[(repo.full_name, number)] = self._parse_pull_status(
+                        repo.full_name, pr
+                    )
+        return statuses
+
+    @staticmethod
+    def _parse_pull_status(full_name: str, pr: dict) -> PullRequestStatus:
+        """Convierte el resultado GraphQL de un PR en un PullRequestStatus."""
+        if pr.get("merged"):
+            merge_state = MergeState.MERGED
+        elif pr.get("state") == "CLOSED":
+            merge_state = MergeState.CLOSED
+        elif pr.get("mergeable") == "CONFLICTING" or pr.get("mergeStateStatus") == "DIRTY":
+            merge_state = MergeState.CONFLICT
+        elif pr.get("mergeable") == "UNKNOWN" or pr.get("mergeStateStatus") in (
+            "BLOCKED",
+            "DRAFT",
+            "UNKNOWN",
+        ):
+            merge_state = MergeState.PENDING
+        else:
+            merge_state = MergeState.MERGEABLE
+
+        commits = (pr.get("commits") or {}).get("nodes") or []
+        rollup = commits[0]["commit"].get("statusCheckRollup") if commits else None
+        protection = (pr.get("baseRef") or {}).get("branchProtectionRule") or {}
+
+        return PullRequestStatus(
+            repo=full_name,
+            number=pr["number"],
+            url=pr["url"],
+            merge_state=merge_state,
+            checks=rollup["state"] if rollup else None,
+            review_decision=pr.get("reviewDecision"),
+            requires_checks=bool(protection.get("requiresStatusChecks")),
+            draft=bool(pr.get("isDraft")),
+        )
+
     def update_branch(
         self,
-        repo: Repository,
+        repo: RepositoryInfo,
         pr_number: int,
     ) -> bool:
         """Actualiza el branch del PR con los cambios de base."""
         try:
-            pr = repo.get_pull(pr_number)
-            # PyGithub usa update_branch para hacer el "Update branch" de GitHub
-            result = pr.update_branch()
-            if result:
-                logger.debug("Branch del PR #%d actualizado exitosamente", pr_number)
-                return True
-            return False
+            # Equivalente al botón "Update branch" de GitHub
+            self._request_json(
+                "PUT",
+                f"/repos/{repo.full_name}/pulls/{pr_number}/update-branch",
+            )
+            logger.debug("Branch del PR #%d actualizado exitosamente", pr_number)
+            return True
         except GithubException as e:
             logger.warning(
                 "No se pudo actualizar branch del PR #%d: %s",
@@ -578,68 +1325,50 @@ class GitHubClient(IGitHubClient):
             )
             return False
 
-    def handle_post_operation_rate_limit(self) -> None:
-        """Maneja el rate limit después de cada operación."""
-        try:
-            rate_limit = self._github.get_rate_limit()
-            # PyGithub >= 2.x usa rate.core, versiones anteriores usan core directamente
-            core_limit = getattr(rate_limit, "core", None) or getattr(rate_limit.rate, "core", rate_limit.rate)
-            remaining = core_limit.remaining
-            reset_time = core_limit.reset
-
-            if remaining < 10:
-                self._wait_for_rate_limit_reset(reset_time, remaining, "Core API")
-            elif remaining < self.RATE_LIMIT_THRESHOLD:
-                time.sleep(2)
-            else:
-                time.sleep(1)
-        except Exception as e:
-            logger.debug("Rate limit check failed: %s, using conservative delay", str(e))
-            time.sleep(2)
-
-    def _wait_for_rate_limit_reset(
-        self, reset_time: datetime, remaining: int, limit_type: str
-    ) -> None:
-        """Espera hasta que el rate limit se resetee."""
-        now = datetime.now(timezone.utc)
-        if reset_time.tzinfo is None:
-            reset_time = reset_time.replace(tzinfo=timezone.utc)
-        wait_seconds = (reset_time - now).total_seconds() + 5
-
-        if wait_seconds > 0:
-            wait_seconds = min(wait_seconds, self.MAX_RATE_LIMIT_WAIT)
-            logger.warning(
-                "Rate limit bajo (%d restantes para %s). Esperando %.0f segundos.",
-                remaining,
-                limit_type,
-                wait_seconds,
-            )
-            time.sleep(wait_seconds)
+    def _get_pull(self, repo: RepositoryInfo, pr_number: int) -> dict:
+        """Obtiene un PR (sin caché: mergeable se calcula de forma asíncrona)."""
+        return self._api_call_with_retry(
+            self._request_json,
+            "GET",
+            f"/repos/{repo.full_name}/pulls/{pr_number}",
+            operation_name=f"get_pull({pr_number})",
+        )
 
     def _api_call_with_retry(
         self, operation, *args, operation_name: str = "API call", **kwargs
     ):
-        """Ejecuta una llamada API con reintentos y backoff exponencial."""
+        """Ejecuta una llamada API con reintentos y backoff exponencial.
+
+        Ante rate limits no se duerme aquí: el limitador compartido ya quedó
+        bloqueado con los datos de la respuesta y el siguiente intento espera
+        lo necesario. Cada intento se notifica a los call listeners.
+        """
         last_exception: Exception | None = None
 
         for attempt in range(self.MAX_RETRIES):
+            start = time.time()
             try:
-                return operation(*args, **kwargs)
+                result = operation(*args, **kwargs)
+                self._notify_call(operation_name, ApiCallOutcome.OK, start)
+                return result
 
             except RateLimitExceededException as e:
-                wait_time = self.RETRY_DELAY_BASE ** (attempt + 1)
+                self._notify_call(
+                    operation_name, ApiCallOutcome.RATE_LIMITED, start, e.status
+                )
                 logger.warning(
-                    "%s: Rate limited. Retrying in %ds (attempt %d/%d)",
+                    "%s: Rate limited. Waiting for budget (attempt %d/%d)",
                     operation_name,
-                    wait_time,
                     attempt + 1,
                     self.MAX_RETRIES,
                 )
-                time.sleep(wait_time)
                 last_exception = e
 
             except GithubException as e:
                 if e.status in (500, 502, 503, 504):
+                    self._notify_call(
+                        operation_name, ApiCallOutcome.SERVER_ERROR, start, e.status
+                    )
                     wait_time = self.RETRY_DELAY_BASE ** (attempt + 1)
                     logger.warning(
                         "%s: Server error %d. Retrying in %ds (attempt %d/%d)",
@@ -652,27 +1381,26 @@ class GitHubClient(IGitHubClient):
                     time.sleep(wait_time)
                     last_exception = e
 
-                elif (
-                    e.status == 403
-                    and hasattr(e, "data")
-                    and e.data
-                    and "secondary rate limit" in str(e.data).lower()
-                ):
-                    wait_time = min(60 * (2**attempt), self.MAX_RATE_LIMIT_WAIT)
+                elif self._is_secondary_rate_limit(e.status, e.data):
+                    self._notify_call(
+                        operation_name, ApiCallOutcome.RATE_LIMITED, start, e.status
+                    )
                     logger.warning(
-                        "%s: Secondary rate limit. Waiting %ds (attempt %d/%d)",
+                        "%s: Secondary rate limit. Waiting for budget (attempt %d/%d)",
                         operation_name,
-                        wait_time,
                         attempt + 1,
                         self.MAX_RETRIES,
                     )
-                    time.sleep(wait_time)
                     last_exception = e
 
                 else:
+                    self._notify_call(
+                        operation_name, ApiCallOutcome.CLIENT_ERROR, start, e.status
+                    )
                     raise
 
             except Exception as e:
+                self._notify_call(operation_name, ApiCallOutcome.NETWORK_ERROR, start)
                 wait_time = self.RETRY_DELAY_BASE ** (attempt + 1)
                 logger.warning(
                     "%s: Network error '%s'. Retrying in %ds (attempt %d/%d)",
@@ -690,6 +1418,249 @@ class GitHubClient(IGitHubClient):
             raise last_exception
         raise RuntimeError(f"{operation_name} failed after {self.MAX_RETRIES} retries")
 
+    def _notify_call(
+        self,
+        operation_name: str,
+        outcome: ApiCallOutcome,
+        start: float,
+        status: int | None = None,
+    ) -> None:
+        """Notifica un intento de llamada a los call listeners."""
+        if not self._call_listeners:
+            return
+
+        event = ApiCallEvent(
+            operation=operation_name,
+            outcome=outcome,
+            duration_seconds=time.time() - start,
+            status=status,
+        )
+        for listener in list(self._call_listeners):
+            try:
+                listener(event)
+            except Exception:
+                logger.debug("Call listener falló", exc_info=True)
+
+    def _request_json(
+        self,
+        verb: str,
+        url: str,
+        parameters: dict[str, Any] | None = None,
+        input: Any = None,
+        cacheable: bool = False,
+    ) -> Any:
+        """Ejecuta una petición REST y retorna el JSON decodificado.
+
+        Las lecturas cacheables se envían como peticiones condicionales
+        (If-None-Match / If-Modified-Since); un 304 se resuelve con la
+        respuesta almacenada sin consumir rate limit.
+
+        Raises:
+            GithubException: Si la respuesta es un error HTTP.
+        """
+        headers: dict[str, str] = {}
+        entry = None
+        key = None
+
+        if cacheable and self._cache is not None:
+            key = self._cache.make_key(self._identity, url, parameters)
+            entry = self._cache.get(key)
+            if entry is not None:
+                if entry.etag:
+                    headers["If-None-Match"] = entry.etag
+                elif entry.last_modified:
+                    headers["If-Modified-Since"] = entry.last_modified
+
+        resource = self._resource_for(url)
+        self._rate_limiter.acquire(resource)
+
+        status, response_headers, body = self._send(
+            verb, url, parameters, headers, input
+        )
+        response_headers = {k.lower(): v for k, v in response_headers.items()}
+        self._rate_limiter.update(resource, response_headers)
+
+        if status == 304 and entry is not None:
+            # Las respuestas 304 no consumen rate limit
+            self._rate_limiter.refund(resource)
+            self._cache.record_hit(key)
+            return json.loads(entry.body)
+
+        if status >= 400:
+            exception = self._build_exception(status, response_headers, body)
+            if (
+                self._is_secondary_rate_limit(status, exception.data)
+                and "retry-after" not in response_headers
+            ):
+                self._rate_limiter.block(resource, self.SECONDARY_RATE_LIMIT_WAIT)
+            raise exception
+
+        if key is not None:
+            self._cache.record_miss()
+            etag = response_headers.get("etag")
+            last_modified = response_headers.get("last-modified")
+            if body and (etag or last_modified):
+                self._cache.put(key, etag, last_modified, body)
+
+        return json.loads(body) if body else None
+
+    def _send(
+        self,
+        verb: str,
+        url: str,
+        parameters: dict[str, Any] | None,
+        headers: dict[str, str],
+        input: Any,
+    ) -> tuple[int, dict[str, str], str]:
+        """Envía una petición HTTP y retorna (status, cabeceras, cuerpo).
+
+        Es el único punto de transporte del cliente: las subclases pueden
+        reemplazarlo (ej: por un stack asíncrono) sin tocar la lógica.
+        """
+        return self._github.requester.requestJson(verb, url, parameters, headers, input)
+
+    def _request_paginated(
+        self,
+        url: str,
+        parameters: dict[str, Any] | None = None,
+        items_key: str | None = None,
+        operation_name: str = "API call",
+    ) -> Iterator[dict]:
+        """Itera los elementos de un listado paginado (lecturas condicionales).
+
+        En las búsquedas (respuestas con `total_count`) se detiene tras
+        `total_count` elementos o el límite de la Search API, sin pedir la
+        página que la API rechazaría con un 422.
+        """
+        page = 1
+        limit: int | None = None
+        yielded = 0
+        while True:
+            params = dict(parameters or {}, per_page=self.PAGE_SIZE, page=page)
+            data = self._api_call_with_retry(
+                self._request_json,
+                "GET",
+                url,
+                params,
+                cacheable=True,
+                operation_name=f"{operation_name}[{page}]",
+            )
+            items = (data or {}).get(items_key, []) if items_key else (data or [])
+            if limit is None and isinstance(data, dict) and "total_count" in data:
+                limit = min(data["total_count"], self.SEARCH_MAX_RESULTS)
+                if data["total_count"] > self.SEARCH_MAX_RESULTS:
+                    logger.warning(
+                        "%s: %d resultados, pero la Search API solo devuelve los "
+                        "primeros %d; usa DiscoveryMode.ORG_LISTING (listar toda "
+                        "la org) para procesarlos todos",
+                        operation_name,
+                        data["total_count"],
+                        self.SEARCH_MAX_RESULTS,
+                    )
+            yield from items
+            yielded += len(items)
+
+            if len(items) < self.PAGE_SIZE or (limit is not None and yielded >= limit):
+                return
+            page += 1
+
+    def _request_stream(self, url: str) -> Iterator[bytes]:
+        """GET en streaming (sigue redirects) con el rate limit compartido."""
+        resource = self._resource_for(url)
+        self._rate_limiter.acquire(resource)
+
+        try:
+            _, response_headers, chunks = self._github.requester.getStream(
+                url, chunk_size=self.STREAM_CHUNK_SIZE
+            )
+        except requests.HTTPError as e:
+            response = e.response
+            headers = {k.lower(): v for k, v in response.headers.items()}
+            self._rate_limiter.update(resource, headers)
+            raise self._build_exception(response.status_code, headers, response.text) from e
+
+        self._rate_limiter.update(
+            resource, {k.lower(): v for k, v in response_headers.items()}
+        )
+        return chunks
+
+    @staticmethod
+    def _resource_for(url: str) -> str:
+        """Recurso de rate limit al que se imputa una URL."""
+        if "/graphql" in url:
+            return "graphql"
+        if "/search/" in url:
+            return "search"
+        return "core"
+
+    @staticmethod
+    def _is_secondary_rate_limit(status: int, data: Any) -> bool:
+        """Indica si un error corresponde a un rate limit secundario."""
+        return (
+            status in (403, 429)
+            and bool(data)
+            and "secondary rate limit" in str(data).lower()
+        )
+
+    @staticmethod
+    def _repository_info(data: dict) -> RepositoryInfo:
+        """Construye un RepositoryInfo a partir del payload de la API."""
+        permissions = data.get("permissions") or {}
+        return RepositoryInfo(
+            name=data["name"],
+            full_name=data["full_name"],
+            default_branch=data.get("default_branch") or "main",
+            archived=bool(data.get("archived")),
+            has_push_permission=bool(permissions.get("push", True)),
+            topics=[t.lower() for t in data.get("topics") or []],
+        )
+
+    def _log_org_listing_estimate(self, org: str) -> None:
+        """Informa cuántas páginas costará listar la organización."""
+        try:
+            data = self._api_call_with_retry(
+                self._request_json,
+                "GET",
+                f"/orgs/{quote(org, safe='')}",
+                cacheable=True,
+                operation_name="get_org",
+            )
+        except GithubException as e:
+            logger.debug("No se pudo estimar el tamaño de %s: %s", org, self._extract_error(e))
+            return
+
+        total = (data.get("public_repos") or 0) + (data.get("total_private_repos") or 0)
+        logger.info(
+            "Listando %d repos de %s (~%d peticiones)",
+            total,
+            org,
+            -(-total // self.PAGE_SIZE),
+        )
+
+    @staticmethod
+    def _contents_url(repo: RepositoryInfo, path: str) -> str:
+        """URL de la Contents API para una ruta."""
+        return f"/repos/{repo.full_name}/contents/{quote(path)}"
+
+    @staticmethod
+    def _ref_url(repo: RepositoryInfo, branch: str) -> str:
+        """URL de la referencia de una rama."""
+        return f"/repos/{repo.full_name}/git/ref/heads/{quote(branch)}"
+
+    @staticmethod
+    def _build_exception(
+        status: int, headers: dict[str, str], body: str
+    ) -> GithubException:
+        """Construye la excepción equivalente a la que lanzaría PyGithub."""
+        try:
+            data = json.loads(body) if body else None
+        except ValueError:
+            data = {"message": body}
+
+        if status in (403, 429) and headers.get("x-ratelimit-remaining") == "0":
+            return RateLimitExceededException(status, data, headers)
+        return GithubException(status, data, headers)
+
     @staticmethod
     def _extract_error(exception: GithubException) -> str:
         """Extrae mensaje de error de una GithubException."""
@@ -0,0 +1,186 @@
+"""
+Caché HTTP persistente para peticiones condicionales a la API de GitHub.
+
+GitHub no descuenta del rate limit las respuestas 304 (Not Modified), así que
+guardar el ETag / Last-Modified de cada lectura permite repetir ejecuciones
+casi sin consumir cuota.
+
+Principio SOLID: Single Responsibility
+- Solo se encarga de almacenar y recuperar respuestas cacheadas.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """Respuesta cacheada.
+
+    Attributes:
+        etag: Valor de la cabecera ETag (si la hubo).
+        last_modified: Valor de la cabecera Last-Modified (si la hubo).
+        body: Cuerpo de la respuesta (JSON serializado).
+    """
+
+    etag: str | None
+    last_modified: str | None
+    body: str
+
+
+class HttpCache:
+    """Caché HTTP en disco (SQLite) con desalojo LRU y límite de tamaño.
+
+    Las claves combinan la URL, los parámetros y una huella del token, de
+    modo que dos tokens con permisos distintos nunca comparten respuestas.
+    Es segura para uso concurrente desde varios hilos.
+    """
+
+    DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+    # Al superar el límite se desaloja hasta quedar en este porcentaje
+    EVICTION_TARGET = 0.9
+
+    def __init__(self, path: str | Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Inicializa la caché.
+
+        Args:
+            path: Ruta del archivo SQLite (se crea si no existe).
+            max_bytes: Tamaño máximo de los cuerpos almacenados.
+        """
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+        self._conn = sqlite3.connect(str(self._path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                body TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+        row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        self._total_bytes = int(row[0])
+
+    @staticmethod
+    def make_key(identity: str, url: str, parameters: dict | None = None) -> str:
+        """Construye la clave de caché para una petición.
+
+        Args:
+            identity: Huella del token (nunca el token en claro).
+            url: URL de la petición.
+            parameters: Parámetros de query.
+        """
+        params = json.dumps(parameters or {}, sort_keys=True)
+        raw = f"{identity}\n{url}\n{params}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Obtiene una entrada sin contabilizarla como acierto."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, body FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        return CacheEntry(etag=row[0], last_modified=row[1], body=row[2])
+
+    def record_hit(self, key: str) -> None:
+        """Registra un acierto (respuesta 304) y actualiza el acceso LRU."""
+        with self._lock:
+            self._hits += 1
+            self._conn.execute(
+                "UPDATE responses SET last_access = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            self._conn.commit()
+
+    def record_miss(self) -> None:
+        """Registra un fallo (respuesta completa)."""
+        with self._lock:
+            self._misses += 1
+
+    def put(
+        self,
+        key: str,
+        etag: str | None,
+        last_modified: str | None,
+        body: str,
+    ) -> None:
+        """Almacena una respuesta, desalojando las menos usadas si hace falta."""
+        size = len(body.encode("utf-8"))
+        if size > self._max_bytes:
+            return
+
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if previous:
+                self._total_bytes -= previous[0]
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, etag, last_modified, body, size, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, etag, last_modified, body, size, time.time()),
+            )
+            self._total_bytes += size
+
+            if self._total_bytes > self._max_bytes:
+                self._evict()
+
+            self._conn.commit()
+
+    def stats(self) -> dict[str, int]:
+        """Retorna contadores de uso de la caché."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "entries": entries,
+                "bytes": self._total_bytes,
+            }
+
+    def close(self) -> None:
+        """Cierra la conexión con la base de datos."""
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self) -> None:
+        """Desaloja entradas por orden LRU. Requiere tener el lock."""
+        target = int(self._max_bytes * self.EVICTION_TARGET)
+        evicted = 0
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_access ASC"
+        ).fetchall()
+
+        for key, size in rows:
+            if self._total_bytes <= target:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._total_bytes -= size
+            evicted += 1
+
+        logger.debug("Caché HTTP: %d entrada(s) desalojadas", evicted)
@@ -0,0 +1,204 @@
+"""
+Limitador de peticiones compartido, alimentado por las cabeceras de GitHub.
+
+Cada respuesta trae X-RateLimit-Remaining / X-RateLimit-Reset (y Retry-After
+ante límites secundarios). El limitador las usa para repartir un único
+presupuesto entre todos los hilos, sin consultar /rate_limit ni dormir
+intervalos fijos.
+
+Principio SOLID: Single Responsibility
+- Solo decide cuándo puede salir la siguiente petición.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Bucket:
+    """Estado del presupuesto de un recurso (core, search, graphql).
+
+    Attributes:
+        reserve: Peticiones que se dejan sin usar como margen.
+        limit: Límite total de la ventana (None hasta la primera respuesta).
+        remaining: Peticiones disponibles estimadas.
+        reset_at: Epoch en que GitHub restablece el presupuesto.
+        blocked_until: Epoch hasta el que no se debe enviar nada (Retry-After).
+        next_slot: Epoch a partir del cual puede salir la siguiente petición.
+    """
+
+    reserve: int
+    limit: int | None = None
+    remaining: int | None = None
+    reset_at: float = 0.0
+    blocked_until: float = 0.0
+    next_slot: float = 0.0
+
+
+class RateLimiter:
+    """Token bucket por recurso, seguro para uso concurrente.
+
+    - Los tokens disponibles son los que GitHub informa en cada respuesta,
+      descontando localmente las peticiones en vuelo.
+    - Por debajo de PACING_FRACTION del límite, las peticiones se espacian
+      para repartir lo que queda hasta el reset en lugar de agotarlo.
+    - Al llegar a la reserva, todos los hilos esperan al reset.
+    - Retry-After bloquea el recurso para todos los hilos.
+    """
+
+    RESOURCES = ("core", "search", "graphql")
+    DEFAULT_RESERVES = {"core": 50, "search": 5, "graphql": 50}
+    PACING_FRACTION = 0.2
+    MAX_SLEEP_CHUNK = 30.0
+
+    def __init__(self, reserves: dict[str, int] | None = None) -> None:
+        """Inicializa el limitador.
+
+        Args:
+            reserves: Reserva por recurso (por defecto DEFAULT_RESERVES).
+        """
+        reserves = {**self.DEFAULT_RESERVES, **(reserves or {})}
+        self._buckets = {name: _Bucket(reserve=reserves[name]) for name in self.RESOURCES}
+        self._lock = threading.Lock()
+
+    def acquire(self, resource: str = "core") -> None:
+        """Reserva un token del recurso, esperando si el presupuesto lo exige."""
+        while True:
+            with self._lock:
+                wait = self._try_take(self._bucket(resource), time.time())
+            if wait <= 0:
+                return
+            self._sleep(resource, wait)
+
+    def wait_if_exhausted(self, resource: str = "core") -> None:
+        """Espera (sin consumir token) si el recurso está en su reserva o bloqueado."""
+        while True:
+            with self._lock:
+                bucket = self._bucket(resource)
+                now = time.time()
+                self._refill(bucket, now)
+                if bucket.blocked_until > now:
+                    wait = bucket.blocked_until - now
+                elif bucket.remaining is not None and bucket.remaining <= bucket.reserve:
+                    wait = max(bucket.reset_at - now, 1.0)
+                else:
+                    return
+            self._sleep(resource, wait)
+
+    def update(self, resource: str, headers: dict[str, str]) -> None:
+        """Actualiza el presupuesto con las cabeceras de una respuesta.
+
+        Args:
+            resource: Recurso al que pertenece la petición.
+            headers: Cabeceras de la respuesta (claves en minúsculas).
+        """
+        resource = headers.get("x-ratelimit-resource", resource)
+        if resource not in self._buckets:
+            return
+
+        with self._lock:
+            bucket = self._buckets[resource]
+            now = time.time()
+
+            retry_after = headers.get("retry-after")
+            if retry_after and retry_after.isdigit():
+                bucket.blocked_until = max(bucket.blocked_until, now + int(retry_after))
+
+            remaining = headers.get("x-ratelimit-remaining")
+            reset = headers.get("x-ratelimit-reset")
+            limit = headers.get("x-ratelimit-limit")
+            if remaining is None or reset is None:
+                return
+
+            reset_at = float(reset)
+            if limit is not None:
+                bucket.limit = int(limit)
+
+            if reset_at > bucket.reset_at or bucket.remaining is None:
+                # Nueva ventana: el valor de GitHub es la referencia
+                bucket.remaining = int(remaining)
+                bucket.reset_at = reset_at
+            else:
+                # Misma ventana: no recuperar tokens ya reservados en vuelo
+                bucket.remaining = min(bucket.remaining, int(remaining))
+
+    def refund(self, resource: str) -> None:
+        """Devuelve un token (ej: respuestas 304, que GitHub no descuenta)."""
+        with self._lock:
+            bucket = self._bucket(resource)
+            if bucket.remaining is not None and (
+                bucket.limit is None or bucket.remaining < bucket.limit
+            ):
+                bucket.remaining += 1
+
+    def block(self, resource: str, seconds: float) -> None:
+        """Bloquea el recurso para todos los hilos durante `seconds`."""
+        with self._lock:
+            bucket = self._bucket(resource)
+            bucket.blocked_until = max(bucket.blocked_until, time.time() + seconds)
+
+    def snapshot(self) -> dict[str, dict[str, float | int | None]]:
+        """Retorna el estado actual de cada recurso (para logging)."""
+        with self._lock:
+            return {
+                name: {
+                    "remaining": bucket.remaining,
+                    "limit": bucket.limit,
+                    "reset_at": bucket.reset_at,
+                }
+                for name, bucket in self._buckets.items()
+            }
+
+    def _bucket(self, resource: str) -> _Bucket:
+        """Retorna el bucket del recurso (core por defecto)."""
+        return self._buckets.get(resource, self._buckets["core"])
+
+    def _try_take(self, bucket: _Bucket, now: float) -> float:
+        """Intenta tomar un token. Retorna 0 si lo tomó o los segundos a esperar.
+
+        Requiere tener el lock.
+        """
+        self._refill(bucket, now)
+
+        if bucket.blocked_until > now:
+            return bucket.blocked_until - now
+
+        if bucket.remaining is None:
+            # Sin información todavía: la primera respuesta la aportará
+            return 0.0
+
+        if bucket.remaining <= bucket.reserve:
+            return max(bucket.reset_at - now, 1.0)
+
+        if bucket.next_slot > now:
+            return bucket.next_slot - now
+
+        bucket.remaining -= 1
+        if bucket.limit and bucket.remaining < bucket.limit * self.PACING_FRACTION:
+            # Repartir lo que queda hasta el reset
+            usable = max(bucket.remaining - bucket.reserve, 1)
+            bucket.next_slot = now + max(bucket.reset_at - now, 0.0) / usable
+        return 0.0
+
+    @staticmethod
+    def _refill(bucket: _Bucket, now: float) -> None:
+        """Restablece el presupuesto si la ventana expiró. Requiere tener el lock."""
+        if bucket.remaining is not None and bucket.reset_at and now >= bucket.reset_at:
+            bucket.remaining = bucket.limit
+            bucket.next_slot = 0.0
+
+    def _sleep(self, resource: str, wait: float) -> None:
+        """Duerme en tramos para reevaluar el estado compartido."""
+        if wait > 5:
+            logger.warning(
+                "Presupuesto de %s agotado o bloqueado. Esperando %.0f segundos.",
+                resource,
+                wait,
+            )
+        time.sleep(min(wait, self.MAX_SLEEP_CHUNK))
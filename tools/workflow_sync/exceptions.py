@@ -40,3 +40,9 @@ class RepositoryAccessError(WorkflowSyncError):
     """Error al acceder a un repositorio específico."""
 
     pass
+
+
+class BranchExistsError(RepositoryAccessError):
+    """La rama que se intenta crear ya existe en el repositorio."""
+
+    pass
@@ -17,9 +17,17 @@ from pathlib import Path
 # Agregar el directorio actual al path para imports
 sys.path.insert(0, str(Path(__file__).parent))
 
+from clients.async_github_client import AsyncGitHubClient
+from clients.git_transport_client import GitTransportClient
 from clients.github_client import GitHubClient
+from clients.http_cache import HttpCache
 from exceptions import ValidationError, WorkflowSyncError
-from models import SyncConfig, SyncStatus
+from models import DiscoveryMode, DriftState, MergeMode, SourceMode, SyncConfig, SyncStatus
+from services.branch_gc import BranchGarbageCollector
+from services.drift_report import DriftReporter
+from services.run_journal import RunJournal
+from services.state_store import SyncStateStore
+from services.sync_plan import SyncPlan
 from services.sync_service import WorkflowSyncService
 from validators.input_validator import InputValidator
 
@@ -27,6 +35,12 @@ from validators.input_validator import InputValidator
 # Archivo de configuración
 CONFIG_FILE = Path.home() / ".workflow-sync-config"
 
+# Directorio para cachés persistentes
+CACHE_DIR = Path.home() / ".workflow-sync"
+
+# Diarios de ejecución (para reanudar con --resume)
+RUNS_DIR = CACHE_DIR / "runs"
+
 
 # Colores ANSI
 class Colors:
@@ -287,6 +301,9 @@ def show_main_menu() -> str:
 
     return prompt_menu("¿Qué deseas hacer?", [
         ("sync", "🔄 Sincronizar workflows"),
+        ("resume", "⏯  Reanudar ejecución interrumpida"),
+        ("gc", "🧹 Limpiar branches de sync sobrantes"),
+        ("drift", "📊 Informe de drift de workflows"),
         ("token", "🔑 Cambiar/Rotar token"),
         ("exit", "🚪 Salir"),
     ])
@@ -325,6 +342,36 @@ def get_sync_config(token: str) -> SyncConfig | None:
         print_error(str(e))
         return None
 
+    source_path = prompt(
+        "Checkout local de la fuente (vacío = descargar de GitHub)", required=False
+    )
+    if source_path and not Path(source_path).is_dir():
+        print_error(f"No existe el directorio {source_path}")
+        return None
+
+    source_ref = ""
+    if not source_path:
+        source_ref = prompt("Ref de la fuente (branch, tag o SHA; vacío = por defecto)", required=False)
+    if source_ref:
+        try:
+            InputValidator.validate_git_ref(source_ref)
+        except ValidationError as e:
+            print_error(str(e))
+            return None
+
+    source_range = prompt(
+        "Rango de commits fuente (base..head; vacío = todos los repos)", required=False
+    )
+    if source_range:
+        try:
+            InputValidator.validate_commit_range(source_range)
+        except ValidationError as e:
+            print_error(str(e))
+            return None
+        delta = prompt_yes_no("¿Comparar solo los workflows cambiados en el rango (delta)?")
+    else:
+        delta = False
+
     print()
 
     # Archivos (opcional)
@@ -345,20 +392,88 @@ def get_sync_config(token: str) -> SyncConfig | None:
     print()
     dry_run = prompt_yes_no("Modo Dry Run (solo mostrar cambios)", default=False)
     auto_merge = False
+    merge_mode = MergeMode.BLOCKING
     if not dry_run:
         auto_merge = prompt_yes_no("Auto-merge PRs (mergear automáticamente)", default=False)
+    if auto_merge:
+        if prompt_yes_no(
+            "Esperar a que todos los checks pasen y mergear al final",
+            default=False,
+        ):
+            merge_mode = MergeMode.WAIT_GREEN
+        elif prompt_yes_no(
+            "Auto-merge nativo de GitHub (sin bloquear workers; cola de merge si no está permitido)",
+            default=True,
+        ):
+            merge_mode = MergeMode.NATIVE
     parallel = prompt_yes_no("Ejecución paralela", default=False)
+    max_workers = 1
+    async_io = False
+    pipeline = False
+    adaptive = False
+    if parallel:
+        async_io = prompt_yes_no(
+            "Cliente HTTP asíncrono (aiohttp, un pool de conexiones para todos los hilos)",
+            default=False,
+        )
+        pipeline = prompt_yes_no(
+            "Pipeline por etapas (lecturas anchas, escrituras acotadas)",
+            default=False,
+        )
+        if not pipeline:
+            adaptive = prompt_yes_no(
+                "Concurrencia adaptativa (sube mientras GitHub responde bien)",
+                default=True,
+            )
+        workers_str = prompt("Repos en paralelo", default="4")
+        if not workers_str.isdigit() or int(workers_str) < 1:
+            print_error("El número de repos en paralelo debe ser un entero positivo")
+            return None
+        max_workers = int(workers_str)
+    git_transport = False
+    if not async_io:
+        git_transport = prompt_yes_no(
+            "Transporte git (clones parciales locales, un push por repo)",
+            default=False,
+        )
+    use_cache = prompt_yes_no("Caché HTTP persistente (peticiones condicionales)", default=True)
+    incremental = prompt_yes_no(
+        "Sincronización incremental (saltar repos sin cambios desde la última ejecución)",
+        default=True,
+    )
+    batched_prechecks = prompt_yes_no(
+        "Pre-verificaciones en lote (GraphQL, 50 repos por consulta)",
+        default=True,
+    )
+    org_listing = prompt_yes_no(
+        "Listar todos los repos de la org (sin el límite de 1.000 de la búsqueda)",
+        default=False,
+    )
 
     return SyncConfig(
         token=token,
         org=org,
         topic=topic,
         source_repo=source_repo,
+        source_ref=source_ref or None,
+        source_range=source_range or None,
+        delta=delta,
+        source_mode=SourceMode.LOCAL if source_path else SourceMode.ARCHIVE,
+        source_path=source_path or None,
         dry_run=dry_run,
         files_filter=files_filter,
-        max_workers=4 if parallel else 1,
+        max_workers=max_workers,
         timeout=30,
         auto_merge=auto_merge,
+        merge_mode=merge_mode,
+        cache_dir=str(CACHE_DIR) if use_cache else None,
+        async_io=async_io,
+        pipeline=pipeline,
+        adaptive_concurrency=adaptive,
+        discovery=DiscoveryMode.ORG_LISTING if org_listing else DiscoveryMode.SEARCH,
+        state_path=str(CACHE_DIR / "sync-state.sqlite") if incremental else None,
+        batched_prechecks=batched_prechecks,
+        git_mirror_dir=str(CACHE_DIR / "git") if git_transport else None,
     )
 
 
@@ -370,29 +485,117 @@ def show_summary(config: SyncConfig):
     print(f"  Organización:     {Colors.BOLD}{config.org}{Colors.END}")
     print(f"  Topic:            {Colors.BOLD}{config.topic}{Colors.END}")
     print(f"  Repo fuente:      {Colors.BOLD}{config.source_repo}{Colors.END}")
+    if config.source_mode == SourceMode.LOCAL:
+        print(f"  Fuente local:     {Colors.BOLD}{config.source_path}{Colors.END}")
+    else:
+        print(f"  Ref fuente:       {Colors.BOLD}{config.source_ref or 'branch por defecto'}{Colors.END}")
+    if config.source_range:
+        print(f"  Rango fuente:     {Colors.BOLD}{config.source_range}{Colors.END}")
+        if config.delta:
+            print(f"  Delta:            {Colors.BOLD}Solo workflows cambiados{Colors.END}")
     print(f"  Archivos:         {Colors.BOLD}{config.files_filter or 'todos'}{Colors.END}")
     print(f"  Dry Run:          {Colors.BOLD}{'Sí' if config.dry_run else 'No'}{Colors.END}")
-    print(f"  Auto-merge:       {Colors.BOLD}{'Sí' if config.auto_merge else 'No'}{Colors.END}")
-    print(f"  Paralelo:         {Colors.BOLD}{'Sí' if config.max_workers > 1 else 'No'}{Colors.END}")
+    auto_merge = "No"
+    if config.auto_merge:
+        auto_merge = {
+            MergeMode.NATIVE: "Sí (nativo)",
+            MergeMode.WAIT_GREEN: "Sí (al terminar los checks)",
+        }.get(config.merge_mode, "Sí")
+    print(f"  Auto-merge:       {Colors.BOLD}{auto_merge}{Colors.END}")
+    engine = ""
+    if config.pipeline:
+        engine = ", pipeline"
+    elif config.adaptive_concurrency:
+        engine = f", adaptativo hasta {config.adaptive_max_workers}"
+    parallel = f"Sí ({config.max_workers}{engine})"
+    print(f"  Paralelo:         {Colors.BOLD}{parallel if config.max_workers > 1 else 'No'}{Colors.END}")
+    transport = "API REST"
+    if config.git_mirror_dir:
+        transport = f"git ({config.git_mirror_dir})"
+    elif config.async_io:
+        transport = "API REST (aiohttp)"
+    print(f"  Transporte:       {Colors.BOLD}{transport}{Colors.END}")
+    print(f"  Caché HTTP:       {Colors.BOLD}{'Sí' if config.cache_dir else 'No'}{Colors.END}")
+    discovery = "listado de la org" if config.discovery == DiscoveryMode.ORG_LISTING else "búsqueda"
+    print(f"  Incremental:      {Colors.BOLD}{'Sí' if config.state_path else 'No'}{Colors.END}")
+    print(f"  Descubrimiento:   {Colors.BOLD}{discovery}{Colors.END}")
+    print(f"  Pre-verif. lote:  {Colors.BOLD}{'Sí' if config.batched_prechecks else 'No'}{Colors.END}")
     print()
 
 
-def run_sync(config: SyncConfig) -> bool:
-    """Ejecuta la sincronización."""
+def run_sync(
+    config: SyncConfig,
+    journal: RunJournal | None = None,
+    plan_path: str | None = None,
+    plan: SyncPlan | None = None,
+) -> bool:
+    """Ejecuta la sincronización.
+
+    Args:
+        config: Configuración de sincronización.
+        journal: Diario de una ejecución anterior a reanudar (None = nueva).
+        plan_path: Solo planificar y guardar el plan en este archivo.
+        plan: Plan a aplicar (sin descubrir repos ni calcular diffs).
+    """
     print(f"{Colors.CYAN}─── Ejecutando sincronización ───{Colors.END}")
     print()
 
+    cache = None
+    state_store = None
+    client = None
     try:
-        print_info("Conectando a GitHub...")
-        client = GitHubClient(token=config.token, timeout=config.timeout)
+        if journal is None and not (config.dry_run or plan_path or plan):
+            journal = RunJournal.start(RUNS_DIR, config)
+        if journal:
+            print_info(f"Ejecución {journal.run_id} (diario: {journal.path})")
 
-        print_info(f"Cargando workflows desde {config.org}/{config.source_repo}...")
-        service = WorkflowSyncService(client=client, config=config)
+        if config.cache_dir:
+            cache = HttpCache(
+                Path(config.cache_dir) / "http-cache.sqlite",
+                max_bytes=config.cache_max_mb * 1024 * 1024,
+            )
 
-        print_info(f"Buscando repos con topic '{config.topic}'...")
-        print()
+        print_info("Conectando a GitHub...")
+        if config.async_io:
+            client = AsyncGitHubClient(
+                token=config.token,
+                timeout=config.timeout,
+                cache=cache,
+            )
+        elif config.git_mirror_dir:
+            client = GitTransportClient(
+                token=config.token,
+                mirror_dir=config.git_mirror_dir,
+                timeout=config.timeout,
+                cache=cache,
+            )
+        else:
+            client = GitHubClient(token=config.token, timeout=config.timeout, cache=cache)
 
-        results = service.run(parallel=config.max_workers > 1)
+        if plan:
+            print_info(f"Aplicando plan: {len(plan.repos)} repo(s) con cambios...")
+        elif config.source_mode == SourceMode.LOCAL:
+            print_info(f"Cargando workflows desde {config.source_path}...")
+        else:
+            print_info(f"Cargando workflows desde {config.org}/{config.source_repo}...")
+        if config.state_path:
+            state_store = SyncStateStore(config.state_path)
+        service = WorkflowSyncService(
+            client=client, config=config, state_store=state_store, journal=journal
+        )
+
+        parallel = config.max_workers > 1
+        if plan:
+            print()
+            results = service.apply_plan(plan, parallel=parallel)
+        else:
+            print_info(f"Buscando repos con topic '{config.topic}'...")
+            print()
+            if plan_path:
+                new_plan, results = service.plan(parallel=parallel)
+                new_plan.save(plan_path)
+            else:
+                results = service.run(parallel=parallel)
 
         # Mostrar resultados
         print()
@@ -410,6 +613,40 @@ def run_sync(config: SyncConfig) -> bool:
         print(f"  {Colors.RED}Errores:{Colors.END}         {len(errors)}")
         print()
 
+        if cache:
+            stats = cache.stats()
+            print_info(
+                f"Caché HTTP: {stats['hits']} acierto(s), {stats['misses']} fallo(s), "
+                f"{stats['entries']} entrada(s)"
+            )
+            print()
+
+        if service.stage_timings:
+            print_info("Tiempos por etapa:")
+            for timing in service.stage_timings.values():
+                print(
+                    f"    {timing.name:<8} workers={timing.workers:<3} "
+                    f"repos={timing.processed:<5} media={timing.mean_seconds:.2f}s "
+                    f"total={timing.busy_seconds:.1f}s"
+                )
+            print()
+
+        stats = service.diff_stats()
+        if stats["trees"]:
+            print_info(
+                f"Diff: {stats['trees']} árbol(es) de workflows distinto(s) para "
+                f"{stats['trees'] + stats['hits']} repo(s)"
+            )
+            print()
+
+        if state_store:
+            stats = state_store.stats()
+            print_info(
+                f"Incremental: {stats['skipped']} repo(s) sin cambios desde la "
+                f"última ejecución, {stats['entries']} en el estado"
+            )
+            print()
+
         if success:
             print(f"{Colors.GREEN}PRs creados:{Colors.END}")
             for r in success:
@@ -430,14 +667,252 @@ def run_sync(config: SyncConfig) -> bool:
                 print(f"  ⏭ {r.repo_name}: {r.message}")
             print()
 
+        if plan_path:
+            print_success(
+                f"Plan guardado en {plan_path}: {len(new_plan.repos)} repo(s) con cambios"
+            )
+            print_info(f"Para aplicarlo: python -m workflow_sync --apply {plan_path}")
+            print()
+
         return len(errors) == 0
 
+    except KeyboardInterrupt:
+        if journal:
+            print()
+            print_warning(
+                f"Ejecución interrumpida. Para continuar: "
+                f"python -m workflow_sync --resume {journal.run_id}"
+            )
+        raise
     except WorkflowSyncError as e:
         print_error(f"Error de sincronización: {e}")
         return False
     except Exception as e:
         print_error(f"Error inesperado: {e}")
         return False
+    finally:
+        if client:
+            client.close()
+        if cache:
+            cache.close()
+        if state_store:
+            state_store.close()
+        if journal:
+            journal.close()
+
+
+# ─── Reanudación ────────────────────────────────────────────────────────────
+
+
+def resume_run(token: str, run_id: str | None = None) -> bool:
+    """Reanuda una ejecución a partir de su diario.
+
+    Args:
+        token: Token de GitHub.
+        run_id: Ejecución a reanudar (None = preguntar, por defecto la última).
+    """
+    if run_id is None:
+        runs = RunJournal.list_runs(RUNS_DIR)
+        if not runs:
+            print_warning("No hay ejecuciones registradas")
+            return False
+        print()
+        print_info("Ejecuciones recientes: " + ", ".join(runs[:5]))
+        run_id = prompt("Ejecución a reanudar", default=runs[0])
+
+    try:
+        journal = RunJournal.open(RUNS_DIR, run_id)
+    except WorkflowSyncError as e:
+        print_error(str(e))
+        return False
+
+    config = journal.config(token)
+    show_summary(config)
+    return run_sync(config, journal=journal)
+
+
+def apply_plan(token: str, plan_path: str) -> bool:
+    """Aplica un plan guardado con --plan.
+
+    Args:
+        token: Token de GitHub.
+        plan_path: Archivo del plan.
+    """
+    try:
+        plan = SyncPlan.load(plan_path, token)
+    except WorkflowSyncError as e:
+        print_error(str(e))
+        return False
+
+    show_summary(plan.config)
+    return run_sync(plan.config, plan=plan)
+
+
+# ─── Limpieza de branches ───────────────────────────────────────────────────
+
+
+def run_branch_gc(
+    token: str,
+    org: str,
+    topic: str,
+    dry_run: bool,
+    workers: int = 8,
+    discovery: DiscoveryMode = DiscoveryMode.SEARCH,
+) -> bool:
+    """Elimina los branches de sync sin PR abierto en los repos con el topic.
+
+    Args:
+        token: Token de GitHub.
+        org: Organización.
+        topic: Topic de los repos a revisar.
+        dry_run: Solo listar los branches que se eliminarían.
+        workers: Eliminaciones en paralelo.
+        discovery: Cómo se descubren los repos (búsqueda o listado de la org).
+    """
+    print(f"{Colors.CYAN}─── Limpieza de branches de sync ───{Colors.END}")
+    print()
+
+    client = None
+    try:
+        client = GitHubClient(token=token)
+        prefix = WorkflowSyncService.BRANCH_PREFIX
+        print_info(f"Buscando branches {prefix}* en repos con topic '{topic}'...")
+        report = BranchGarbageCollector(client, workers=workers, discovery=discovery).collect(
+            org, topic, prefix, dry_run=dry_run
+        )
+
+        print()
+        label = "A eliminar:" if dry_run else "Eliminados:"
+        print(f"  {Colors.GREEN}{label:<17}{Colors.END}{len(report.deleted)}")
+        print(f"  {Colors.BLUE}Con PR abierto:{Colors.END}  {len(report.kept)}")
+        print(f"  {Colors.RED}Errores:{Colors.END}         {len(report.failed)}")
+        print(f"  Repos revisados: {report.repos_scanned}")
+        print()
+
+        if dry_run and report.deleted:
+            for branch in report.deleted:
+                print(f"  - {branch.repo}: {branch.name} ({branch.sha[:7]})")
+            print()
+
+        if report.failed:
+            print(f"{Colors.RED}No se pudieron eliminar:{Colors.END}")
+            for branch in report.failed:
+                print(f"  ✗ {branch.repo}: {branch.name}")
+            print()
+
+        return not report.failed
+
+    except WorkflowSyncError as e:
+        print_error(f"Error: {e}")
+        return False
+    except Exception as e:
+        print_error(f"Error inesperado: {e}")
+        return False
+    finally:
+        if client:
+            client.close()
+
+
+def get_gc_options() -> tuple[str, str, bool, DiscoveryMode] | None:
+    """Solicita organización, topic, modo dry run y descubrimiento para la limpieza."""
+    print()
+    org = prompt("Organización de GitHub")
+    topic = prompt("Topic para filtrar repositorios")
+    try:
+        InputValidator.validate_organization(org)
+        InputValidator.validate_topic(topic)
+    except ValidationError as e:
+        print_error(str(e))
+        return None
+
+    dry_run = prompt_yes_no("Dry run (solo listar los branches)", default=True)
+    org_listing = prompt_yes_no(
+        "Listar todos los repos de la org (sin el límite de 1.000 de la búsqueda)",
+        default=False,
+    )
+    print()
+    discovery = DiscoveryMode.ORG_LISTING if org_listing else DiscoveryMode.SEARCH
+    return org, topic, dry_run, discovery
+
+
+# ─── Informe de drift ───────────────────────────────────────────────────────
+
+
+def run_drift_report(
+    token: str,
+    org: str,
+    topic: str,
+    source_repo: str,
+    output: str,
+    files_filter: list[str] | None = None,
+) -> bool:
+    """Genera el informe de drift de los repos con el topic.
+
+    Args:
+        token: Token de GitHub.
+        org: Organización.
+        topic: Topic de los repos destino.
+        source_repo: Repo fuente (sin org).
+        output: Archivo de salida (.json = JSON, cualquier otro = CSV).
+        files_filter: Workflows a comparar (vacío = todos).
+    """
+    print(f"{Colors.CYAN}─── Informe de drift ───{Colors.END}")
+    print()
+
+    client = None
+    try:
+        client = GitHubClient(token=token)
+        print_info(f"Comparando repos con topic '{topic}' con {org}/{source_repo}...")
+        report = DriftReporter(client).build(org, topic, source_repo, files_filter)
+        DriftReporter.write(report, output)
+
+        print()
+        print(
+            f"  {'Workflow':<30} {'idéntico':>9} {'distinto':>9} "
+            f"{'ausente':>9} {'sobrante':>9}"
+        )
+        for name, counts in report.summary().items():
+            print(
+                f"  {name:<30} "
+                + " ".join(f"{counts[state]:>9}" for state in DriftState)
+            )
+        print()
+        print(
+            f"  Repos desactualizados: {len(report.drifted_repos)} de {len(report.matrix)}"
+            f" ({len(report.repos_without_workflows)} sin carpeta de workflows)"
+        )
+        print()
+        print_success(f"Informe guardado en {output}")
+        return True
+
+    except WorkflowSyncError as e:
+        print_error(f"Error: {e}")
+        return False
+    except Exception as e:
+        print_error(f"Error inesperado: {e}")
+        return False
+    finally:
+        if client:
+            client.close()
+
+
+def get_drift_options() -> tuple[str, str, str, str] | None:
+    """Solicita organización, topic, repo fuente y archivo de salida del informe."""
+    print()
+    org = prompt("Organización de GitHub")
+    topic = prompt("Topic para filtrar repositorios")
+    source_repo = prompt("Repositorio fuente (sin org)")
+    try:
+        InputValidator.validate_organization(org)
+        InputValidator.validate_topic(topic)
+        InputValidator.validate_repository(source_repo)
+    except ValidationError as e:
+        print_error(str(e))
+        return None
+
+    output = prompt("Archivo de salida (.csv o .json)", default="drift.csv")
+    print()
+    return org, topic, source_repo, output
 
 
 # ─── Main ───────────────────────────────────────────────────────────────────
@@ -478,6 +953,65 @@ def main():
                 print()
                 input("Presiona Enter para continuar...")
 
+            elif choice == "resume":
+                if not current_token:
+                    print()
+                    current_token = get_token()
+                    if not current_token:
+                        print()
+                        print_error("Se requiere un token para continuar")
+                        input("Presiona Enter para continuar...")
+                        continue
+
+                success = resume_run(current_token)
+
+                print()
+                if success:
+                    print_success("Sincronización completada exitosamente")
+                else:
+                    print_warning("Sincronización completada con errores")
+
+                print()
+                input("Presiona Enter para continuar...")
+
+            elif choice == "gc":
+                if not current_token:
+                    print()
+                    current_token = get_token()
+                    if not current_token:
+                        print()
+                        print_error("Se requiere un token para continuar")
+                        input("Presiona Enter para continuar...")
+                        continue
+
+                options = get_gc_options()
+                if options:
+                    org, topic, dry_run, discovery = options
+                    if run_branch_gc(current_token, org, topic, dry_run, discovery=discovery):
+                        print_success("Limpieza completada")
+                    else:
+                        print_warning("Limpieza completada con errores")
+
+                print()
+                input("Presiona Enter para continuar...")
+
+            elif choice == "drift":
+                if not current_token:
+                    print()
+                    current_token = get_token()
+                    if not current_token:
+                        print()
+                        print_error("Se requiere un token para continuar")
+                        input("Presiona Enter para continuar...")
+                        continue
+
+                options = get_drift_options()
+                if options:
+                    run_drift_report(current_token, *options)
+
+                print()
+                input("Presiona Enter para continuar...")
+
             elif choice == "sync":
                 # Obtener token si no lo tenemos
                 if not current_token:
@@ -23,6 +23,58 @@ class SyncStatus(Enum):
     NO_CHANGES = "no_changes"
 
 
+class SourceMode(Enum):
+    """Formas de cargar los workflows del repositorio fuente."""
+
+    ARCHIVE = "archive"
+    API = "api"
+    LOCAL = "local"
+
+
+class MergeMode(Enum):
+    """Cómo se mergean los PRs en modo auto-merge."""
+
+    BLOCKING = "blocking"
+    NATIVE = "native"
+    WAIT_GREEN = "wait_green"
+
+
+class MergeState(Enum):
+    """Estado de merge de un PR."""
+
+    PENDING = "pending"
+    MERGEABLE = "mergeable"
+    CONFLICT = "conflict"
+    MERGED = "merged"
+    CLOSED = "closed"
+
+
+class ApiCallOutcome(Enum):
+    """Resultado de un intento de llamada a la API."""
+
+    OK = "ok"
+    CLIENT_ERROR = "client_error"
+    SERVER_ERROR = "server_error"
+    RATE_LIMITED = "rate_limited"
+    NETWORK_ERROR = "network_error"
+
+
+class DiscoveryMode(Enum):
+    """Estrategias para descubrir los repositorios destino."""
+
+    SEARCH = "search"
+    ORG_LISTING = "org_listing"
+
+
+class DriftState(Enum):
+    """Estado de un workflow de un repo destino respecto a la fuente."""
+
+    IDENTICAL = "identical"
+    DIFFERS = "differs"
+    MISSING = "missing"
+    EXTRA = "extra"
+
+
 @dataclass
 class SyncResult:
     """Resultado de sincronización para un repositorio.
@@ -62,6 +114,51 @@ class SyncConfig:
         max_workers: Número máximo de workers para procesamiento paralelo.
         timeout: Timeout para llamadas API en segundos.
         auto_merge: Si es True, mergea el PR automáticamente después de crearlo.
+        cache_dir: Directorio de la caché HTTP persistente (None = sin caché).
+        cache_max_mb: Tamaño máximo de la caché HTTP en MB.
+        async_io: Si es True, usa el transporte HTTP asíncrono (aiohttp):
+            los workers comparten un pool de conexiones keep-alive. No
+            cambia la estrategia ni la concurrencia, que sigue siendo la de
+            max_workers.
+        discovery: Cómo se descubren los repos destino. SEARCH usa la Search
+            API (máx. 1.000 resultados); ORG_LISTING recorre todos los repos
+            de la organización y filtra el topic localmente.
+        state_path: Archivo SQLite con el estado de la última sincronización
+            (None = sin modo incremental).
+        pipeline: Si es True (y hay paralelismo), procesa los repos en un
+            pipeline por etapas: lecturas con max_workers * 4 workers y
+            escrituras con max_workers.
+        adaptive_concurrency: Si es True (y hay paralelismo), ajusta los repos
+            en vuelo con AIMD partiendo de max_workers.
+        adaptive_max_workers: Techo de repos en vuelo en modo adaptativo.
+        source_mode: Cómo se cargan los workflows fuente. ARCHIVE descarga
+            el tarball en un único request; API lee archivo a archivo; LOCAL
+            los lee de un checkout en disco (source_path).
+        source_ref: Branch, tag o SHA de la fuente (None = branch por
+            defecto). Siempre se resuelve a un SHA antes de cargar.
+        source_path: Raíz del checkout local del repo fuente (modo LOCAL);
+            el commit fuente es su HEAD.
+        batched_prechecks: Si es True, las pre-verificaciones (HEAD, carpeta
+            de workflows y PRs de sync abiertos) se piden con GraphQL en
+            lotes de repos en lugar de con llamadas REST por repo.
+        git_mirror_dir: Directorio de clones parciales (`--filter=blob:none`)
+            de los repos destino. Si se indica, el contenido se lee y se
+            publica con git (un push por repo) y la API REST solo se usa
+            para descubrir repos, PRs y merges (None = todo por REST).
+        merge_mode: Cómo se mergea con auto_merge. BLOCKING mergea dentro
+            del worker; NATIVE activa el auto-merge de GitHub al crear el PR
+            y, si el repo no lo permite, lo encola en una cola de merge en
+            segundo plano; WAIT_GREEN espera a que los checks de todos los
+            PRs terminen (sondeo en lote) y mergea los que quedan en verde.
+        merge_workers: Hilos de la cola de merge en segundo plano.
+        source_range: Rango `base..head` de commits fuente. Si se indica,
+            solo se sincronizan los repos que usan algún workflow afectado
+            (directamente o a través de sus composite actions) por los
+            archivos cambiados en el rango; `head` fija la fuente si no hay
+            source_ref.
+        delta: Con source_range, el diff solo considera los workflows
+            añadidos, modificados o eliminados en el rango; el resto de
+            archivos del destino no se tocan.
     """
 
     token: str
@@ -73,6 +170,23 @@ class SyncConfig:
     max_workers: int = 4
     timeout: int = 30
     auto_merge: bool = False
+    cache_dir: str | None = None
+    cache_max_mb: int = 100
+    async_io: bool = False
+    discovery: DiscoveryMode = DiscoveryMode.SEARCH
+    state_path: str | None = None
+    pipeline: bool = False
+    adaptive_concurrency: bool = False
+    adaptive_max_workers: int = 32
+    source_mode: SourceMode = SourceMode.ARCHIVE
+    source_ref: str | None = None
+    source_path: str | None = None
+    batched_prechecks: bool = False
+    git_mirror_dir: str | None = None
+    merge_mode: MergeMode = MergeMode.BLOCKING
+    merge_workers: int = 4
+    source_range: str | None = None
+    delta: bool = False
 
 
 @dataclass
@@ -101,12 +215,17 @@ class FileChange:
 class RepositoryInfo:
     """Información básica de un repositorio.
 
+    Es el handle ligero con el que se identifica un repositorio en todo el
+    paquete: se construye a partir del payload de la API (búsqueda, listado)
+    sin peticiones adicionales.
+
     Attributes:
         name: Nombre del repositorio.
         full_name: Nombre completo (org/repo).
         default_branch: Branch por defecto.
         archived: Si el repositorio está archivado.
         has_push_permission: Si tenemos permisos de push.
+        topics: Topics del repositorio (si el payload los incluye).
     """
 
     name: str
@@ -114,3 +233,236 @@ class RepositoryInfo:
     default_branch: str
     archived: bool = False
     has_push_permission: bool = True
+    topics: list[str] = field(default_factory=list)
+
+
+@dataclass
+class RepoPrecheck:
+    """Datos de pre-verificación de un repo obtenidos en una consulta por lote.
+
+    Attributes:
+        head_sha: SHA del HEAD de la rama por defecto.
+        workflow_tree: {nombre: SHA del blob} de los workflows (None si la
+            carpeta no existe).
+        open_sync_prs: {branch: URL} de PRs abiertos con branch de sync (None
+            si el lote no pudo determinarlo y hay que consultarlo aparte).
+    """
+
+    head_sha: str | None
+    workflow_tree: dict[str, str] | None
+    open_sync_prs: dict[str, str] | None = None
+
+
+@dataclass
+class PullRequestStatus:
+    """Estado de checks, mergeabilidad y revisiones de un PR.
+
+    Attributes:
+        repo: Repositorio del PR (org/repo).
+        number: Número del PR.
+        url: URL del PR.
+        merge_state: Estado de merge.
+        checks: Estado agregado de los checks del último commit (SUCCESS,
+            PENDING, FAILURE, ERROR, EXPECTED) o None si aún no tiene checks.
+        review_decision: Decisión de revisión (APPROVED,
+            CHANGES_REQUESTED, REVIEW_REQUIRED) o None si no se requiere.
+        requires_checks: Si la rama base exige status checks para mergear.
+        draft: Si el PR es un borrador.
+    """
+
+    repo: str
+    number: int
+    url: str
+    merge_state: MergeState
+    checks: str | None = None
+    review_decision: str | None = None
+    requires_checks: bool = True
+    draft: bool = False
+
+    @property
+    def is_green(self) -> bool:
+        """Si el PR se puede mergear con todos los checks en verde.
+
+        Sin checks solo cuenta como verde si la rama base no exige ninguno:
+        justo después de abrir el PR GitHub aún no ha asociado los check
+        suites y el PR no debe mergearse antes de que corra la CI.
+        """
+        if self.merge_state != MergeState.MERGEABLE:
+            return False
+        if self.checks is None:
+            return not self.requires_checks
+        return self.checks == "SUCCESS"
+
+    @property
+    def is_failed(self) -> bool:
+        """Si el PR no llegará a verde sin intervención de una persona."""
+        return (
+            self.checks in ("FAILURE", "ERROR")
+            or self.merge_state in (MergeState.CONFLICT, MergeState.CLOSED)
+            or self.review_decision in ("CHANGES_REQUESTED", "REVIEW_REQUIRED")
+            or self.draft
+        )
+
+    @property
+    def is_settled(self) -> bool:
+        """Si el PR ya no está pendiente (verde, fallido o mergeado)."""
+        return self.is_green or self.is_failed or self.merge_state == MergeState.MERGED
+
+
+@dataclass(frozen=True)
+class BranchRef:
+    """Rama de un repositorio encontrada en un listado por lote.
+
+    Attributes:
+        repo: Repositorio de la rama (org/repo).
+        name: Nombre de la rama (sin refs/heads/).
+        sha: Commit al que apunta la rama.
+        has_open_pr: Si algún PR abierto usa la rama como head.
+    """
+
+    repo: str
+    name: str
+    sha: str
+    has_open_pr: bool = False
+
+
+@dataclass
+class BranchCleanupReport:
+    """Resultado de la limpieza de ramas de sincronización.
+
+    Attributes:
+        dry_run: Si solo se listaron las ramas sin eliminarlas.
+        repos_scanned: Repos revisados.
+        kept: Ramas conservadas por tener un PR abierto.
+        deleted: Ramas eliminadas (o que se eliminarían en dry run).
+        failed: Ramas que no se pudieron eliminar.
+    """
+
+    dry_run: bool = False
+    repos_scanned: int = 0
+    kept: list[BranchRef] = field(default_factory=list)
+    deleted: list[BranchRef] = field(default_factory=list)
+    failed: list[BranchRef] = field(default_factory=list)
+
+
+@dataclass
+class DriftReport:
+    """Matriz repo × workflow del drift de una organización.
+
+    Attributes:
+        source_repo: Repo fuente (org/repo).
+        source_shas: {workflow: SHA del blob} de la fuente.
+        matrix: {repo: {workflow: estado}}; solo incluye los workflows de la
+            fuente y los que sobran en el repo.
+        repos_without_workflows: Repos sin carpeta de workflows (no se
+            sincronizan).
+        generated_at: Epoch en que se generó el informe.
+    """
+
+    source_repo: str
+    source_shas: dict[str, str]
+    matrix: dict[str, dict[str, DriftState]] = field(default_factory=dict)
+    repos_without_workflows: list[str] = field(default_factory=list)
+    generated_at: float = 0.0
+
+    @property
+    def workflows(self) -> list[str]:
+        """Workflows de la fuente seguidos de los que solo existen en destinos."""
+        extra = {name for row in self.matrix.values() for name in row} - set(self.source_shas)
+        return sorted(self.source_shas) + sorted(extra)
+
+    @property
+    def drifted_repos(self) -> list[str]:
+        """Repos con al menos un workflow distinto, ausente o sobrante."""
+        return [
+            repo
+            for repo, row in self.matrix.items()
+            if any(state != DriftState.IDENTICAL for state in row.values())
+        ]
+
+    def summary(self) -> dict[str, dict[DriftState, int]]:
+        """Cuenta los repos de cada estado por workflow."""
+        counts: dict[str, dict[DriftState, int]] = {
+            name: {state: 0 for state in DriftState} for name in self.workflows
+        }
+        for row in self.matrix.values():
+            for name, state in row.items():
+                counts[name][state] += 1
+        return counts
+
+
+@dataclass
+class SyncJob:
+    """Estado de un repositorio a lo largo de las etapas de sincronización.
+
+    Cada etapa completa los campos que le corresponden; cuando una etapa
+    fija `result`, el repo sale del pipeline.
+
+    Attributes:
+        repo: Repositorio destino.
+        started_at: Epoch en que el repo entró al pipeline.
+        target_head: HEAD de la rama por defecto (solo en modo incremental).
+        changes: Cambios a aplicar, calculados en la etapa de diff.
+        commit_sha: Commit de sincronización escrito en la etapa apply.
+        branch_name: Branch creado con el commit de sincronización.
+        pr_url: URL del PR creado.
+        pr_number: Número del PR creado.
+        reuse_pr: Si el PR ya estaba abierto y su branch se reescribe con el
+            nuevo contenido.
+        base_sha: HEAD de la rama por defecto con el que se calcularon los
+            cambios de un plan; si la rama avanzó, el repo no se aplica.
+        result: Resultado final (None mientras el repo sigue en proceso).
+    """
+
+    repo: RepositoryInfo
+    started_at: float = 0.0
+    target_head: str | None = None
+    changes: list[FileChange] = field(default_factory=list)
+    commit_sha: str | None = None
+    branch_name: str | None = None
+    pr_url: str | None = None
+    pr_number: int | None = None
+    reuse_pr: bool = False
+    base_sha: str | None = None
+    result: SyncResult | None = None
+
+
+@dataclass
+class StageTiming:
+    """Tiempos acumulados de una etapa del pipeline de sincronización.
+
+    Attributes:
+        name: Nombre de la etapa.
+        workers: Workers asignados a la etapa.
+        processed: Repos que pasaron por la etapa.
+        busy_seconds: Tiempo total de trabajo (suma de todos los workers).
+        max_seconds: Duración máxima de un repo en la etapa.
+    """
+
+    name: str
+    workers: int
+    processed: int = 0
+    busy_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        """Duración media por repo."""
+        return self.busy_seconds / self.processed if self.processed else 0.0
+
+
+@dataclass
+class ApiCallEvent:
+    """Observación de un intento de llamada a la API (para los listeners).
+
+    Attributes:
+        operation: Nombre de la operación (ej: "get_ref(main)").
+        outcome: Resultado del intento.
+        duration_seconds: Duración del intento.
+        status: Código HTTP de error (si lo hubo).
+    """
+
+    operation: str
+    outcome: ApiCallOutcome
+    duration_seconds: float
+    status: int | None = None
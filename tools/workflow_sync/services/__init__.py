@@ -1,5 +1,28 @@
 """Módulo de servicios de negocio."""
 
+from .branch_gc import BranchGarbageCollector
+from .concurrency_controller import AdaptiveConcurrencyController
+from .dependency_graph import ActionDependencyGraph
+from .diff_cache import DiffCache
+from .drift_report import DriftReporter
+from .merge_queue import MergeQueue
+from .pr_poller import PullRequestPoller
+from .run_journal import RunJournal
+from .state_store import SyncStateStore
+from .sync_plan import PlannedRepo, SyncPlan
 from .sync_service import WorkflowSyncService
 
-__all__ = ["WorkflowSyncService"]
+__all__ = [
+    "ActionDependencyGraph",
+    "AdaptiveConcurrencyController",
+    "BranchGarbageCollector",
+    "DiffCache",
+    "DriftReporter",
+    "MergeQueue",
+    "PlannedRepo",
+    "PullRequestPoller",
+    "RunJournal",
+    "SyncPlan",
+    "SyncStateStore",
+    "WorkflowSyncService",
+]
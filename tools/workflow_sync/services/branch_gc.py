@@ -0,0 +1,135 @@
+"""
+Limpieza en lote de las ramas de sincronización sobrantes.
+
+Las ramas de sync que quedan tras un error o un PR cerrado sin mergear se
+acumulan en los repos. El recolector las lista en lote (una consulta por
+cada lote de repos), conserva las que respaldan un PR abierto y elimina el
+resto en paralelo, bajo el rate limiter compartido del cliente.
+
+Principio SOLID: Single Responsibility
+- Solo localiza y elimina ramas sobrantes; no sincroniza workflows.
+"""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterator
+
+import sys
+from pathlib import Path
+
+# Agregar directorio padre al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from models import BranchCleanupReport, BranchRef, DiscoveryMode, RepositoryInfo
+
+if TYPE_CHECKING:
+    from clients.github_client import IGitHubClient
+
+logger = logging.getLogger(__name__)
+
+
+class BranchGarbageCollector:
+    """Elimina las ramas de sync que no respaldan ningún PR abierto.
+
+    Attributes:
+        BATCH_SIZE: Repos cuyas ramas se listan antes de eliminar las del lote.
+    """
+
+    BATCH_SIZE = 200
+
+    def __init__(
+        self,
+        client: "IGitHubClient",
+        workers: int = 8,
+        discovery: DiscoveryMode = DiscoveryMode.SEARCH,
+    ) -> None:
+        """Inicializa el recolector.
+
+        Args:
+            client: Cliente de GitHub.
+            workers: Eliminaciones en paralelo.
+            discovery: Cómo se descubren los repos. SEARCH usa la Search API
+                (máx. 1.000 resultados); ORG_LISTING recorre toda la org.
+        """
+        self._client = client
+        self._workers = workers
+        self._discovery = discovery
+
+    def collect(
+        self,
+        org: str,
+        topic: str,
+        branch_prefix: str,
+        dry_run: bool = False,
+    ) -> BranchCleanupReport:
+        """Limpia las ramas con el prefijo en los repos de la org con el topic.
+
+        Args:
+            org: Organización.
+            topic: Topic de los repos a revisar.
+            branch_prefix: Prefijo de las ramas de sincronización.
+            dry_run: Solo informar qué ramas se eliminarían.
+        """
+        report = BranchCleanupReport(dry_run=dry_run)
+
+        with ThreadPoolExecutor(
+            max_workers=self._workers, thread_name_prefix="branch-gc"
+        ) as executor:
+            for repos in self._batches(org, topic):
+                report.repos_scanned += len(repos)
+                by_name = {repo.full_name: repo for repo in repos}
+
+                dead: list[BranchRef] = []
+                for branch in self._client.get_branches_with_prefix(repos, branch_prefix):
+                    if branch.has_open_pr:
+                        report.kept.append(branch)
+                    else:
+                        dead.append(branch)
+
+                if dry_run:
+                    report.deleted.extend(dead)
+                    continue
+
+                deleted = executor.map(
+                    lambda branch: self._delete(by_name[branch.repo], branch), dead
+                )
+                for branch, ok in zip(dead, deleted):
+                    (report.deleted if ok else report.failed).append(branch)
+
+        logger.info(
+            "Ramas de sync: %d %s, %d con PR abierto, %d fallida(s) en %d repo(s)",
+            len(report.deleted),
+            "a eliminar" if dry_run else "eliminada(s)",
+            len(report.kept),
+            len(report.failed),
+            report.repos_scanned,
+        )
+        return report
+
+    def _delete(self, repo: RepositoryInfo, branch: BranchRef) -> bool:
+        """Elimina una rama; los errores se informan en el reporte."""
+        try:
+            return self._client.delete_branch(repo, branch.name)
+        except Exception as e:
+            logger.warning("No se pudo eliminar %s en %s: %s", branch.name, repo.name, e)
+            return False
+
+    def _batches(self, org: str, topic: str) -> Iterator[list[RepositoryInfo]]:
+        """Entrega los repos con el topic en lotes (sin archivados: son de solo lectura)."""
+        if self._discovery == DiscoveryMode.ORG_LISTING:
+            discover = self._client.list_org_repositories_by_topic
+        else:
+            discover = self._client.search_repositories_by_topic
+
+        batch: list[RepositoryInfo] = []
+        for repo in discover(org, topic):
+            if repo.archived:
+                continue
+            batch.append(repo)
+            if len(batch) >= self.BATCH_SIZE:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
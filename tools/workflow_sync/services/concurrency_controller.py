@@ -0,0 +1,169 @@
+"""
+Control adaptativo de concurrencia (AIMD) para las estrategias de sync.
+
+Sube el número de repos en vuelo mientras GitHub responde bien y lo reduce a
+la mitad ante señales de saturación: errores 5xx, rate limits secundarios o
+latencias que crecen respecto a la referencia de cada operación.
+
+Principio SOLID: Single Responsibility
+- Solo decide cuántos repos pueden estar en vuelo.
+
+Principio SOLID: Open/Closed
+- Cualquier ISyncStrategy puede usarlo a través de acquire/release o slot().
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+import sys
+from pathlib import Path
+
+# Agregar directorio padre al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from models import ApiCallEvent, ApiCallOutcome
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveConcurrencyController:
+    """Límite de concurrencia AIMD alimentado por los call listeners del cliente.
+
+    - Incremento aditivo: +1 por cada `limit` llamadas correctas (≈ +1 por
+      ronda completa de repos en vuelo).
+    - Decremento multiplicativo: el límite se multiplica por
+      DECREASE_FACTOR ante 5xx, rate limits o latencia creciente, como
+      máximo una vez por COOLDOWN_SECONDS.
+    - La latencia se compara por tipo de operación (get_ref, create_pull...):
+      una media móvil rápida frente a la mejor media observada.
+    """
+
+    DECREASE_FACTOR = 0.5
+    COOLDOWN_SECONDS = 5.0
+    LATENCY_ALPHA = 0.2
+    LATENCY_TOLERANCE = 2.0
+    # Diferencia mínima para considerar que la latencia creció (ruido de red)
+    LATENCY_MIN_DELTA = 0.25
+    # Llamadas de una operación antes de usar su latencia como referencia
+    LATENCY_WARMUP = 5
+
+    def __init__(
+        self, initial: int = 4, min_limit: int = 1, max_limit: int = 32
+    ) -> None:
+        """Inicializa el controlador.
+
+        Args:
+            initial: Repos en vuelo al empezar.
+            min_limit: Límite mínimo.
+            max_limit: Límite máximo.
+        """
+        self._min_limit = min_limit
+        self._max_limit = max(max_limit, min_limit)
+        self._limit = float(min(max(initial, min_limit), self._max_limit))
+        self._in_flight = 0
+        self._last_decrease = 0.0
+        self._latency: dict[str, tuple[int, float, float]] = {}
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Número actual de repos que pueden estar en vuelo."""
+        return int(self._limit)
+
+    @property
+    def max_limit(self) -> int:
+        """Límite máximo (tamaño de pool necesario para alcanzarlo)."""
+        return self._max_limit
+
+    def acquire(self) -> None:
+        """Espera a que haya hueco bajo el límite actual y lo ocupa."""
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self) -> None:
+        """Libera un hueco ocupado con acquire."""
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Context manager que ocupa un hueco durante el bloque."""
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def observe(self, event: ApiCallEvent) -> None:
+        """Ajusta el límite con un intento de llamada (call listener del cliente)."""
+        if event.outcome == ApiCallOutcome.SERVER_ERROR:
+            self._decrease(f"error {event.status} en {event.operation}")
+        elif event.outcome == ApiCallOutcome.RATE_LIMITED:
+            self._decrease(f"rate limit en {event.operation}")
+        elif event.outcome == ApiCallOutcome.OK:
+            slow = self._track_latency(event)
+            if slow:
+                self._decrease(slow)
+            else:
+                self._increase()
+
+    def _increase(self) -> None:
+        """Incremento aditivo (≈ +1 por ronda de llamadas)."""
+        with self._condition:
+            if self._limit >= self._max_limit:
+                return
+            before = int(self._limit)
+            self._limit = min(self._limit + 1 / max(self._limit, 1.0), self._max_limit)
+            if int(self._limit) > before:
+                logger.info(
+                    "Concurrencia %d → %d (respuestas sanas)", before, int(self._limit)
+                )
+                self._condition.notify_all()
+
+    def _decrease(self, reason: str) -> None:
+        """Decremento multiplicativo, como máximo una vez por cooldown."""
+        with self._condition:
+            now = time.time()
+            if now - self._last_decrease < self.COOLDOWN_SECONDS:
+                return
+            before = int(self._limit)
+            self._limit = max(self._limit * self.DECREASE_FACTOR, self._min_limit)
+            self._last_decrease = now
+            if int(self._limit) < before:
+                logger.warning(
+                    "Concurrencia %d → %d (%s)", before, int(self._limit), reason
+                )
+
+    def _track_latency(self, event: ApiCallEvent) -> str | None:
+        """Actualiza la latencia de la operación.
+
+        Returns:
+            Motivo de reducción si la latencia creció, None en otro caso.
+        """
+        kind = re.split(r"[(\[]", event.operation, maxsplit=1)[0]
+        with self._condition:
+            count, ewma, best = self._latency.get(
+                kind, (0, event.duration_seconds, float("inf"))
+            )
+            count += 1
+            ewma += self.LATENCY_ALPHA * (event.duration_seconds - ewma)
+            if count >= self.LATENCY_WARMUP:
+                best = min(best, ewma)
+            self._latency[kind] = (count, ewma, best)
+
+        if (
+            count > self.LATENCY_WARMUP
+            and ewma > best * self.LATENCY_TOLERANCE
+            and ewma - best > self.LATENCY_MIN_DELTA
+        ):
+            return f"latencia de {kind} {ewma:.2f}s (referencia {best:.2f}s)"
+        return None
@@ -0,0 +1,161 @@
+"""
+Grafo de dependencias entre los workflows fuente y sus composite actions.
+
+Los workflows sincronizados llaman a composite actions del propio repo
+fuente (`<org>/<repo>/actions/<action>@<ref>`), que a su vez llaman a
+actions internas (`<org>/<repo>/internal/<action>@<ref>`). A partir de los
+archivos cambiados entre dos commits fuente, el grafo calcula qué workflows
+se ven afectados (directa o transitivamente), de modo que un cambio
+pequeño en la plantilla solo toca los repos que lo usan.
+
+Principio SOLID: Single Responsibility
+- Solo modela las dependencias; qué repos sincronizar lo decide el
+  servicio.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Mapping
+
+import sys
+
+# Agregar directorio padre al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from .source_loader import ACTION_DIRS
+
+
+class ActionDependencyGraph:
+    """Dependencias entre workflows y composite actions del repo fuente.
+
+    Los nodos son rutas del repo fuente: `<carpeta de workflows>/<nombre>`
+    para los workflows y `<carpeta>/<action>` para las actions. Solo se
+    siguen las referencias al propio repo fuente; las actions de terceros
+    no cambian con la plantilla.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, workflows_path: str, dependencies: Mapping[str, Iterable[str]]) -> None:
+        """Inicializa el grafo.
+
+        Args:
+            workflows_path: Carpeta de workflows en el repo fuente.
+            dependencies: {nodo: nodos que usa}.
+        """
+        self._workflows_path = workflows_path.strip("/")
+        self._dependencies = {node: frozenset(deps) for node, deps in dependencies.items()}
+        self._dependents: dict[str, set[str]] = {}
+        for node, deps in self._dependencies.items():
+            for dep in deps:
+                self._dependents.setdefault(dep, set()).add(node)
+
+    @classmethod
+    def build(
+        cls,
+        source_full_name: str,
+        workflows_path: str,
+        workflows: Mapping[str, str],
+        actions: Mapping[str, str],
+    ) -> ActionDependencyGraph:
+        """Construye el grafo analizando los `uses:` de workflows y actions.
+
+        Args:
+            source_full_name: Repo fuente (org/repo).
+            workflows_path: Carpeta de workflows en el repo fuente.
+            workflows: {nombre: contenido} de los workflows.
+            actions: {carpeta/action: contenido del action.yml}.
+        """
+        workflows_path = workflows_path.strip("/")
+        uses = re.compile(
+            r"^\s*(?:-\s*)?uses:\s*['\"]?"
+            + re.escape(source_full_name)
+            + r"/((?:" + "|".join(ACTION_DIRS) + r")/[\w.-]+"
+            + r"|" + re.escape(workflows_path) + r"/[\w.-]+)@",
+            re.IGNORECASE | re.MULTILINE,
+        )
+
+        sources = {f"{workflows_path}/{name}": content for name, content in workflows.items()}
+        sources.update(actions)
+        return cls(
+            workflows_path,
+            {node: set(uses.findall(content)) - {node} for node, content in sources.items()},
+        )
+
+    @property
+    def nodes(self) -> list[str]:
+        """Workflows y actions del grafo."""
+        return sorted(self._dependencies)
+
+    def dependencies(self, node: str) -> frozenset[str]:
+        """Nodos que usa directamente un nodo."""
+        return self._dependencies.get(node, frozenset())
+
+    def affected_workflows(self, changed_files: Iterable[str]) -> set[str]:
+        """Workflows afectados por los archivos cambiados.
+
+        Un workflow está afectado si cambió su archivo o si usa, directa o
+        transitivamente, una action con algún archivo cambiado. Los
+        archivos fuera de workflows y actions (README, herramientas...) no
+        afectan a ninguno.
+
+        Returns:
+            Nombres de los workflows afectados (también los eliminados).
+        """
+        pending = [node for node in map(self._node_of, changed_files) if node]
+        affected = set(pending)
+        while pending:
+            for dependent in self._dependents.get(pending.pop(), ()):
+                if dependent not in affected:
+                    affected.add(dependent)
+                    pending.append(dependent)
+
+        prefix = f"{self._workflows_path}/"
+        return {node[len(prefix):] for node in affected if node.startswith(prefix)}
+
+    def save(self, path: str | Path) -> None:
+        """Guarda el grafo en JSON (escritura atómica)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": self.FORMAT_VERSION,
+                    "workflows_path": self._workflows_path,
+                    "dependencies": {
+                        node: sorted(deps) for node, deps in sorted(self._dependencies.items())
+                    },
+                },
+                f,
+                indent=2,
+            )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> ActionDependencyGraph | None:
+        """Carga un grafo guardado (None si no existe o no es válido)."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        if data.get("version") != cls.FORMAT_VERSION:
+            return None
+        return cls(data["workflows_path"], data["dependencies"])
+
+    def _node_of(self, changed_file: str) -> str | None:
+        """Nodo al que pertenece un archivo cambiado (None si no es de ninguno)."""
+        parent, _, _ = changed_file.rpartition("/")
+        if parent == self._workflows_path:
+            return changed_file
+
+        parts = changed_file.split("/")
+        if len(parts) >= 3 and parts[0] in ACTION_DIRS:
+            return f"{parts[0]}/{parts[1]}"
+        return None
@@ -0,0 +1,76 @@
+"""
+Caché de diffs por árbol de workflows del destino.
+
+La mayoría de los repos destino tienen la carpeta de workflows idéntica
+(normalmente la versión anterior de la plantilla). Como la fuente es la
+misma durante toda la ejecución, los cambios necesarios dependen solo del
+árbol del destino: se calculan una vez por árbol distinto y el resto de
+repos con ese árbol reutiliza el resultado.
+
+Principio SOLID: Single Responsibility
+- Solo memoiza resultados por clave; cómo se calcula el diff lo decide el
+  servicio.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Callable
+
+import sys
+from pathlib import Path
+
+# Agregar directorio padre al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from models import FileChange
+
+
+class DiffCache:
+    """Memoización segura entre hilos con un único cálculo por clave.
+
+    Si varios hilos piden a la vez una clave sin resultado, solo uno lo
+    calcula y los demás esperan a que termine. Los errores no se guardan:
+    el siguiente que pida la clave vuelve a intentarlo.
+    """
+
+    def __init__(self) -> None:
+        self._results: dict[str, tuple[FileChange, ...]] = {}
+        self._key_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+
+    def get_or_compute(
+        self, key: str, compute: Callable[[], list[FileChange]]
+    ) -> list[FileChange]:
+        """Retorna los cambios de la clave, calculándolos si aún no existen.
+
+        Args:
+            key: Huella del árbol de workflows del destino.
+            compute: Función que calcula los cambios.
+
+        Returns:
+            Copia de la lista de cambios (los FileChange se comparten).
+        """
+        with self._lock:
+            if key in self._results:
+                self._hits += 1
+                return list(self._results[key])
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                if key in self._results:
+                    self._hits += 1
+                    return list(self._results[key])
+
+            changes = compute()
+            with self._lock:
+                self._results[key] = tuple(changes)
+                self._key_locks.pop(key, None)
+            return list(changes)
+
+    def stats(self) -> dict[str, int]:
+        """Retorna {trees: diffs calculados, hits: diffs reutilizados}."""
+        with self._lock:
+            return {"trees": len(self._results), "hits": self._hits}
@@ -0,0 +1,216 @@
+"""
+Informe de drift de workflows de toda una organización.
+
+Construye una matriz repo × workflow (idéntico, distinto, ausente o
+sobrante) comparando solo SHAs de blob: los destinos se listan por
+páginas y sus carpetas de workflows se leen con las pre-verificaciones en
+lote, sin descargar ningún contenido. Con el listado de la org cuesta unas
+tres peticiones por cada 100 repos.
+
+Principio SOLID: Single Responsibility
+- Solo mide el drift; no modifica ningún repo.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import os
+import time
+from typing import TYPE_CHECKING, Iterator
+
+import sys
+from pathlib import Path
+
+# Agregar directorio padre al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from exceptions import SourceRepoError
+from models import DiscoveryMode, DriftReport, DriftState, RepositoryInfo
+
+from .sync_service import WorkflowSyncService
+
+if TYPE_CHECKING:
+    from clients.github_client import IGitHubClient
+
+logger = logging.getLogger(__name__)
+
+
+class DriftReporter:
+    """Genera y exporta el informe de drift de los repos con un topic.
+
+    Attributes:
+        BATCH_SIZE: Repos por consulta de pre-verificación.
+    """
+
+    BATCH_SIZE = 50
+
+    def __init__(
+        self,
+        client: "IGitHubClient",
+        discovery: DiscoveryMode = DiscoveryMode.ORG_LISTING,
+    ) -> None:
+        """Inicializa el generador.
+
+        Args:
+            client: Cliente de GitHub.
+            discovery: Cómo se descubren los repos (por defecto el listado
+                de la org, sin el tope ni el rate limit de la Search API).
+        """
+        self._client = client
+        self._discovery = discovery
+
+    def build(
+        self,
+        org: str,
+        topic: str,
+        source_repo: str,
+        files_filter: list[str] | None = None,
+        source_ref: str | None = None,
+    ) -> DriftReport:
+        """Compara los workflows de los repos con el topic con los de la fuente.
+
+        Args:
+            org: Organización.
+            topic: Topic de los repos destino.
+            source_repo: Repo fuente (sin org).
+            files_filter: Workflows a comparar (vacío = todos).
+            source_ref: Branch, tag o SHA de la fuente (None = por defecto).
+
+        Raises:
+            SourceRepoError: Si la fuente no tiene workflows.
+        """
+        path = WorkflowSyncService.WORKFLOWS_PATH
+        source = self._client.get_repository(f"{org}/{source_repo}")
+        source_shas = self._client.get_workflow_tree(source, path, ref=source_ref) or {}
+        if files_filter:
+            source_shas = {k: v for k, v in source_shas.items() if k in files_filter}
+        if not source_shas:
+            raise SourceRepoError(f"No se encontraron workflows en {path}")
+
+        report = DriftReport(
+            source_repo=source.full_name,
+            source_shas=source_shas,
+            generated_at=time.time(),
+        )
+        for repos in self._batches(org, topic, source.full_name):
+            for repo, tree in self._workflow_trees(repos):
+                if tree is None:
+                    report.repos_without_workflows.append(repo.full_name)
+                else:
+                    report.matrix[repo.full_name] = self._compare(source_shas, tree)
+
+        logger.info(
+            "Drift: %d de %d repo(s) desactualizado(s), %d sin carpeta de workflows",
+            len(report.drifted_repos),
+            len(report.matrix),
+            len(report.repos_without_workflows),
+        )
+        return report
+
+    @staticmethod
+    def write(report: DriftReport, path: str | Path) -> None:
+        """Exporta el informe a JSON (extensión .json) o CSV (el resto).
+
+        El CSV tiene una fila por repo, una columna por workflow y la
+        columna `drift` con el número de workflows que no son idénticos.
+        """
+        path = Path(path)
+        workflows = report.workflows
+        tmp = path.with_name(f".{path.name}.tmp")
+
+        with open(tmp, "w", encoding="utf-8", newline="") as f:
+            if path.suffix.lower() == ".json":
+                json.dump(
+                    {
+                        "source_repo": report.source_repo,
+                        "generated_at": report.generated_at,
+                        "workflows": workflows,
+                        "summary": {
+                            name: {state.value: n for state, n in counts.items()}
+                            for name, counts in report.summary().items()
+                        },
+                        "repos": {
+                            repo: {name: state.value for name, state in row.items()}
+                            for repo, row in sorted(report.matrix.items())
+                        },
+                        "repos_without_workflows": sorted(report.repos_without_workflows),
+                    },
+                    f,
+                    ensure_ascii=False,
+                    indent=2,
+                )
+            else:
+                writer = csv.writer(f)
+                writer.writerow(["repo", *workflows, "drift"])
+                for repo, row in sorted(report.matrix.items()):
+                    writer.writerow(
+                        [
+                            repo,
+                            *(row[name].value if name in row else "" for name in workflows),
+                            sum(1 for state in row.values() if state != DriftState.IDENTICAL),
+                        ]
+                    )
+        os.replace(tmp, path)
+
+    @staticmethod
+    def _compare(
+        source_shas: dict[str, str], tree: dict[str, str]
+    ) -> dict[str, DriftState]:
+        """Estado de cada workflow de un repo a partir de los SHAs de blob."""
+        row = {}
+        for name, sha in source_shas.items():
+            if name not in tree:
+                row[name] = DriftState.MISSING
+            elif tree[name] == sha:
+                row[name] = DriftState.IDENTICAL
+            else:
+                row[name] = DriftState.DIFFERS
+        for name in tree.keys() - source_shas.keys():
+            row[name] = DriftState.EXTRA
+        return row
+
+    def _workflow_trees(
+        self, repos: list[RepositoryInfo]
+    ) -> Iterator[tuple[RepositoryInfo, dict[str, str] | None]]:
+        """Entrega el árbol de workflows de cada repo de un lote.
+
+        Si la consulta en lote falla o no incluye algún repo, ese repo se
+        lista con la llamada individual.
+        """
+        path = WorkflowSyncService.WORKFLOWS_PATH
+        try:
+            prechecks = self._client.get_repo_prechecks(
+                repos, path, WorkflowSyncService.BRANCH_PREFIX
+            )
+        except Exception as e:
+            logger.warning("Pre-verificación en lote fallida (%s); se lista repo a repo", e)
+            prechecks = {}
+
+        for repo in repos:
+            precheck = prechecks.get(repo.full_name)
+            if precheck:
+                yield repo, precheck.workflow_tree
+            else:
+                yield repo, self._client.get_workflow_tree(repo, path)
+
+    def _batches(
+        self, org: str, topic: str, source_full_name: str
+    ) -> Iterator[list[RepositoryInfo]]:
+        """Entrega los repos destino en lotes (sin archivados, vacíos ni la fuente)."""
+        if self._discovery == DiscoveryMode.ORG_LISTING:
+            discover = self._client.list_org_repositories_by_topic
+        else:
+            discover = self._client.search_repositories_by_topic
+
+        batch: list[RepositoryInfo] = []
+        for repo in discover(org, topic):
+            if repo.archived or not repo.default_branch or repo.full_name == source_full_name:
+                continue
+            batch.append(repo)
+            if len(batch) >= self.BATCH_SIZE:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
@@ -0,0 +1,131 @@
+"""
+Cola de merge en segundo plano para los PRs de sincronización.
+
+Los workers de sincronización encolan el PR y pasan al siguiente repo; un
+pool propio consulta el estado de merge de cada PR con espera exponencial
+y lo mergea cuando GitHub lo permite.
+
+Principio SOLID: Single Responsibility
+- Solo espera y mergea PRs ya creados; el resultado se entrega al servicio
+  mediante un callback.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable
+
+import sys
+from pathlib import Path
+
+# Agregar directorio padre al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from models import MergeState, SyncJob
+
+if TYPE_CHECKING:
+    from clients.github_client import IGitHubClient
+
+logger = logging.getLogger(__name__)
+
+
+class MergeQueue:
+    """Pool de merges con sondeo exponencial del estado de cada PR.
+
+    Cada PR se consulta primero a los INITIAL_DELAY segundos; la espera se
+    duplica en cada sondeo hasta MAX_DELAY. Si el PR no se puede mergear
+    antes de TIMEOUT segundos (checks pendientes, revisiones requeridas) se
+    deja abierto.
+    """
+
+    INITIAL_DELAY = 2.0
+    MAX_DELAY = 60.0
+    TIMEOUT = 900.0
+
+    def __init__(
+        self,
+        client: "IGitHubClient",
+        on_merged: Callable[[SyncJob, bool], None],
+        workers: int = 4,
+    ) -> None:
+        """Inicializa la cola.
+
+        Args:
+            client: Cliente de GitHub.
+            on_merged: Callback (job, mergeado) invocado al terminar cada PR.
+            workers: Hilos del pool de merge.
+        """
+        self._client = client
+        self._on_merged = on_merged
+        self._workers = workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._futures: list[Future] = []
+        self._lock = threading.Lock()
+
+    def submit(self, job: SyncJob) -> None:
+        """Encola el PR del job para mergearlo en segundo plano."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._workers, thread_name_prefix="merge-queue"
+                )
+            self._futures.append(self._executor.submit(self._process, job))
+        logger.debug("PR #%d de %s encolado para merge", job.pr_number, job.repo.name)
+
+    def drain(self) -> None:
+        """Espera a que terminen todos los merges encolados."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            pending, self._futures = self._futures, []
+        if executor is None:
+            return
+
+        if pending:
+            logger.info("Esperando %d merge(s) en cola...", len(pending))
+        executor.shutdown(wait=True)
+
+    def _process(self, job: SyncJob) -> None:
+        """Espera a que el PR sea mergeable, lo mergea e informa el resultado."""
+        try:
+            merged = self._wait_and_merge(job)
+        except Exception as e:
+            logger.warning(
+                "Error mergeando PR #%d en %s: %s", job.pr_number, job.repo.name, e
+            )
+            merged = False
+        self._on_merged(job, merged)
+
+    def _wait_and_merge(self, job: SyncJob) -> bool:
+        """Sondea el estado del PR con espera exponencial y lo mergea."""
+        deadline = time.time() + self.TIMEOUT
+        delay = self.INITIAL_DELAY
+
+        while True:
+            # GitHub calcula la mergeabilidad de forma asíncrona tras crear el PR
+            time.sleep(delay)
+            state = self._client.get_merge_state(job.repo, job.pr_number)
+            if state == MergeState.MERGED:
+                return True
+            if state == MergeState.MERGEABLE:
+                return self._client.merge_pull_request(job.repo, job.pr_number)
+            if state in (MergeState.CONFLICT, MergeState.CLOSED):
+                logger.warning(
+                    "PR #%d en %s no se puede mergear (%s)",
+                    job.pr_number,
+                    job.repo.name,
+                    state.value,
+                )
+                return False
+
+            if time.time() + delay > deadline:
+                logger.warning(
+                    "PR #%d en %s sigue pendiente tras %.0fs; se deja abierto",
+                    job.pr_number,
+                    job.repo.name,
+                    self.TIMEOUT,
+                )
+                return False
+            delay = min(delay * 2, self.MAX_DELAY)
@@ -0,0 +1,124 @@
+"""
+Sondeo en lote del estado de los PRs de sincronización.
+
+Consulta checks, mergeabilidad y revisiones de muchos PRs con una petición
+por página (ver IGitHubClient.get_pull_request_statuses) y solo vuelve a
+consultar los que siguen pendientes.
+
+Principio SOLID: Single Responsibility
+- Solo observa el estado de los PRs; qué hacer con él (mergear, informar)
+  lo decide quien lo usa.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING, Callable
+
+import sys
+from pathlib import Path
+
+# Agregar directorio padre al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from models import PullRequestStatus, RepositoryInfo
+
+if TYPE_CHECKING:
+    from clients.github_client import IGitHubClient
+
+logger = logging.getLogger(__name__)
+
+
+class PullRequestPoller:
+    """Sondea en lote el estado de un conjunto de PRs hasta que se resuelven.
+
+    La primera ronda espera INITIAL_INTERVAL y el intervalo se duplica hasta
+    MAX_INTERVAL; cada ronda cuesta una petición por página de PRs
+    pendientes.
+    """
+
+    INITIAL_INTERVAL = 10.0
+    MAX_INTERVAL = 60.0
+    TIMEOUT = 3600.0
+
+    def __init__(
+        self,
+        client: "IGitHubClient",
+        on_update: Callable[[PullRequestStatus], None] | None = None,
+        timeout: float = TIMEOUT,
+    ) -> None:
+        """Inicializa el poller.
+
+        Args:
+            client: Cliente de GitHub.
+            on_update: Callback invocado con cada estado que cambia.
+            timeout: Segundos máximos de espera en wait_until_settled.
+        """
+        self._client = client
+        self._on_update = on_update
+        self._timeout = timeout
+
+    def poll(
+        self, pulls: list[tuple[RepositoryInfo, int]]
+    ) -> dict[tuple[str, int], PullRequestStatus]:
+        """Consulta una vez el estado de los PRs (una petición por página)."""
+        return self._client.get_pull_request_statuses(pulls)
+
+    def wait_until_settled(
+        self, pulls: list[tuple[RepositoryInfo, int]]
+    ) -> dict[tuple[str, int], PullRequestStatus]:
+        """Sondea hasta que todos los PRs estén en verde, fallidos o mergeados.
+
+        Los PRs que esperan una revisión, son borradores o tienen cambios
+        solicitados cuentan como fallidos: no avanzan sin una persona.
+
+        Returns:
+            Último estado conocido de cada PR (los que agotan el timeout
+            quedan pendientes).
+        """
+        statuses: dict[tuple[str, int], PullRequestStatus] = {}
+        pending = list(pulls)
+        deadline = time.time() + self._timeout
+        interval = self.INITIAL_INTERVAL
+
+        while pending:
+            # Se espera antes de cada ronda: la primera da tiempo a GitHub para
+            # asociar los check suites a los PRs recién abiertos
+            if time.time() + interval > deadline:
+                logger.warning(
+                    "%d PR(s) siguen pendientes tras %.0fs", len(pending), self._timeout
+                )
+                break
+            time.sleep(interval)
+            interval = min(interval * 2, self.MAX_INTERVAL)
+
+            for key, status in self.poll(pending).items():
+                if statuses.get(key) != status and self._on_update:
+                    self._on_update(status)
+                statuses[key] = status
+
+            pending = [
+                (repo, number)
+                for repo, number in pending
+                if (repo.full_name, number) not in statuses
+                or not statuses[(repo.full_name, number)].is_settled
+            ]
+            self._log_progress(statuses, len(pending))
+
+
+        return statuses
+
+    @staticmethod
+    def _log_progress(
+        statuses: dict[tuple[str, int], PullRequestStatus], pending: int
+    ) -> None:
+        """Registra el resumen de una ronda de sondeo."""
+        green = sum(1 for s in statuses.values() if s.is_green)
+        failed = sum(1 for s in statuses.values() if s.is_failed)
+        logger.info(
+            "Estado de PRs: %d en verde, %d pendiente(s), %d fallido(s)",
+            green,
+            pending,
+            failed,
+        )
@@ -0,0 +1,320 @@
+"""
+Diario de ejecución (append-only) para reanudar sincronizaciones interrumpidas.
+
+Cada ejecución escribe un archivo JSON Lines con la configuración usada y,
+por cada repo, las transiciones de fase (commit escrito, branch creado, PR
+abierto, PR mergeado, resultado final). Cada línea se sincroniza a disco
+antes de continuar, así que tras un Ctrl-C, un corte de red o un crash el
+diario refleja exactamente hasta dónde llegó cada repo.
+
+Principio SOLID: Single Responsibility
+- Solo persiste y reconstruye el progreso de una ejecución.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+import sys
+
+# Agregar directorio padre al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from exceptions import WorkflowSyncError
+from models import (
+    DiscoveryMode,
+    MergeMode,
+    SourceMode,
+    SyncConfig,
+    SyncResult,
+    SyncStatus,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class JournalPhase(Enum):
+    """Fases de un repo registradas en el diario."""
+
+    FILES_WRITTEN = "files_written"
+    BRANCH_CREATED = "branch_created"
+    PR_OPENED = "pr_opened"
+    MERGED = "merged"
+    COMPLETED = "completed"
+
+
+@dataclass
+class JournalRepoState:
+    """Último estado conocido de un repo según el diario.
+
+    Attributes:
+        commit_sha: Commit de sincronización ya escrito.
+        files_updated: Archivos creados o actualizados en ese commit.
+        files_deleted: Archivos eliminados en ese commit.
+        branch_name: Branch creado apuntando al commit (o el del PR abierto
+            que se reutiliza, ya conocido al escribir el commit).
+        pr_url: URL del PR abierto.
+        pr_number: Número del PR abierto.
+        reuse_pr: Si el commit actualiza un PR de sync ya abierto en lugar
+            de abrir uno nuevo.
+        merged: Si el PR se mergeó.
+        result: Resultado final (si el repo terminó).
+    """
+
+    commit_sha: str | None = None
+    files_updated: list[str] = field(default_factory=list)
+    files_deleted: list[str] = field(default_factory=list)
+    branch_name: str | None = None
+    pr_url: str | None = None
+    pr_number: int | None = None
+    reuse_pr: bool = False
+    merged: bool = False
+    result: SyncResult | None = None
+
+
+class RunJournal:
+    """Diario de una ejecución, seguro para uso concurrente.
+
+    Se crea con `start` para una ejecución nueva o con `open` para
+    reanudar una existente; en ambos casos las nuevas entradas se añaden al
+    final del mismo archivo.
+    """
+
+    FORMAT_VERSION = 1
+    SUFFIX = ".jsonl"
+    # Campos de SyncConfig que se serializan por su valor
+    ENUM_FIELDS = {
+        "discovery": DiscoveryMode,
+        "source_mode": SourceMode,
+        "merge_mode": MergeMode,
+    }
+
+    def __init__(
+        self,
+        path: Path,
+        run_id: str,
+        header: dict[str, Any],
+        repos: dict[str, JournalRepoState] | None = None,
+    ) -> None:
+        """Inicializa el diario (usar `start` u `open`).
+
+        Args:
+            path: Archivo del diario.
+            run_id: Identificador de la ejecución.
+            header: Cabecera de la ejecución (configuración, huella fuente).
+            repos: Estado reconstruido de una ejecución anterior.
+        """
+        self._path = path
+        self._run_id = run_id
+        self._header = header
+        self._repos = repos or {}
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    @classmethod
+    def start(cls, directory: str | Path, config: SyncConfig) -> RunJournal:
+        """Crea el diario de una ejecución nueva.
+
+        Args:
+            directory: Directorio donde se guardan los diarios.
+            config: Configuración de la ejecución (el token no se guarda).
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        run_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{secrets.token_hex(2)}"
+        header = {
+            "event": "run_started",
+            "version": cls.FORMAT_VERSION,
+            "run_id": run_id,
+            "started_at": time.time(),
+            "config": cls.config_to_dict(config),
+        }
+
+        journal = cls(directory / f"{run_id}{cls.SUFFIX}", run_id, header)
+        journal._append(header)
+        return journal
+
+    @classmethod
+    def open(cls, directory: str | Path, run_id: str) -> RunJournal:
+        """Abre el diario de una ejecución anterior para reanudarla.
+
+        Args:
+            directory: Directorio donde se guardan los diarios.
+            run_id: Identificador de la ejecución.
+
+        Raises:
+            WorkflowSyncError: Si el diario no existe o no es válido.
+        """
+        path = Path(directory) / f"{run_id}{cls.SUFFIX}"
+        if not path.exists():
+            raise WorkflowSyncError(f"No existe la ejecución {run_id} en {directory}")
+
+        header: dict[str, Any] | None = None
+        repos: dict[str, JournalRepoState] = {}
+
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Última línea truncada por un crash: se ignora
+                    logger.warning("Entrada incompleta ignorada en %s", path.name)
+                    continue
+
+                if entry.get("event") == "run_started":
+                    header = entry
+                elif entry.get("event") == "source_loaded" and header is not None:
+                    header["source_fingerprint"] = entry["source_fingerprint"]
+                    header["source_commit_sha"] = entry.get("source_commit_sha")
+                elif entry.get("event") == "repo":
+                    cls._apply(repos.setdefault(entry["repo"], JournalRepoState()), entry)
+
+        if header is None or header.get("version") != cls.FORMAT_VERSION:
+            raise WorkflowSyncError(f"Diario de ejecución inválido: {path}")
+
+        logger.info(
+            "Reanudando ejecución %s: %d repo(s) con progreso registrado",
+            run_id,
+            len(repos),
+        )
+        journal = cls(path, run_id, header, repos)
+        journal._append({"event": "run_resumed", "resumed_at": time.time()})
+        return journal
+
+    @classmethod
+    def list_runs(cls, directory: str | Path) -> list[str]:
+        """Lista los identificadores de ejecución guardados (más reciente primero)."""
+        directory = Path(directory)
+        if not directory.exists():
+            return []
+        return sorted((p.stem for p in directory.glob(f"*{cls.SUFFIX}")), reverse=True)
+
+    @property
+    def run_id(self) -> str:
+        """Identificador de la ejecución."""
+        return self._run_id
+
+    @property
+    def path(self) -> Path:
+        """Archivo del diario."""
+        return self._path
+
+    @property
+    def source_fingerprint(self) -> str | None:
+        """Huella de los workflows fuente con la que se inició la ejecución."""
+        return self._header.get("source_fingerprint")
+
+    @property
+    def source_commit_sha(self) -> str | None:
+        """Commit fuente con el que se inició la ejecución (si se conoce)."""
+        return self._header.get("source_commit_sha")
+
+    def config(self, token: str) -> SyncConfig:
+        """Reconstruye la configuración de la ejecución con el token indicado."""
+        return self.config_from_dict(self._header["config"], token)
+
+    def state(self, repo: str) -> JournalRepoState | None:
+        """Retorna el último estado registrado de un repo (org/repo)."""
+        with self._lock:
+            return self._repos.get(repo)
+
+    def record_source(
+        self, source_fingerprint: str, source_commit_sha: str | None = None
+    ) -> None:
+        """Registra la huella (y el commit) de los workflows fuente de la ejecución."""
+        if self.source_fingerprint is None:
+            self._header["source_fingerprint"] = source_fingerprint
+            self._header["source_commit_sha"] = source_commit_sha
+            self._append(
+                {
+                    "event": "source_loaded",
+                    "source_fingerprint": source_fingerprint,
+                    "source_commit_sha": source_commit_sha,
+                }
+            )
+
+    def record(self, repo: str, phase: JournalPhase, **data: Any) -> None:
+        """Registra una transición de fase de un repo.
+
+        Args:
+            repo: Repo destino (org/repo).
+            phase: Fase alcanzada.
+            **data: Datos de la fase (commit_sha, branch_name, pr_url...).
+        """
+        entry = {"event": "repo", "repo": repo, "phase": phase.value, "ts": time.time(), **data}
+        with self._lock:
+            self._apply(self._repos.setdefault(repo, JournalRepoState()), entry)
+        self._append(entry)
+
+    def record_result(self, repo: str, result: SyncResult) -> None:
+        """Registra el resultado final de un repo."""
+        data = asdict(result)
+        data["status"] = result.status.value
+        self.record(repo, JournalPhase.COMPLETED, result=data)
+
+    def close(self) -> None:
+        """Cierra el archivo del diario."""
+        with self._lock:
+            self._file.close()
+
+    def _append(self, entry: dict[str, Any]) -> None:
+        """Añade una entrada y la sincroniza a disco antes de continuar."""
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    @staticmethod
+    def _apply(state: JournalRepoState, entry: dict[str, Any]) -> None:
+        """Aplica una entrada del diario al estado de un repo."""
+        phase = JournalPhase(entry["phase"])
+
+        if phase == JournalPhase.FILES_WRITTEN:
+            state.commit_sha = entry["commit_sha"]
+            state.files_updated = entry.get("files_updated", [])
+            state.files_deleted = entry.get("files_deleted", [])
+            # PR reutilizado: su branch y su número se conocen antes del commit
+            state.reuse_pr = entry.get("reuse_pr", False)
+            if state.reuse_pr:
+                state.branch_name = entry["branch_name"]
+                state.pr_url = entry["pr_url"]
+                state.pr_number = entry["pr_number"]
+        elif phase == JournalPhase.BRANCH_CREATED:
+            state.branch_name = entry["branch_name"]
+        elif phase == JournalPhase.PR_OPENED:
+            state.pr_url = entry["pr_url"]
+            state.pr_number = entry["pr_number"]
+        elif phase == JournalPhase.MERGED:
+            state.merged = True
+        elif phase == JournalPhase.COMPLETED:
+            data = dict(entry["result"])
+            data["status"] = SyncStatus(data["status"])
+            state.result = SyncResult(**data)
+
+    @classmethod
+    def config_to_dict(cls, config: SyncConfig) -> dict[str, Any]:
+        """Serializa la configuración sin el token."""
+        data = asdict(config)
+        data.pop("token")
+        for name in cls.ENUM_FIELDS:
+            data[name] = data[name].value
+        return data
+
+    @classmethod
+    def config_from_dict(cls, data: dict[str, Any], token: str) -> SyncConfig:
+        """Reconstruye una configuración serializada con el token indicado."""
+        data = dict(data)
+        for name, enum in cls.ENUM_FIELDS.items():
+            if name in data:
+                data[name] = enum(data[name])
+        return SyncConfig(token=token, **data)
@@ -0,0 +1,313 @@
+"""
+Cargadores de los workflows del repositorio fuente.
+
+Principio SOLID: Open/Closed
+- Nuevas formas de obtener la fuente se añaden implementando ISourceLoader,
+  sin modificar WorkflowSyncService.
+
+Principio SOLID: Liskov Substitution
+- Todos los cargadores retornan un SourceSnapshot equivalente.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import subprocess
+import tarfile
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Iterator, Mapping
+
+import sys
+from pathlib import Path
+
+# Agregar directorio padre al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from exceptions import SourceRepoError
+from utils import git_blob_sha
+
+if TYPE_CHECKING:
+    from clients.github_client import IGitHubClient
+
+logger = logging.getLogger(__name__)
+
+WORKFLOW_EXTENSIONS = (".yml", ".yaml")
+# Carpetas de composite actions del repo fuente (<carpeta>/<action>/action.yml)
+ACTION_DIRS = ("actions", "internal")
+ACTION_MANIFESTS = ("action.yml", "action.yaml")
+
+
+@dataclass(frozen=True)
+class SourceSnapshot:
+    """Workflows fuente fijados a un commit.
+
+    Attributes:
+        commit_sha: Commit del que provienen los workflows (None si se
+            desconoce, p. ej. al leerlos archivo a archivo por la API).
+        workflows: {nombre: contenido} de los workflows.
+        blob_shas: {nombre: SHA del blob} si el cargador ya los calculó a
+            partir de los bytes exactos (None = calcularlos del contenido).
+        actions: {carpeta/action: contenido de su action.yml} de las
+            composite actions del repo fuente (None si el cargador no las lee).
+    """
+
+    commit_sha: str | None
+    workflows: Mapping[str, str]
+    blob_shas: Mapping[str, str] | None = None
+    actions: Mapping[str, str] | None = None
+
+
+class ISourceLoader(ABC):
+    """Interfaz para cargar los workflows del repositorio fuente."""
+
+    @abstractmethod
+    def load(self, full_name: str, path: str) -> SourceSnapshot:
+        """Carga los workflows de `path` en el repositorio fuente.
+
+        Args:
+            full_name: Repositorio fuente (org/repo).
+            path: Carpeta de workflows dentro del repositorio.
+
+        Raises:
+            SourceRepoError: Si la carpeta de workflows no existe.
+        """
+        pass
+
+    @abstractmethod
+    def changed_files(self, full_name: str, base: str, head: str) -> list[str] | None:
+        """Rutas cambiadas en el repositorio fuente entre dos commits.
+
+        Returns:
+            Rutas relativas a la raíz, o None si no se pueden determinar
+            todas (p. ej. porque la comparación está truncada).
+        """
+        pass
+
+
+class ApiSourceLoader(ISourceLoader):
+    """Carga los workflows con la API de contenidos (una petición por archivo)."""
+
+    def __init__(self, client: "IGitHubClient") -> None:
+        self._client = client
+
+    def load(self, full_name: str, path: str) -> SourceSnapshot:
+        """Lista la carpeta y descarga cada workflow."""
+        repo = self._client.get_repository(full_name)
+        return SourceSnapshot(
+            commit_sha=None,
+            workflows=self._client.get_workflow_files(repo, path),
+        )
+
+    def changed_files(self, full_name: str, base: str, head: str) -> list[str] | None:
+        """Compara los commits con la API."""
+        repo = self._client.get_repository(full_name)
+        return self._client.compare_commits(repo, base, head)
+
+
+class ArchiveSourceLoader(ISourceLoader):
+    """Carga los workflows desde el tarball del repo fuente en un único request.
+
+    El ref se resuelve primero a un SHA y el tarball se pide en ese SHA, de
+    modo que todos los archivos provienen exactamente del mismo commit. El
+    archivo se procesa en streaming y en memoria: solo se leen los miembros
+    de la carpeta de workflows y los action.yml de las composite actions.
+    """
+
+    def __init__(self, client: "IGitHubClient", ref: str | None = None) -> None:
+        """Inicializa el cargador.
+
+        Args:
+            client: Cliente de GitHub.
+            ref: Branch, tag o SHA a cargar (None = branch por defecto).
+        """
+        self._client = client
+        self._ref = ref
+
+    def load(self, full_name: str, path: str) -> SourceSnapshot:
+        """Descarga el tarball en el commit resuelto y extrae los workflows."""
+        repo = self._client.get_repository(full_name)
+        commit_sha = self._client.resolve_commit_sha(
+            repo, self._ref or repo.default_branch
+        )
+        chunks = self._client.get_archive(repo, commit_sha)
+
+        workflows, actions = self._extract(_ChunkStream(chunks), path.strip("/"))
+        if workflows is None:
+            raise SourceRepoError(f"Workflows path not found: {path}")
+
+        logger.debug(
+            "Cargados %d workflow(s) de %s@%s desde el tarball",
+            len(workflows),
+            repo.full_name,
+            commit_sha[:7],
+        )
+        return SourceSnapshot(commit_sha=commit_sha, workflows=workflows, actions=actions)
+
+    def changed_files(self, full_name: str, base: str, head: str) -> list[str] | None:
+        """Compara los commits con la API."""
+        repo = self._client.get_repository(full_name)
+        return self._client.compare_commits(repo, base, head)
+
+    @staticmethod
+    def _extract(
+        stream: io.RawIOBase, path: str
+    ) -> tuple[dict[str, str] | None, dict[str, str]]:
+        """Extrae del tar.gz los workflows de primer nivel de `path` y las actions.
+
+        Returns:
+            ({nombre: contenido} o None si la carpeta no está en el archivo,
+            {carpeta/action: contenido del action.yml}).
+        """
+        workflows: dict[str, str] | None = None
+        actions: dict[str, str] = {}
+
+        # Modo "r|gz": lectura secuencial, sin buscar hacia atrás en el stream
+        with tarfile.open(fileobj=stream, mode="r|gz") as archive:
+            for member in archive:
+                # Los miembros vienen bajo un directorio raíz "<owner>-<repo>-<sha>/"
+                relative = member.name.partition("/")[2].rstrip("/")
+                parent, _, name = relative.rpartition("/")
+                action = _action_name(relative)
+                if action and member.isfile():
+                    content = archive.extractfile(member).read()
+                    actions[action] = content.decode("utf-8")
+                    continue
+                if relative != path and parent != path:
+                    continue
+
+                if workflows is None:
+                    workflows = {}
+
+                if parent == path and member.isfile() and name.endswith(WORKFLOW_EXTENSIONS):
+                    content = archive.extractfile(member).read()
+                    workflows[name] = content.decode("utf-8")
+
+        return workflows, actions
+
+
+class LocalSourceLoader(ISourceLoader):
+    """Carga los workflows desde un checkout local del repo fuente.
+
+    Pensado para ejecutar la sync en el CI del propio repo fuente: los
+    archivos ya están en disco, así que no se hace ninguna petición a la
+    API. Cada archivo se lee una sola vez y el SHA del blob se calcula sobre
+    los bytes leídos; el commit es el HEAD del checkout.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        """Inicializa el cargador.
+
+        Args:
+            root: Raíz del checkout local del repo fuente.
+        """
+        self._root = Path(root)
+
+    def load(self, full_name: str, path: str) -> SourceSnapshot:
+        """Lee los workflows de `path` en el checkout local."""
+        directory = self._root / path.strip("/")
+        if not directory.is_dir():
+            raise SourceRepoError(f"Workflows path not found: {directory}")
+
+        workflows: dict[str, str] = {}
+        blob_shas: dict[str, str] = {}
+        for file in sorted(directory.iterdir()):
+            if file.is_file() and file.name.endswith(WORKFLOW_EXTENSIONS):
+                data = file.read_bytes()
+                workflows[file.name] = data.decode("utf-8")
+                blob_shas[file.name] = git_blob_sha(data)
+
+        actions: dict[str, str] = {}
+        for folder in ACTION_DIRS:
+            for manifest in sorted((self._root / folder).glob("*/action.y*ml")):
+                action = _action_name(manifest.relative_to(self._root).as_posix())
+                if action:
+                    actions[action] = manifest.read_text(encoding="utf-8")
+
+        commit_sha = self._head_sha(path)
+        logger.debug(
+            "Cargados %d workflow(s) de %s@%s desde %s",
+            len(workflows),
+            full_name,
+            commit_sha[:7] if commit_sha else "?",
+            directory,
+        )
+        return SourceSnapshot(
+            commit_sha=commit_sha,
+            workflows=MappingProxyType(workflows),
+            blob_shas=MappingProxyType(blob_shas),
+            actions=MappingProxyType(actions),
+        )
+
+    def changed_files(self, full_name: str, base: str, head: str) -> list[str] | None:
+        """Compara los commits con git en el checkout (sin llamadas a la API)."""
+        try:
+            output = self._git("diff", "--name-only", "--no-renames", base, head)
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.warning("No se pudo comparar %s..%s en %s (%s)", base, head, self._root, e)
+            return None
+        return output.splitlines()
+
+    def _head_sha(self, path: str) -> str | None:
+        """SHA del HEAD del checkout (None si no es un repositorio git)."""
+        try:
+            commit_sha = self._git("rev-parse", "HEAD")
+            dirty = self._git("status", "--porcelain", "--", path.strip("/"))
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.warning(
+                "No se pudo obtener el commit de %s (%s); se sincroniza sin SHA fuente",
+                self._root,
+                e,
+            )
+            return None
+
+        if dirty:
+            logger.warning(
+                "Hay cambios sin commitear en %s; el contenido no coincide con %s",
+                path,
+                commit_sha[:7],
+            )
+        return commit_sha
+
+    def _git(self, *args: str) -> str:
+        """Ejecuta un comando git en el checkout y retorna su salida."""
+        result = subprocess.run(
+            ["git", "-C", str(self._root), *args],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout.strip()
+
+
+def _action_name(relative: str) -> str | None:
+    """Retorna `carpeta/action` si la ruta es el action.yml de una composite action."""
+    parts = relative.split("/")
+    if len(parts) == 3 and parts[0] in ACTION_DIRS and parts[2] in ACTION_MANIFESTS:
+        return f"{parts[0]}/{parts[1]}"
+    return None
+
+
+class _ChunkStream(io.RawIOBase):
+    """Adapta un iterador de bloques de bytes a un stream de solo lectura."""
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._buffer:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._buffer = chunk
+
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
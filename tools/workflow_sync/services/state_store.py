@@ -0,0 +1,136 @@
+"""
+Almacén de estado para sincronizaciones incrementales.
+
+Guarda, por repo destino, la huella de los workflows fuente con la que se
+verificó por última vez y el HEAD de su rama por defecto en ese momento. Si
+en la siguiente ejecución ninguno de los dos cambió, el repo sigue
+sincronizado y no hace falta inspeccionarlo de nuevo.
+
+Principio SOLID: Single Responsibility
+- Solo persiste y consulta el estado de la última sincronización.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class SyncStateStore:
+    """Estado de sincronización en disco (SQLite), seguro entre hilos.
+
+    Las claves combinan repo fuente y repo destino, de modo que un mismo
+    destino puede sincronizarse desde varias plantillas sin interferencias.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Inicializa el almacén.
+
+        Args:
+            path: Ruta del archivo SQLite (se crea si no existe).
+        """
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._skipped = 0
+
+        self._conn = sqlite3.connect(str(self._path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sync_state (
+                source TEXT NOT NULL,
+                target TEXT NOT NULL,
+                source_fingerprint TEXT NOT NULL,
+                target_head TEXT NOT NULL,
+                synced_at REAL NOT NULL,
+                PRIMARY KEY (source, target)
+            )
+            """
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def fingerprint(source_shas: dict[str, str]) -> str:
+        """Calcula una huella estable de los workflows fuente.
+
+        Args:
+            source_shas: {nombre: SHA del blob} de los workflows fuente.
+        """
+        digest = hashlib.sha256()
+        for name in sorted(source_shas):
+            digest.update(f"{name}\0{source_shas[name]}\n".encode())
+        return digest.hexdigest()
+
+    def is_unchanged(
+        self, source: str, target: str, source_fingerprint: str, target_head: str
+    ) -> bool:
+        """Indica si el destino sigue en el estado registrado tras la última sync.
+
+        Args:
+            source: Repo fuente (org/repo).
+            target: Repo destino (org/repo).
+            source_fingerprint: Huella actual de los workflows fuente.
+            target_head: SHA actual del HEAD de la rama por defecto del destino.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT source_fingerprint, target_head FROM sync_state "
+                "WHERE source = ? AND target = ?",
+                (source, target),
+            ).fetchone()
+
+            unchanged = row is not None and tuple(row) == (
+                source_fingerprint,
+                target_head,
+            )
+            if unchanged:
+                self._skipped += 1
+            return unchanged
+
+    def record(
+        self, source: str, target: str, source_fingerprint: str, target_head: str
+    ) -> None:
+        """Registra que el destino está sincronizado con la fuente.
+
+        Args:
+            source: Repo fuente (org/repo).
+            target: Repo destino (org/repo).
+            source_fingerprint: Huella de los workflows fuente verificados.
+            target_head: SHA del HEAD de la rama por defecto verificado.
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state "
+                "(source, target, source_fingerprint, target_head, synced_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (source, target, source_fingerprint, target_head, time.time()),
+            )
+            self._conn.commit()
+
+    def forget(self, source: str, target: str) -> None:
+        """Elimina el estado registrado de un destino."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM sync_state WHERE source = ? AND target = ?",
+                (source, target),
+            )
+            self._conn.commit()
+
+    def stats(self) -> dict[str, int]:
+        """Retorna estadísticas del almacén (entradas y repos saltados)."""
+        with self._lock:
+            (entries,) = self._conn.execute(
+                "SELECT COUNT(*) FROM sync_state"
+            ).fetchone()
+        return {"entries": entries, "skipped": self._skipped}
+
+    def close(self) -> None:
+        """Cierra la conexión con la base de datos."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,237 @@
+"""
+Plan de sincronización serializable (plan / apply).
+
+Un plan guarda el resultado de descubrir y comparar todos los repos: la
+configuración, los workflows fuente (una sola vez, con su SHA de blob) y,
+por cada repo con cambios, el SHA base sobre el que se calcularon y las
+operaciones a aplicar. Aplicar el plan no repite el descubrimiento ni el
+diff; un repo solo se aborta si su rama base avanzó desde que se planificó.
+
+Principio SOLID: Single Responsibility
+- Solo construye, persiste y valida el plan; su ejecución la hace
+  WorkflowSyncService.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Mapping
+
+import sys
+
+# Agregar directorio padre al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from exceptions import WorkflowSyncError
+from models import FileChange, RepositoryInfo, SyncConfig
+from utils import git_blob_sha
+
+from .run_journal import RunJournal
+
+
+@dataclass
+class PlannedRepo:
+    """Cambios planificados para un repo.
+
+    Attributes:
+        repo: Repositorio destino.
+        base_sha: HEAD de la rama por defecto con el que se calcularon.
+        changes: Operaciones a aplicar.
+    """
+
+    repo: RepositoryInfo
+    base_sha: str
+    changes: list[FileChange] = field(default_factory=list)
+
+
+class SyncPlan:
+    """Plan de sincronización listo para revisar y aplicar.
+
+    Los archivos se guardan como JSON; los contenidos de la fuente aparecen
+    una sola vez y cada operación de escritura los referencia por nombre y
+    SHA de blob, que se verifica al cargar el plan.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(
+        self,
+        config: SyncConfig,
+        source_commit_sha: str | None,
+        source_workflows: Mapping[str, str],
+        repos: list[PlannedRepo],
+        created_at: float | None = None,
+    ) -> None:
+        """Inicializa el plan.
+
+        Args:
+            config: Configuración con la que se planificó.
+            source_commit_sha: Commit de los workflows fuente (si se conoce).
+            source_workflows: {nombre: contenido} de los workflows fuente.
+            repos: Repos con cambios.
+            created_at: Epoch de creación (None = ahora).
+        """
+        self._config = config
+        self._source_commit_sha = source_commit_sha
+        self._source_workflows = dict(source_workflows)
+        self._repos = sorted(repos, key=lambda planned: planned.repo.full_name)
+        self._created_at = created_at or time.time()
+
+    @property
+    def config(self) -> SyncConfig:
+        """Configuración con la que se planificó."""
+        return self._config
+
+    @property
+    def source_commit_sha(self) -> str | None:
+        """Commit de los workflows fuente."""
+        return self._source_commit_sha
+
+    @property
+    def source_workflows(self) -> Mapping[str, str]:
+        """{nombre: contenido} de los workflows fuente."""
+        return self._source_workflows
+
+    @property
+    def repos(self) -> list[PlannedRepo]:
+        """Repos con cambios, ordenados por nombre."""
+        return self._repos
+
+    def save(self, path: str | Path) -> None:
+        """Escribe el plan (el token no se guarda).
+
+        La escritura es atómica: un plan a medio escribir nunca reemplaza
+        al anterior.
+        """
+        path = Path(path)
+        data = {
+            "version": self.FORMAT_VERSION,
+            "created_at": self._created_at,
+            "config": RunJournal.config_to_dict(self._config),
+            "source": {
+                "commit_sha": self._source_commit_sha,
+                "workflows": {
+                    name: {"sha": git_blob_sha(content), "content": content}
+                    for name, content in sorted(self._source_workflows.items())
+                },
+            },
+            "repos": [self._repo_to_dict(planned) for planned in self._repos],
+        }
+
+        tmp = path.with_name(f".{path.name}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str | Path, token: str) -> SyncPlan:
+        """Lee y valida un plan.
+
+        Args:
+            path: Archivo del plan.
+            token: Token con el que se aplicará.
+
+        Raises:
+            WorkflowSyncError: Si el plan no existe, no es válido o su
+                contenido no coincide con los SHAs registrados.
+        """
+        path = Path(path)
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            raise WorkflowSyncError(f"No existe el plan {path}")
+        except json.JSONDecodeError as e:
+            raise WorkflowSyncError(f"Plan inválido {path}: {e}")
+
+        if data.get("version") != cls.FORMAT_VERSION:
+            raise WorkflowSyncError(
+                f"Versión de plan no soportada en {path}: {data.get('version')}"
+            )
+
+        workflows: dict[str, str] = {}
+        for name, entry in data["source"]["workflows"].items():
+            if git_blob_sha(entry["content"]) != entry["sha"]:
+                raise WorkflowSyncError(f"El contenido de {name} no coincide con su SHA")
+            workflows[name] = entry["content"]
+
+        repos = [cls._repo_from_dict(entry, data["source"]["workflows"]) for entry in data["repos"]]
+        return cls(
+            config=RunJournal.config_from_dict(data["config"], token),
+            source_commit_sha=data["source"]["commit_sha"],
+            source_workflows=workflows,
+            repos=repos,
+            created_at=data["created_at"],
+        )
+
+    def _repo_to_dict(self, planned: PlannedRepo) -> dict[str, Any]:
+        """Serializa los cambios de un repo (el contenido se referencia por SHA)."""
+        changes = []
+        for change in planned.changes:
+            if change.is_deletion:
+                changes.append(
+                    {"file": change.filename, "delete": True, "existing_sha": change.existing_sha}
+                )
+            else:
+                changes.append(
+                    {
+                        "file": change.filename,
+                        "sha": git_blob_sha(change.content),
+                        "existing_sha": change.existing_sha,
+                    }
+                )
+
+        return {
+            "repo": planned.repo.full_name,
+            "default_branch": planned.repo.default_branch,
+            "base_sha": planned.base_sha,
+            "changes": changes,
+        }
+
+    @staticmethod
+    def _repo_from_dict(
+        entry: dict[str, Any], workflows: dict[str, dict[str, str]]
+    ) -> PlannedRepo:
+        """Reconstruye los cambios de un repo a partir del plan."""
+        changes = []
+        for change in entry["changes"]:
+            if change.get("delete"):
+                changes.append(
+                    FileChange(
+                        filename=change["file"],
+                        existing_sha=change["existing_sha"],
+                        is_deletion=True,
+                    )
+                )
+                continue
+
+            source = workflows.get(change["file"])
+            if source is None or source["sha"] != change["sha"]:
+                raise WorkflowSyncError(
+                    f"El plan de {entry['repo']} referencia un contenido de "
+                    f"{change['file']} que no está en la fuente"
+                )
+            changes.append(
+                FileChange(
+                    filename=change["file"],
+                    content=source["content"],
+                    existing_sha=change["existing_sha"],
+                )
+            )
+
+        full_name = entry["repo"]
+        return PlannedRepo(
+            repo=RepositoryInfo(
+                name=full_name.split("/", 1)[1],
+                full_name=full_name,
+                default_branch=entry["default_branch"],
+            ),
+            base_sha=entry["base_sha"],
+            changes=changes,
+        )
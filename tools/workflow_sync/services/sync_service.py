@@ -14,11 +14,13 @@ Principio SOLID: Open/Closed
 from __future__ import annotations
 
 import logging
-import random
+import queue
+import threading
 import time
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Mapping
 
 import sys
 from pathlib import Path
@@ -26,12 +28,42 @@ from pathlib import Path
 # Agregar directorio padre al path para imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from exceptions import SourceRepoError
-from models import FileChange, SyncConfig, SyncResult, SyncStatus
+from exceptions import BranchExistsError, SourceRepoError
+from models import (
+    DiscoveryMode,
+    FileChange,
+    MergeMode,
+    MergeState,
+    PullRequestStatus,
+    RepoPrecheck,
+    RepositoryInfo,
+    SourceMode,
+    StageTiming,
+    SyncConfig,
+    SyncJob,
+    SyncResult,
+    SyncStatus,
+)
+from utils import git_blob_sha
+
+from .concurrency_controller import AdaptiveConcurrencyController
+from .dependency_graph import ActionDependencyGraph
+from .diff_cache import DiffCache
+from .merge_queue import MergeQueue
+from .pr_poller import PullRequestPoller
+from .run_journal import JournalPhase, RunJournal
+from .source_loader import (
+    WORKFLOW_EXTENSIONS,
+    ApiSourceLoader,
+    ArchiveSourceLoader,
+    ISourceLoader,
+    LocalSourceLoader,
+    SourceSnapshot,
+)
+from .state_store import SyncStateStore
+from .sync_plan import PlannedRepo, SyncPlan
 
 if TYPE_CHECKING:
-    from github.Repository import Repository
-
     from clients.github_client import IGitHubClient
 
 logger = logging.getLogger(__name__)
@@ -48,11 +80,20 @@ class ISyncStrategy(ABC):
     def sync(
         self,
         service: "WorkflowSyncService",
-        repos: list[Repository],
+        repos: Iterable[RepositoryInfo],
     ) -> list[SyncResult]:
-        """Ejecuta la sincronización con la estrategia definida."""
+        """Ejecuta la sincronización con la estrategia definida.
+
+        Los repos pueden llegar de forma incremental (generador): las
+        estrategias deben empezar a procesarlos sin esperar al final.
+        """
         pass
 
+    @property
+    def stage_timings(self) -> dict[str, StageTiming]:
+        """Tiempos por etapa de la última ejecución (vacío si no aplica)."""
+        return {}
+
 
 class SequentialSyncStrategy(ISyncStrategy):
     """Estrategia de sincronización secuencial."""
@@ -60,53 +101,57 @@ class SequentialSyncStrategy(ISyncStrategy):
     def sync(
         self,
         service: "WorkflowSyncService",
-        repos: list[Repository],
+        repos: Iterable[RepositoryInfo],
     ) -> list[SyncResult]:
         """Sincroniza repositorios secuencialmente."""
         results: list[SyncResult] = []
 
         for idx, repo in enumerate(repos):
-            if idx > 0 and idx % 5 == 0:
-                service.client.check_rate_limit()
-
-            logger.info(
-                "Sincronizando (%d/%d): %s", idx + 1, len(repos), repo.name
-            )
+            logger.info("Sincronizando (%d): %s", idx + 1, repo.name)
             repo_start = time.time()
             result = service.sync_single_repo(repo)
             result.duration_seconds = time.time() - repo_start
             results.append(result)
             service._log_result(result)
-            service.client.handle_post_operation_rate_limit()
 
         return results
 
 
 class ParallelSyncStrategy(ISyncStrategy):
-    """Estrategia de sincronización paralela."""
+    """Estrategia de sincronización paralela.
+
+    Con un AdaptiveConcurrencyController, el pool se dimensiona a su límite
+    máximo y el número de repos en vuelo lo decide el controlador.
+    """
 
-    def __init__(self, max_workers: int = 4) -> None:
-        self._max_workers = max_workers
+    def __init__(
+        self,
+        max_workers: int = 4,
+        controller: AdaptiveConcurrencyController | None = None,
+    ) -> None:
+        self._max_workers = controller.max_limit if controller else max_workers
+        self._controller = controller
 
     def sync(
         self,
         service: "WorkflowSyncService",
-        repos: list[Repository],
+        repos: Iterable[RepositoryInfo],
     ) -> list[SyncResult]:
         """Sincroniza repositorios en paralelo."""
         results: list[SyncResult] = []
 
-        logger.info(
-            "Procesando %d repositorios con %d workers",
-            len(repos),
-            self._max_workers,
-        )
+        logger.info("Procesando repositorios con %d workers", self._max_workers)
 
         with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
-            future_to_repo = {
-                executor.submit(service.sync_single_repo, repo): repo
-                for repo in repos
-            }
+            # Cada repo se encola en cuanto llega de la búsqueda
+            future_to_repo = {}
+            for repo in repos:
+                if self._controller:
+                    self._controller.acquire()
+                future = executor.submit(service.sync_single_repo, repo)
+                if self._controller:
+                    future.add_done_callback(lambda _: self._controller.release())
+                future_to_repo[future] = repo
 
             for future in as_completed(future_to_repo):
                 repo = future_to_repo[future]
@@ -127,6 +172,178 @@ class ParallelSyncStrategy(ISyncStrategy):
         return results
 
 
+class PipelinedSyncStrategy(ISyncStrategy):
+    """Estrategia de sincronización en pipeline por etapas.
+
+    Cada etapa de WorkflowSyncService.stages (check → diff → apply →
+    open_pr → merge) tiene su propio pool de workers y una cola acotada de
+    entrada. Las lecturas (check, diff) pueden correr con muchos workers
+    mientras las escrituras quedan en pocos, y las colas acotadas frenan al
+    descubrimiento cuando las etapas lentas se saturan, de modo que la
+    memoria no crece con el número de repos.
+    """
+
+    DEFAULT_QUEUE_SIZE = 64
+
+    def __init__(
+        self,
+        read_workers: int = 16,
+        write_workers: int = 4,
+        stage_workers: dict[str, int] | None = None,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ) -> None:
+        """Inicializa la estrategia.
+
+        Args:
+            read_workers: Workers por etapa de lectura.
+            write_workers: Workers por etapa de escritura.
+            stage_workers: Workers por nombre de etapa (tiene prioridad).
+            queue_size: Capacidad de la cola de entrada de cada etapa.
+        """
+        self._read_workers = read_workers
+        self._write_workers = write_workers
+        self._stage_workers = stage_workers or {}
+        self._queue_size = queue_size
+        self._timings: dict[str, StageTiming] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def stage_timings(self) -> dict[str, StageTiming]:
+        """Tiempos por etapa de la última ejecución."""
+        return dict(self._timings)
+
+    def sync(
+        self,
+        service: "WorkflowSyncService",
+        repos: Iterable[RepositoryInfo],
+    ) -> list[SyncResult]:
+        """Sincroniza repositorios haciendo fluir cada uno por las etapas."""
+        stages = service.stages
+        results: list[SyncResult] = []
+        queues: list[queue.Queue[SyncJob | None]] = [
+            queue.Queue(maxsize=self._queue_size) for _ in stages
+        ]
+
+        self._timings = {"discover": StageTiming(name="discover", workers=1)}
+        pools: list[list[threading.Thread]] = []
+        for idx, (name, stage, is_write) in enumerate(stages):
+            workers = self._stage_workers.get(
+                name, self._write_workers if is_write else self._read_workers
+            )
+            self._timings[name] = StageTiming(name=name, workers=workers)
+            next_queue = queues[idx + 1] if idx + 1 < len(queues) else None
+            pools.append(
+                [
+                    threading.Thread(
+                        target=self._worker,
+                        args=(service, name, stage, queues[idx], next_queue, results),
+                        name=f"sync-{name}-{n}",
+                        daemon=True,
+                    )
+                    for n in range(workers)
+                ]
+            )
+
+        logger.info(
+            "Pipeline de sincronización: %s (cola máx. %d)",
+            ", ".join(f"{t.name}={t.workers}" for t in self._timings.values()),
+            self._queue_size,
+        )
+
+        for pool in pools:
+            for thread in pool:
+                thread.start()
+
+        try:
+            self._discover(repos, queues[0])
+        finally:
+            # Cerrar etapa por etapa: cuando todos los workers de una etapa
+            # terminan, ya no llegará nada a la siguiente
+            for idx, pool in enumerate(pools):
+                for _ in pool:
+                    queues[idx].put(None)
+                for thread in pool:
+                    thread.join()
+
+        self._log_timings()
+        return results
+
+    def _discover(
+        self, repos: Iterable[RepositoryInfo], first_queue: queue.Queue
+    ) -> None:
+        """Etapa discover: encola los repos a medida que llegan (con backpressure)."""
+        timing = self._timings["discover"]
+        iterator = iter(repos)
+
+        while True:
+            start = time.time()
+            repo = next(iterator, None)
+            self._record(timing, time.time() - start, count=repo is not None)
+            if repo is None:
+                return
+
+            logger.info("Sincronizando (%d): %s", timing.processed, repo.name)
+            first_queue.put(SyncJob(repo=repo, started_at=time.time()))
+
+    def _worker(
+        self,
+        service: "WorkflowSyncService",
+        name: str,
+        stage: Callable[[SyncJob], None],
+        in_queue: queue.Queue,
+        out_queue: queue.Queue | None,
+        results: list[SyncResult],
+    ) -> None:
+        """Procesa los repos de una etapa hasta recibir el centinela (None)."""
+        timing = self._timings[name]
+
+        while True:
+            job = in_queue.get()
+            if job is None:
+                return
+
+            start = time.time()
+            try:
+                stage(job)
+            except Exception as e:
+                job.result = service.fail_job(job, e)
+            self._record(timing, time.time() - start)
+
+            if job.result is None and out_queue is not None:
+                out_queue.put(job)
+                continue
+
+            try:
+                result = service.complete_job(job)
+            except Exception as e:
+                result = service.fail_job(job, e)
+
+            result.duration_seconds = time.time() - job.started_at
+            service._log_result(result)
+            with self._lock:
+                results.append(result)
+
+    def _record(self, timing: StageTiming, elapsed: float, count: bool = True) -> None:
+        """Acumula la duración de un repo en una etapa."""
+        with self._lock:
+            timing.processed += int(count)
+            timing.busy_seconds += elapsed
+            timing.max_seconds = max(timing.max_seconds, elapsed)
+
+    def _log_timings(self) -> None:
+        """Registra el resumen de tiempos por etapa."""
+        for timing in self._timings.values():
+            logger.info(
+                "Etapa %-8s workers=%-3d repos=%-5d media=%.2fs máx=%.2fs total=%.1fs",
+                timing.name,
+                timing.workers,
+                timing.processed,
+                timing.mean_seconds,
+                timing.max_seconds,
+                timing.busy_seconds,
+            )
+
+
 class PRBodyGenerator:
     """Generador de cuerpos de PR.
 
@@ -141,6 +358,7 @@ class PRBodyGenerator:
         files_updated: list[str],
         files_deleted: list[str] | None = None,
         files_failed: list[str] | None = None,
+        source_sha: str | None = None,
     ) -> str:
         """Genera el cuerpo del PR."""
         files_deleted = files_deleted or []
@@ -166,6 +384,10 @@ class PRBodyGenerator:
 
         changes_section = "\n\n".join(sections) if sections else "Sin cambios"
 
+        source = f"`{org}/{source_repo}`"
+        if source_sha:
+            source += f" @ `{source_sha[:7]}`"
+
         return f"""## Sincronización de Workflows
 
 Este PR sincroniza los GitHub Actions workflows desde el repositorio fuente.
@@ -173,7 +395,7 @@ Este PR sincroniza los GitHub Actions workflows desde el repositorio fuente.
 {changes_section}
 {partial_warning}
 ### Repositorio fuente
-`{org}/{source_repo}`
+{source}
 
 ---
 *PR generado automáticamente por workflow-sync*
@@ -187,30 +409,67 @@ class WorkflowSyncService:
     - Orquesta la sincronización, delegando responsabilidades específicas.
 
     Principio SOLID: Dependency Inversion
-    - Recibe el cliente por inyección de dependencias.
+    - Recibe el cliente (y el almacén de estado opcional) por inyección de
+      dependencias.
 
     Attributes:
         WORKFLOWS_PATH: Ruta donde se almacenan los workflows.
-        BRANCH_PREFIX: Prefijo para las ramas de sincronización.
+        BRANCH_PREFIX: Prefijo para las ramas de sincronización (el branch
+            lleva además la huella de los workflows fuente).
+        PIPELINE_READ_FACTOR: Multiplicador de workers de lectura en pipeline.
+        PRECHECK_BATCH_SIZE: Repos por consulta de pre-verificación en lote.
     """
 
     WORKFLOWS_PATH = ".github/workflows"
     BRANCH_PREFIX = "sync/workflows-update"
+    PIPELINE_READ_FACTOR = 4
+    PRECHECK_BATCH_SIZE = 50
 
     def __init__(
         self,
         client: "IGitHubClient",
         config: SyncConfig,
+        state_store: SyncStateStore | None = None,
+        journal: RunJournal | None = None,
     ) -> None:
         """Inicializa el servicio.
 
         Args:
             client: Cliente de GitHub (inyección de dependencias).
             config: Configuración de sincronización.
+            state_store: Estado de la última sincronización; si se indica,
+                se saltan los repos sin cambios en fuente ni destino.
+            journal: Diario de la ejecución; si viene de una ejecución
+                anterior, los repos continúan desde la fase registrada.
         """
         self._client = client
         self._config = config
-        self._source_workflows: dict[str, str] = {}
+        self._state_store = state_store
+        self._journal = journal
+        self._source_full_name = f"{config.org}/{config.source_repo}"
+        self._source_workflows: Mapping[str, str] = MappingProxyType({})
+        self._source_shas: Mapping[str, str] = MappingProxyType({})
+        self._source_fingerprint: str | None = None
+        self._source_commit_sha: str | None = None
+        # Workflows afectados por config.source_range (None = todos)
+        self._affected_workflows: frozenset[str] | None = None
+        # Workflows fuente cuyo propio archivo cambió en el rango (p. ej. añadidos)
+        self._changed_workflows: frozenset[str] = frozenset()
+        # Modo delta: workflows cambiados en el rango, los únicos que se comparan
+        self._diff_scope: frozenset[str] | None = None
+        self._stage_timings: dict[str, StageTiming] = {}
+        self._prechecks: dict[str, RepoPrecheck] = {}
+        self._open_pr_index: dict[str, dict[str, str]] | None = None
+        self._merge_queue: MergeQueue | None = None
+        if config.auto_merge and config.merge_mode == MergeMode.NATIVE:
+            self._merge_queue = MergeQueue(
+                client, on_merged=self._finish_merge, workers=config.merge_workers
+            )
+        self._awaiting_green: list[SyncJob] = []
+        self._diff_cache = DiffCache()
+        # Repos con cambios al planificar / cambios planificados al aplicar
+        self._plan_repos: list[PlannedRepo] | None = None
+        self._planned: dict[str, PlannedRepo] | None = None
         self._start_time: float | None = None
 
     @property
@@ -223,6 +482,15 @@ class WorkflowSyncService:
         """Retorna la configuración."""
         return self._config
 
+    @property
+    def stage_timings(self) -> dict[str, StageTiming]:
+        """Tiempos por etapa de la última ejecución (solo en modo pipeline)."""
+        return self._stage_timings
+
+    def diff_stats(self) -> dict[str, int]:
+        """Retorna {trees: diffs calculados, hits: diffs reutilizados}."""
+        return self._diff_cache.stats()
+
     def run(self, parallel: bool = False) -> list[SyncResult]:
         """Ejecuta la sincronización completa.
 
@@ -254,108 +522,657 @@ class WorkflowSyncService:
             ", ".join(self._source_workflows.keys()),
         )
 
+        selection = self._affected_workflows if self._diff_scope is None else self._diff_scope
+        if selection is not None and not selection:
+            logger.info(
+                "Ningún workflow afectado por %s: no hay repos que sincronizar",
+                self._config.source_range,
+            )
+            return []
+
         # Buscar repos destino
-        self._client.check_rate_limit(is_search=True)
+        self._client.check_rate_limit(
+            is_search=self._config.discovery == DiscoveryMode.SEARCH
+        )
 
         logger.info(
-            "Buscando repos con topic '%s' en %s...",
+            "Buscando repos con topic '%s' en %s (%s)...",
             self._config.topic,
             self._config.org,
+            self._config.discovery.value,
         )
+        return self._execute(self._discover_target_repos(), parallel)
 
-        target_repos = self._client.search_repositories_by_topic(
-            self._config.org, self._config.topic
-        )
+    def plan(self, parallel: bool = False) -> tuple[SyncPlan, list[SyncResult]]:
+        """Descubre y compara todos los repos sin escribir nada.
 
-        if not target_repos:
-            logger.warning(
-                "No se encontraron repos con topic '%s'", self._config.topic
+        Args:
+            parallel: Si es True, usa sincronización paralela.
+
+        Returns:
+            (plan con los repos que tienen cambios, resultados por repo).
+        """
+        self._plan_repos = []
+        try:
+            results = self.run(parallel)
+            plan = SyncPlan(
+                config=self._config,
+                source_commit_sha=self._source_commit_sha,
+                source_workflows=self._source_workflows,
+                repos=self._plan_repos,
             )
-            return []
+        finally:
+            self._plan_repos = None
 
-        logger.info("Encontrados %d repositorio(s)", len(target_repos))
+        logger.info("Plan: %d repo(s) con cambios", len(plan.repos))
+        return plan, results
 
-        # Filtrar repo fuente y obtener objetos Repository
-        source_full_name = f"{self._config.org}/{self._config.source_repo}"
-        repos_to_sync = []
+    def apply_plan(self, plan: SyncPlan, parallel: bool = False) -> list[SyncResult]:
+        """Aplica un plan sin volver a descubrir repos ni calcular diffs.
 
-        for repo_info in target_repos:
-            if repo_info.full_name == source_full_name:
-                continue
-            repo = self._client.get_repository(repo_info.full_name)
-            repos_to_sync.append(repo)
+        Un repo cuya rama por defecto avanzó desde que se planificó no se
+        aplica (hay que volver a planificarlo).
+
+        Args:
+            plan: Plan a aplicar.
+            parallel: Si es True, usa sincronización paralela.
+
+        Returns:
+            Lista de resultados de sincronización.
+        """
+        self._start_time = time.time()
+        self._client.check_rate_limit()
+        self._set_source(plan.source_workflows, plan.source_commit_sha)
+
+        logger.info(
+            "Aplicando plan: %d repo(s), %d archivo(s) fuente",
+            len(plan.repos),
+            len(self._source_workflows),
+        )
+        self._planned = {planned.repo.full_name: planned for planned in plan.repos}
+        repos = [planned.repo for planned in plan.repos]
+        try:
+            return self._execute(self._prefetched(repos), parallel)
+        finally:
+            self._planned = None
+
+    def _execute(self, repos: Iterable[RepositoryInfo], parallel: bool) -> list[SyncResult]:
+        """Sincroniza los repos con la estrategia configurada."""
+        # Índice de PRs de sync abiertos en la org (una consulta en lote)
+        self._load_open_pr_index()
 
         # Seleccionar estrategia
         strategy: ISyncStrategy
-        if parallel:
+        controller: AdaptiveConcurrencyController | None = None
+        if parallel and self._config.pipeline:
+            # Lecturas anchas, escrituras con el número de workers pedido
+            strategy = PipelinedSyncStrategy(
+                read_workers=self._config.max_workers * self.PIPELINE_READ_FACTOR,
+                write_workers=self._config.max_workers,
+            )
+        elif parallel and self._config.adaptive_concurrency:
+            controller = AdaptiveConcurrencyController(
+                initial=self._config.max_workers,
+                max_limit=self._config.adaptive_max_workers,
+            )
+            self._client.add_call_listener(controller.observe)
+            strategy = ParallelSyncStrategy(controller=controller)
+        elif parallel:
             strategy = ParallelSyncStrategy(self._config.max_workers)
         else:
             strategy = SequentialSyncStrategy()
 
-        # Ejecutar sincronización
-        results = strategy.sync(self, repos_to_sync)
+        # Ejecutar sincronización a medida que se descubren los repos
+        try:
+            results = strategy.sync(self, repos)
+        finally:
+            if controller:
+                self._client.remove_call_listener(controller.observe)
+            # Los merges en segundo plano completan sus resultados antes de retornar
+            if self._merge_queue:
+                self._merge_queue.drain()
+        if self._awaiting_green:
+            self._merge_when_green()
+        self._stage_timings = strategy.stage_timings
+
+        stats = self._diff_cache.stats()
+        if stats["trees"]:
+            logger.info(
+                "Diff: %d árbol(es) de workflows distinto(s) para %d repo(s)",
+                stats["trees"],
+                stats["trees"] + stats["hits"],
+            )
+
+        if not results:
+            logger.warning(
+                "No se encontraron repos con topic '%s'", self._config.topic
+            )
+        else:
+            logger.info("Procesados %d repositorio(s)", len(results))
 
         total_duration = time.time() - self._start_time
         logger.info("Duración total: %.1f segundos", total_duration)
 
         return results
 
-    def sync_single_repo(self, repo: Repository) -> SyncResult:
+    def _discover_target_repos(self) -> Iterator[RepositoryInfo]:
+        """Entrega los repos destino a medida que llegan de la búsqueda.
+
+        Con pre-verificaciones en lote o un cliente que trabaja por lotes
+        (p. ej. clones git), cada lote se prepara antes de entregar sus repos.
+        """
+        if self._config.discovery == DiscoveryMode.ORG_LISTING:
+            discover = self._client.list_org_repositories_by_topic
+        else:
+            discover = self._client.search_repositories_by_topic
+
+        batch_size = self._client.PREFETCH_BATCH_SIZE
+        if self._config.batched_prechecks:
+            batch_size = max(batch_size, self.PRECHECK_BATCH_SIZE)
+        batch: list[RepositoryInfo] = []
+        for repo in discover(self._config.org, self._config.topic):
+            if repo.full_name == self._source_full_name:
+                continue
+            if not batch_size:
+                yield repo
+                continue
+
+            batch.append(repo)
+            if len(batch) >= batch_size:
+                self._prepare_batch(batch)
+                yield from batch
+                batch = []
+
+        if batch:
+            self._prepare_batch(batch)
+            yield from batch
+
+    def _prefetched(self, repos: list[RepositoryInfo]) -> Iterator[RepositoryInfo]:
+        """Entrega los repos de un plan preparando el acceso lote a lote.
+
+        Como en el descubrimiento, cada lote de PREFETCH_BATCH_SIZE repos se
+        prepara (p. ej. se clona) justo antes de entregar sus repos.
+        """
+        batch_size = self._client.PREFETCH_BATCH_SIZE
+        if not batch_size:
+            yield from repos
+            return
+
+        for start in range(0, len(repos), batch_size):
+            batch = repos[start : start + batch_size]
+            self._client.prefetch(batch)
+            yield from batch
+
+    def _prepare_batch(self, repos: list[RepositoryInfo]) -> None:
+        """Pre-verifica en lote y prepara el acceso a un lote de repos.
+
+        Si la consulta en lote falla, los repos se verifican con las
+        llamadas individuales.
+        """
+        if self._config.batched_prechecks:
+            candidates = [r for r in repos if not r.archived and r.default_branch]
+            try:
+                self._prechecks.update(
+                    self._client.get_repo_prechecks(
+                        candidates, self.WORKFLOWS_PATH, self.BRANCH_PREFIX
+                    )
+                )
+            except Exception as e:
+                logger.warning(
+                    "Pre-verificación en lote fallida (%s); se verifica repo a repo", e
+                )
+
+        self._client.prefetch(repos)
+
+    @property
+    def stages(self) -> list[tuple[str, Callable[[SyncJob], None], bool]]:
+        """Etapas de sincronización de un repo, en orden.
+
+        Returns:
+            Lista de (nombre, función, es_escritura). Cada función recibe el
+            SyncJob y fija `job.result` si el repo termina en esa etapa.
+        """
+        return [
+            ("check", self.check_repo, False),
+            ("diff", self.diff_repo, False),
+            ("apply", self.apply_changes, True),
+            ("open_pr", self.open_pull_request, True),
+            ("merge", self.merge_pull_request, True),
+        ]
+
+    def sync_single_repo(self, repo: RepositoryInfo) -> SyncResult:
         """Sincroniza workflows a un repositorio específico.
 
+        Ejecuta todas las etapas de forma secuencial.
+
         Args:
             repo: Repositorio destino.
 
         Returns:
             Resultado de la sincronización.
         """
-        branch_created = None
+        job = SyncJob(repo=repo, started_at=time.time())
 
         try:
-            # Verificaciones previas
-            skip_result = self._check_skip_conditions(repo)
-            if skip_result:
-                return skip_result
+            for _, stage, _ in self.stages:
+                stage(job)
+                if job.result:
+                    break
+        except Exception as e:
+            job.result = self.fail_job(job, e)
+
+        return self.complete_job(job)
+
+    def complete_job(self, job: SyncJob) -> SyncResult:
+        """Cierra un repo: registra su resultado en el diario y lo retorna.
+
+        Raises:
+            RuntimeError: Si ninguna etapa produjo resultado.
+        """
+        if job.result is None:
+            raise RuntimeError(f"El pipeline terminó sin resultado para {job.repo.name}")
+
+        self._prechecks.pop(job.repo.full_name, None)
+
+        if self._journal:
+            state = self._journal.state(job.repo.full_name)
+            # Los resultados ya registrados en una ejecución anterior no se repiten
+            if state is None or state.result is not job.result:
+                self._journal.record_result(job.repo.full_name, job.result)
+
+        return job.result
+
+    def check_repo(self, job: SyncJob) -> None:
+        """Etapa check: diario, estado incremental y condiciones para saltar el repo."""
+        repo = job.repo
+
+        # Reanudación: el repo continúa desde la fase registrada en el diario
+        if self._restore_from_journal(job):
+            return
+
+        # Plan: los cambios ya están calculados sobre un HEAD conocido
+        planned = self._planned.get(repo.full_name) if self._planned else None
+        if planned:
+            job.base_sha = planned.base_sha
+            job.changes = list(planned.changes)
+            self._attach_open_pr(job)
+            return
+
+        # Estado incremental: una consulta de ref basta para saber si
+        # el repo sigue como quedó en la última sincronización
+        job.target_head = self._get_target_head(repo)
+        if job.target_head and self._state_store.is_unchanged(
+            self._source_full_name,
+            repo.full_name,
+            self._source_fingerprint,
+            job.target_head,
+        ):
+            job.result = SyncResult(
+                repo_name=repo.name,
+                status=SyncStatus.NO_CHANGES,
+                message="Sin cambios desde la última sincronización",
+            )
+            return
 
-            # Obtener cambios necesarios
-            changes = self._get_required_changes(repo)
+        # Verificaciones previas
+        job.result = self._check_skip_conditions(repo)
+        if job.result is None:
+            self._attach_open_pr(job)
 
-            if not changes:
-                return SyncResult(
+    def _attach_open_pr(self, job: SyncJob) -> None:
+        """Asocia al job el PR de sync abierto del repo, si lo hay.
+
+        Si el branch del PR corresponde a los workflows fuente actuales el
+        repo ya está al día; si no, el PR se reutiliza y su branch se
+        reescribe con el nuevo contenido en lugar de abrir otro PR.
+        """
+        repo = job.repo
+        precheck = self._prechecks.get(repo.full_name)
+        if precheck and precheck.open_sync_prs is not None:
+            open_prs = precheck.open_sync_prs
+        else:
+            open_prs = self._open_sync_prs(repo, self.BRANCH_PREFIX)
+        if not open_prs:
+            return
+
+        if self._branch_name in open_prs:
+            job.result = SyncResult(
+                repo_name=repo.name,
+                status=SyncStatus.SKIPPED,
+                message=f"PR de sync al día: {open_prs[self._branch_name]}",
+            )
+            return
+
+        # Con varios PRs de sync abiertos se reutiliza el más reciente
+        branch_name, pr_url = max(open_prs.items(), key=lambda pr: self._pr_number(pr[1]))
+        job.branch_name = branch_name
+        job.pr_url = pr_url
+        job.pr_number = self._pr_number(pr_url)
+        job.reuse_pr = True
+
+    def diff_repo(self, job: SyncJob) -> None:
+        """Etapa diff: calcula los cambios necesarios en el repo."""
+        repo = job.repo
+
+        # Commit ya escrito en una ejecución anterior o cambios de un plan
+        if job.commit_sha or job.base_sha:
+            return
+
+        # PR abierto con otro nombre de branch pero con el contenido actual
+        if job.reuse_pr:
+            pr_tree = self._client.get_workflow_tree(
+                repo, self.WORKFLOWS_PATH, ref=job.branch_name
+            )
+            if self._in_scope(pr_tree) == self._in_scope(self._source_shas):
+                job.result = SyncResult(
                     repo_name=repo.name,
-                    status=SyncStatus.NO_CHANGES,
-                    message="Todos los workflows están actualizados",
+                    status=SyncStatus.SKIPPED,
+                    message=f"PR de sync al día: {job.pr_url}",
                 )
+                return
+
+        # Un único listado de la carpeta sirve para verificar y comparar
+        precheck = self._prechecks.get(repo.full_name)
+        if precheck:
+            target_tree = precheck.workflow_tree
+            base_sha = precheck.head_sha
+        else:
+            # Al planificar, el HEAD se lee antes que el árbol: si la rama
+            # avanza entre ambos, el plan queda obsoleto en lugar de erróneo
+            base_sha = job.target_head
+            if self._plan_repos is not None and base_sha is None:
+                base_sha = self._client.get_base_sha(repo, repo.default_branch)
+            target_tree = self._client.get_workflow_tree(repo, self.WORKFLOWS_PATH)
+
+        # Repo sin carpeta de workflows (no necesita sincronización)
+        if target_tree is None:
+            self._record_state(repo, job.target_head)
+            job.result = SyncResult(
+                repo_name=repo.name,
+                status=SyncStatus.SKIPPED,
+                message="Sin carpeta .github/workflows (no requiere workflows)",
+            )
+            return
+
+        # Rango fuente: solo se sincronizan los repos que usan algún workflow afectado
+        if self._affected_workflows is not None and not self._uses_affected_workflows(
+            target_tree
+        ):
+            job.result = SyncResult(
+                repo_name=repo.name,
+                status=SyncStatus.NO_CHANGES,
+                message=f"No usa workflows afectados por {self._config.source_range}",
+            )
+            return
+
+        # Los repos con el mismo árbol de workflows (en el alcance) comparten el diff
+        job.changes = self._diff_cache.get_or_compute(
+            SyncStateStore.fingerprint(self._in_scope(target_tree)),
+            lambda: self._get_required_changes(repo, target_tree),
+        )
+
+        if not job.changes:
+            self._record_state(repo, job.target_head)
+            job.result = SyncResult(
+                repo_name=repo.name,
+                status=SyncStatus.NO_CHANGES,
+                message="Todos los workflows están actualizados",
+            )
+            return
+
+        if self._plan_repos is not None:
+            if base_sha is None:
+                base_sha = self._client.get_base_sha(repo, repo.default_branch)
+            self._plan_repos.append(PlannedRepo(repo, base_sha, job.changes))
+            job.result = SyncResult(
+                repo_name=repo.name,
+                status=SyncStatus.SKIPPED,
+                message=f"Plan - {len(job.changes)} archivo(s) cambiarían",
+                files_updated=[c.filename for c in job.changes],
+            )
+        elif self._config.dry_run:
+            job.result = SyncResult(
+                repo_name=repo.name,
+                status=SyncStatus.SKIPPED,
+                message=f"Dry run - {len(job.changes)} archivo(s) cambiarían",
+                files_updated=[c.filename for c in job.changes],
+            )
+
+    def apply_changes(self, job: SyncJob) -> None:
+        """Etapa apply: commit único con todos los cambios y branch de sync.
+
+        El número de escrituras por repositorio es constante sin importar
+        cuántos archivos cambien.
+        """
+        repo = job.repo
+        files_updated, files_deleted = self._split_changes(job.changes)
 
-            if self._config.dry_run:
-                return SyncResult(
+        # PR ya abierto en una ejecución anterior
+        if job.pr_number and not job.reuse_pr:
+            return
+
+        # Commit con todos los cambios sobre el HEAD de la rama base
+        if job.commit_sha is None:
+            base_sha = self._client.get_base_sha(repo, repo.default_branch)
+            if job.base_sha and base_sha != job.base_sha:
+                job.result = SyncResult(
                     repo_name=repo.name,
                     status=SyncStatus.SKIPPED,
-                    message=f"Dry run - {len(changes)} archivo(s) cambiarían",
-                    files_updated=[c.filename for c in changes],
+                    message=(
+                        f"La rama {repo.default_branch} avanzó desde el plan "
+                        f"({job.base_sha[:7]} → {base_sha[:7]}); vuelve a planificar"
+                    ),
                 )
+                return
+            job.commit_sha = self._client.commit_changes(
+                repo=repo,
+                base_sha=base_sha,
+                changes=job.changes,
+                message=self._build_commit_message(files_updated, files_deleted),
+                path=self.WORKFLOWS_PATH,
+            )
+            # Al reanudar, el commit debe volver al PR reutilizado y no a uno nuevo
+            reused = {}
+            if job.reuse_pr:
+                reused = {
+                    "reuse_pr": True,
+                    "branch_name": job.branch_name,
+                    "pr_url": job.pr_url,
+                    "pr_number": job.pr_number,
+                }
+            self._journal_phase(
+                job,
+                JournalPhase.FILES_WRITTEN,
+                commit_sha=job.commit_sha,
+                files_updated=files_updated,
+                files_deleted=files_deleted,
+                **reused,
+            )
 
-            # Crear PR con cambios
-            return self._create_sync_pr(repo, changes)
+        if job.reuse_pr:
+            # El PR abierto pasa a apuntar al nuevo commit
+            self._client.reset_branch(repo, job.branch_name, job.commit_sha)
+        elif job.branch_name and self._client.branch_exists(repo, job.branch_name):
+            # Branch de una ejecución anterior: se reutiliza si sigue existiendo
+            return
+        else:
+            job.branch_name = self._branch_name
+            try:
+                self._client.create_branch(repo, job.branch_name, job.commit_sha)
+            except BranchExistsError:
+                # Branch de un PR ya cerrado con el mismo contenido: se reescribe
+                self._client.reset_branch(repo, job.branch_name, job.commit_sha)
+        self._journal_phase(job, JournalPhase.BRANCH_CREATED, branch_name=job.branch_name)
+        logger.debug(
+            "Commit %s aplicado en %s (%d actualizado(s), %d eliminado(s))",
+            job.commit_sha[:7],
+            repo.name,
+            len(files_updated),
+            len(files_deleted),
+        )
 
-        except Exception as e:
-            if branch_created:
-                self._client.delete_branch(repo, branch_created)
+    def open_pull_request(self, job: SyncJob) -> None:
+        """Etapa open_pr: crea el PR de sincronización."""
+        repo = job.repo
+        files_updated, files_deleted = self._split_changes(job.changes)
+
+        pr_body = PRBodyGenerator.generate(
+            org=self._config.org,
+            source_repo=self._config.source_repo,
+            files_updated=files_updated,
+            files_deleted=files_deleted,
+            source_sha=self._source_commit_sha,
+        )
 
-            logger.exception("Error sincronizando %s", repo.name)
-            return SyncResult(
-                repo_name=repo.name,
-                status=SyncStatus.ERROR,
-                message=f"Error: {str(e)}",
-                branch_created=branch_created,
+        if job.pr_number is None:
+            job.pr_url, job.pr_number = self._find_open_pr(job) or (
+                self._client.create_pull_request(
+                    repo=repo,
+                    title="chore: sync GitHub Actions workflows",
+                    body=pr_body,
+                    head=job.branch_name,
+                    base=repo.default_branch,
+                )
+            )
+            self._journal_phase(
+                job, JournalPhase.PR_OPENED, pr_url=job.pr_url, pr_number=job.pr_number
+            )
+        elif job.reuse_pr:
+            self._client.update_pull_request(repo, job.pr_number, body=pr_body)
+            self._journal_phase(
+                job, JournalPhase.PR_OPENED, pr_url=job.pr_url, pr_number=job.pr_number
+            )
+
+        if not self._config.auto_merge:
+            job.result = self._success_result(
+                job, merged=False, note="PR ACTUALIZADO" if job.reuse_pr else None
             )
 
+    def merge_pull_request(self, job: SyncJob) -> None:
+        """Etapa merge: auto-merge del PR de sincronización.
+
+        En modo NATIVE no bloquea al worker: activa el auto-merge de GitHub
+        o, si no es posible, encola el PR en la cola de merge.
+        """
+        if self._config.merge_mode == MergeMode.WAIT_GREEN:
+            # Se mergea al final, cuando los checks de todos los PRs terminen
+            job.result = self._success_result(job, merged=False, note="ESPERANDO CHECKS")
+            self._awaiting_green.append(job)
+            return
+
+        if self._merge_queue:
+            if self._client.enable_auto_merge(job.repo, job.pr_number):
+                job.result = self._success_result(
+                    job, merged=False, note="AUTO-MERGE ACTIVADO"
+                )
+            else:
+                job.result = self._success_result(job, merged=False, note="EN COLA DE MERGE")
+                self._merge_queue.submit(job)
+            return
+
+        logger.debug("Auto-mergeando PR #%d en %s", job.pr_number, job.repo.name)
+        merged = self._client.merge_pull_request(job.repo, job.pr_number)
+        if merged:
+            logger.debug("PR #%d mergeado exitosamente", job.pr_number)
+            self._journal_phase(job, JournalPhase.MERGED)
+
+        job.result = self._success_result(job, merged=merged)
+
+    def _merge_when_green(self) -> None:
+        """Espera a que terminen los checks de los PRs creados y mergea los verdes.
+
+        El estado de todos los PRs se sondea en lote; los PRs con checks
+        fallidos, conflictos, cambios solicitados, revisión pendiente o en
+        borrador se dejan abiertos con el motivo.
+        """
+        jobs = {(job.repo.full_name, job.pr_number): job for job in self._awaiting_green}
+        self._awaiting_green = []
+        logger.info("Esperando los checks de %d PR(s)...", len(jobs))
+
+        def on_update(status: PullRequestStatus) -> None:
+            # Los resultados reflejan el estado de los checks mientras se espera
+            job = jobs.get((status.repo, status.number))
+            if job and job.result:
+                note = "CHECKS EN VERDE" if status.is_green else "ESPERANDO CHECKS"
+                job.result.message = self._success_result(job, False, note=note).message
+
+        poller = PullRequestPoller(self._client, on_update=on_update)
+        statuses = poller.wait_until_settled([(j.repo, j.pr_number) for j in jobs.values()])
+
+        for key, job in jobs.items():
+            status = statuses.get(key)
+            if status is None:
+                self._finish_merge(job, False, note="ESTADO DESCONOCIDO")
+            elif status.merge_state == MergeState.MERGED:
+                self._finish_merge(job, True)
+            elif status.is_green:
+                self._finish_merge(
+                    job, self._client.merge_pull_request(job.repo, job.pr_number)
+                )
+            elif status.is_failed:
+                self._finish_merge(job, False, note=self._failure_note(status))
+            else:
+                self._finish_merge(job, False, note="CHECKS PENDIENTES")
+
+    @staticmethod
+    def _failure_note(status: PullRequestStatus) -> str:
+        """Motivo por el que un PR no se puede mergear."""
+        if status.review_decision == "CHANGES_REQUESTED":
+            return "CAMBIOS SOLICITADOS"
+        if status.review_decision == "REVIEW_REQUIRED":
+            return "REVISIÓN REQUERIDA"
+        if status.draft:
+            return "BORRADOR"
+        if status.merge_state in (MergeState.CONFLICT, MergeState.CLOSED):
+            return status.merge_state.value.upper()
+        return f"CHECKS {status.checks}"
+
+    def _finish_merge(self, job: SyncJob, merged: bool, note: str | None = None) -> None:
+        """Completa el resultado de un PR mergeado en segundo plano.
+
+        Args:
+            job: Estado del repo (su resultado ya se entregó a la estrategia).
+            merged: Si el PR quedó mergeado.
+            note: Motivo a mostrar si no se mergeó.
+        """
+        if merged:
+            self._journal_phase(job, JournalPhase.MERGED)
+
+        outcome = self._success_result(
+            job, merged=merged, note=None if merged else note or "MERGE PENDIENTE"
+        )
+        # El resultado ya se entregó a la estrategia: se actualiza en el sitio
+        outcome.duration_seconds = job.result.duration_seconds
+        vars(job.result).update(vars(outcome))
+        if self._journal:
+            self._journal.record_result(job.repo.full_name, job.result)
+
+    def fail_job(self, job: SyncJob, error: Exception) -> SyncResult:
+        """Construye el resultado de error de un repo y limpia su branch.
+
+        Args:
+            job: Estado del repo en el momento del fallo.
+            error: Excepción producida por la etapa.
+        """
+        repo = job.repo
+        if job.branch_name and job.pr_url is None:
+            self._client.delete_branch(repo, job.branch_name)
+
+        logger.error("Error sincronizando %s", repo.name, exc_info=error)
+        return SyncResult(
+            repo_name=repo.name,
+            status=SyncStatus.ERROR,
+            message=f"Error: {str(error)}",
+            files_failed=[c.filename for c in job.changes],
+            branch_created=job.branch_name,
+            pr_url=job.pr_url,
+        )
+
     def _load_source_workflows(self) -> None:
         """Carga los workflows del repositorio fuente."""
-        source_repo = self._client.get_repository(
-            f"{self._config.org}/{self._config.source_repo}"
-        )
-        workflows = self._client.get_workflow_files(source_repo, self.WORKFLOWS_PATH)
+        loader = self._source_loader()
+        snapshot = loader.load(self._source_full_name, self.WORKFLOWS_PATH)
+        workflows = dict(snapshot.workflows)
 
         # Aplicar filtro si existe
         if self._config.files_filter:
@@ -363,14 +1180,311 @@ class WorkflowSyncService:
                 k: v for k, v in workflows.items() if k in self._config.files_filter
             }
 
+        self._set_source(workflows, snapshot.commit_sha, snapshot.blob_shas)
+        if self._config.source_range:
+            self._analyse_source_range(loader, snapshot)
+
+    def _set_source(
+        self,
+        workflows: Mapping[str, str],
+        commit_sha: str | None,
+        blob_shas: Mapping[str, str] | None = None,
+    ) -> None:
+        """Fija los workflows fuente de la ejecución y su huella.
+
+        Raises:
+            SourceRepoError: Si no hay workflows o no coinciden con los del
+                diario que se reanuda.
+        """
         if not workflows:
             raise SourceRepoError(
                 f"No se encontraron workflows en {self.WORKFLOWS_PATH}"
             )
 
-        self._source_workflows = workflows
+        # Solo lectura: los workers comparten estas vistas sin copiarlas
+        self._source_commit_sha = commit_sha
+        self._source_workflows = MappingProxyType(dict(workflows))
+        self._source_shas = MappingProxyType(
+            {
+                name: (blob_shas or {}).get(name) or git_blob_sha(content)
+                for name, content in workflows.items()
+            }
+        )
+        self._source_fingerprint = SyncStateStore.fingerprint(self._source_shas)
+
+        if self._journal:
+            previous = self._journal.source_fingerprint
+            if previous and previous != self._source_fingerprint:
+                raise SourceRepoError(
+                    f"Los workflows fuente cambiaron desde el inicio de la "
+                    f"ejecución {self._journal.run_id}; no se puede reanudar"
+                )
+            self._journal.record_source(
+                self._source_fingerprint, self._source_commit_sha
+            )
+
+    def _analyse_source_range(
+        self, loader: ISourceLoader, snapshot: SourceSnapshot
+    ) -> None:
+        """Calcula qué sincronizar a partir del rango de commits fuente.
+
+        En modo delta fija el alcance del diff (los workflows cambiados en
+        el rango); si no, los workflows afectados según el grafo de
+        dependencias. Si no se pueden determinar los archivos cambiados
+        (p. ej. porque la comparación está truncada) o las actions de la
+        fuente, se sincronizan todos los repos con el diff completo.
+        """
+        base, head = self._split_range(self._config.source_range)
+        changed = loader.changed_files(self._source_full_name, base, head)
+        if changed is not None and self._config.delta:
+            prefix = f"{self.WORKFLOWS_PATH}/"
+            self._diff_scope = frozenset(
+                path[len(prefix):]
+                for path in changed
+                if path.startswith(prefix)
+                and "/" not in path[len(prefix):]
+                and path.endswith(WORKFLOW_EXTENSIONS)
+                and (not self._config.files_filter or path[len(prefix):] in self._config.files_filter)
+            )
+            logger.info(
+                "Delta %s: %d archivo(s) cambiado(s), alcance del diff: %s",
+                self._config.source_range,
+                len(changed),
+                ", ".join(sorted(self._diff_scope)) or "ninguno",
+            )
+            return
+
+        if changed is None or snapshot.actions is None:
+            logger.warning(
+                "No se pudo analizar el rango %s; se sincronizan todos los repos",
+                self._config.source_range,
+            )
+            return
+
+        graph = self._dependency_graph(snapshot)
+        self._affected_workflows = frozenset(graph.affected_workflows(changed))
+        prefix = f"{self.WORKFLOWS_PATH}/"
+        self._changed_workflows = frozenset(
+            path[len(prefix):]
+            for path in changed
+            if path.startswith(prefix) and path[len(prefix):] in self._source_workflows
+        )
+        logger.info(
+            "Rango %s: %d archivo(s) cambiado(s), workflow(s) afectado(s): %s",
+            self._config.source_range,
+            len(changed),
+            ", ".join(sorted(self._affected_workflows)) or "ninguno",
+        )
+
+    def _dependency_graph(self, snapshot: SourceSnapshot) -> ActionDependencyGraph:
+        """Grafo de dependencias de la fuente, cacheado por commit."""
+        cache_path = None
+        if self._config.cache_dir and snapshot.commit_sha:
+            cache_path = Path(self._config.cache_dir) / "graphs" / f"{snapshot.commit_sha}.json"
+            graph = ActionDependencyGraph.load(cache_path)
+            if graph:
+                return graph
+
+        graph = ActionDependencyGraph.build(
+            self._source_full_name,
+            self.WORKFLOWS_PATH,
+            snapshot.workflows,
+            snapshot.actions or {},
+        )
+        if cache_path:
+            graph.save(cache_path)
+        return graph
+
+    def _uses_affected_workflows(self, target_tree: Mapping[str, str]) -> bool:
+        """Indica si el rango fuente afecta a un repo con este árbol de workflows.
+
+        Un workflow afectado cuenta si el destino lo tiene (se actualiza o se
+        elimina) o si su propio archivo cambió en el rango y el destino aún no
+        lo tiene (p. ej. un workflow añadido, que el diff completo crearía).
+        Los afectados solo a través de una action, presentes en la fuente
+        pero no usados por el repo, y los eliminados que el destino no tiene
+        no lo seleccionan.
+        """
+        return any(
+            name in target_tree or name in self._changed_workflows
+            for name in self._affected_workflows or ()
+        )
+
+    def _in_scope(self, tree: Mapping[str, str]) -> Mapping[str, str]:
+        """Restringe un árbol de workflows al alcance del diff (modo delta)."""
+        if self._diff_scope is None:
+            return tree
+        return {name: sha for name, sha in tree.items() if name in self._diff_scope}
+
+    @staticmethod
+    def _split_range(source_range: str) -> tuple[str, str]:
+        """(base, head) de un rango `base..head` o `base...head`."""
+        base, _, head = source_range.partition("..")
+        return base, head.lstrip(".")
+
+    def _source_loader(self) -> ISourceLoader:
+        """Crea el cargador de workflows fuente según la configuración."""
+        if self._config.source_mode == SourceMode.API:
+            return ApiSourceLoader(self._client)
+        if self._config.source_mode == SourceMode.LOCAL:
+            return LocalSourceLoader(self._config.source_path or ".")
+
+        # Al reanudar, la fuente queda fijada al commit de la ejecución original
+        ref = self._config.source_ref
+        if ref is None and self._journal:
+            ref = self._journal.source_commit_sha
+        if ref is None and self._config.source_range:
+            ref = self._split_range(self._config.source_range)[1]
+        return ArchiveSourceLoader(self._client, ref=ref)
+
+    def _restore_from_journal(self, job: SyncJob) -> bool:
+        """Restaura en el job el progreso registrado en el diario.
+
+        Los repos terminados conservan su resultado (salvo errores, que se
+        reintentan); los que ya tenían commit continúan desde la fase
+        registrada sin volver a calcular cambios.
+
+        Returns:
+            True si el repo continúa desde el diario (sin verificaciones previas).
+        """
+        state = self._journal.state(job.repo.full_name) if self._journal else None
+        if state is None:
+            return False
+
+        if state.result and state.result.status != SyncStatus.ERROR:
+            job.result = state.result
+            return True
+
+        if state.commit_sha is None:
+            return False
+
+        job.changes = [FileChange(filename=f) for f in state.files_updated] + [
+            FileChange(filename=f, is_deletion=True) for f in state.files_deleted
+        ]
+        job.commit_sha = state.commit_sha
+        job.branch_name = state.branch_name
+        job.pr_url = state.pr_url
+        job.pr_number = state.pr_number
+        job.reuse_pr = state.reuse_pr
+        if state.merged:
+            job.result = self._success_result(job, merged=True)
+
+        logger.info(
+            "[%s] Reanudando desde el diario (branch %s, PR %s)",
+            job.repo.name,
+            job.branch_name or "-",
+            job.pr_url or "-",
+        )
+        return True
+
+    def _find_open_pr(self, job: SyncJob) -> tuple[str, int] | None:
+        """Busca un PR ya abierto para el branch de un repo reanudado.
+
+        Cubre el caso en que la ejecución se cortó entre abrir el PR y
+        registrarlo en el diario.
+        """
+        if not self._journal or self._journal.state(job.repo.full_name) is None:
+            return None
+
+        for pr_url in self._open_sync_prs(job.repo, job.branch_name).values():
+            return pr_url, self._pr_number(pr_url)
+        return None
+
+    @staticmethod
+    def _pr_number(pr_url: str) -> int:
+        """Número de un PR a partir de su URL."""
+        return int(pr_url.rstrip("/").rsplit("/", 1)[-1])
+
+    @property
+    def _branch_name(self) -> str:
+        """Branch de sync de los workflows fuente actuales.
+
+        Se deriva de la huella de la fuente: el mismo contenido produce
+        siempre el mismo branch, así que no hace falta comprobar si existe.
+        En modo delta la huella es la de los workflows del alcance, para no
+        confundir un PR parcial con uno de la fuente completa.
+        """
+        fingerprint = self._source_fingerprint
+        if self._diff_scope is not None:
+            fingerprint = SyncStateStore.fingerprint(
+                {name: self._source_shas.get(name, "") for name in self._diff_scope}
+            )
+        return f"{self.BRANCH_PREFIX}-{fingerprint[:12]}"
+
+    def _load_open_pr_index(self) -> None:
+        """Construye el índice en memoria de PRs de sync abiertos en la org.
+
+        Si el índice no se puede construir completo, los PRs se consultan
+        repo a repo.
+        """
+        try:
+            self._open_pr_index = self._client.get_org_open_prs_with_prefix(
+                self._config.org, self.BRANCH_PREFIX
+            )
+        except Exception as e:
+            logger.warning(
+                "No se pudo construir el índice de PRs de sync (%s); "
+                "se verifica repo a repo",
+                e,
+            )
+            self._open_pr_index = None
+
+        if self._open_pr_index is not None:
+            logger.info(
+                "Índice de PRs de sync: %d abierto(s) en %d repo(s)",
+                sum(len(prs) for prs in self._open_pr_index.values()),
+                len(self._open_pr_index),
+            )
+
+    def _open_sync_prs(self, repo: RepositoryInfo, branch_prefix: str) -> dict[str, str]:
+        """{branch: URL} de PRs abiertos del repo cuyo branch empieza con el prefijo."""
+        if self._open_pr_index is None:
+            return self._client.get_open_prs_with_prefix(repo, branch_prefix)
 
-    def _check_skip_conditions(self, repo: Repository) -> SyncResult | None:
+        return {
+            branch: url
+            for branch, url in self._open_pr_index.get(repo.full_name, {}).items()
+            if branch.startswith(branch_prefix)
+        }
+
+    def _journal_phase(self, job: SyncJob, phase: JournalPhase, **data) -> None:
+        """Registra una transición de fase del repo en el diario (si lo hay)."""
+        if self._journal:
+            self._journal.record(job.repo.full_name, phase, **data)
+
+    def _get_target_head(self, repo: RepositoryInfo) -> str | None:
+        """Obtiene el HEAD de la rama por defecto si hay estado incremental.
+
+        Returns:
+            SHA del HEAD, o None si no hay almacén de estado o no se pudo leer.
+        """
+        if self._state_store is None or repo.archived or not repo.default_branch:
+            return None
+
+        precheck = self._prechecks.get(repo.full_name)
+        if precheck and precheck.head_sha:
+            return precheck.head_sha
+
+        try:
+            return self._client.get_base_sha(repo, repo.default_branch)
+        except Exception as e:
+            logger.debug("No se pudo leer el HEAD de %s: %s", repo.name, e)
+            return None
+
+    def _record_state(self, repo: RepositoryInfo, target_head: str | None) -> None:
+        """Registra que el repo quedó verificado como sincronizado."""
+        # En modo delta solo se verificó una parte de los workflows
+        if self._state_store is None or target_head is None or self._diff_scope is not None:
+            return
+
+        self._state_store.record(
+            self._source_full_name,
+            repo.full_name,
+            self._source_fingerprint,
+            target_head,
+        )
+
+    def _check_skip_conditions(self, repo: RepositoryInfo) -> SyncResult | None:
         """Verifica condiciones para saltar el repo.
 
         Returns:
@@ -384,229 +1498,123 @@ class WorkflowSyncService:
                 message="Repositorio archivado",
             )
 
-        # Repo vacío
-        try:
-            if not repo.default_branch:
-                return SyncResult(
-                    repo_name=repo.name,
-                    status=SyncStatus.SKIPPED,
-                    message="Repositorio sin branch por defecto",
-                )
-        except Exception:
+        # Repo sin branch por defecto
+        if not repo.default_branch:
             return SyncResult(
                 repo_name=repo.name,
                 status=SyncStatus.SKIPPED,
-                message="Repositorio vacío (sin commits)",
+                message="Repositorio sin branch por defecto",
             )
 
-        # Repo sin carpeta de workflows (no necesita sincronización)
-        if not self._client.has_workflows_folder(repo, self.WORKFLOWS_PATH):
-            return SyncResult(
-                repo_name=repo.name,
-                status=SyncStatus.SKIPPED,
-                message="Sin carpeta .github/workflows (no requiere workflows)",
-            )
+        return None
 
-        # PR existente (idempotencia)
-        existing_prs = self._client.get_open_prs_with_prefix(repo, self.BRANCH_PREFIX)
-        if existing_prs:
-            return SyncResult(
-                repo_name=repo.name,
-                status=SyncStatus.SKIPPED,
-                message=f"PR de sync existente: {existing_prs[0]}",
-            )
+    def _get_required_changes(
+        self, repo: RepositoryInfo, target_tree: dict[str, str]
+    ) -> list[FileChange]:
+        """Obtiene los cambios necesarios para el repo.
 
-        return None
+        Compara los SHAs de blob del destino con los de la fuente y solo
+        descarga un archivo cuando los SHAs difieren, para aplicar la
+        comparación tolerante a espacios (`.strip()`).
 
-    def _get_required_changes(self, repo: Repository) -> list[FileChange]:
-        """Obtiene los cambios necesarios para el repo."""
+        Args:
+            repo: Repositorio destino.
+            target_tree: {nombre: SHA del blob} de los workflows del destino.
+        """
         changes: list[FileChange] = []
 
-        # Obtener archivos existentes en el destino
-        existing_files = self._client.get_workflow_filenames(repo, self.WORKFLOWS_PATH)
-        source_filenames = set(self._source_workflows.keys())
-
         # Archivos a crear o actualizar
-        for filename, new_content in self._source_workflows.items():
-            file_path = f"{self.WORKFLOWS_PATH}/{filename}"
+        for filename, new_content in self._in_scope(self._source_workflows).items():
+            existing_sha = target_tree.get(filename)
 
-            result = self._client.get_file_content(repo, file_path)
-
-            if result is None:
+            if existing_sha is None:
                 # Archivo no existe, crear
                 changes.append(FileChange(filename=filename, content=new_content))
                 logger.debug("Archivo %s será creado en %s", filename, repo.name)
-            else:
-                existing_content, sha = result
-                if existing_content.strip() != new_content.strip():
-                    changes.append(
-                        FileChange(
-                            filename=filename, content=new_content, existing_sha=sha
-                        )
-                    )
-                    logger.debug(
-                        "Archivo %s necesita actualización en %s", filename, repo.name
-                    )
-
-        # Archivos a eliminar (existen en destino pero no en fuente)
-        for existing_file in existing_files:
-            if existing_file not in source_filenames:
-                file_path = f"{self.WORKFLOWS_PATH}/{existing_file}"
-                result = self._client.get_file_content(repo, file_path)
-                if result:
-                    _, sha = result
-                    changes.append(
-                        FileChange(
-                            filename=existing_file,
-                            existing_sha=sha,
-                            is_deletion=True,
-                        )
-                    )
-                    logger.debug(
-                        "Archivo %s será eliminado en %s (no existe en fuente)",
-                        existing_file,
-                        repo.name,
-                    )
+                continue
 
-        return changes
+            if existing_sha == self._source_shas[filename]:
+                # Idéntico byte a byte, no hace falta descargarlo
+                continue
 
-    def _create_sync_pr(
-        self, repo: Repository, changes: list[FileChange]
-    ) -> SyncResult:
-        """Crea un PR con los cambios de workflows."""
-        branch_name = None
-        files_updated: list[str] = []
-        files_deleted: list[str] = []
-        files_failed: list[str] = []
+            file_path = f"{self.WORKFLOWS_PATH}/{filename}"
+            result = self._client.get_file_content(repo, file_path)
 
-        try:
-            # Crear branch único
-            base_sha = self._client.get_base_sha(repo, repo.default_branch)
-            branch_name = self._generate_unique_branch_name(repo)
-            self._client.create_branch(repo, branch_name, base_sha)
+            if result is None:
+                changes.append(FileChange(filename=filename, content=new_content))
+                logger.debug("Archivo %s será creado en %s", filename, repo.name)
+                continue
 
-            # Aplicar cambios
-            for change in changes:
-                try:
-                    file_path = f"{self.WORKFLOWS_PATH}/{change.filename}"
-
-                    if change.is_deletion:
-                        # Eliminar archivo
-                        message = f"chore: remove workflow {change.filename}"
-                        self._client.delete_file(
-                            repo=repo,
-                            path=file_path,
-                            message=message,
-                            branch=branch_name,
-                            sha=change.existing_sha,
-                        )
-                        files_deleted.append(change.filename)
-                        logger.debug(
-                            "Archivo %s eliminado en %s", change.filename, repo.name
-                        )
-                    else:
-                        # Crear o actualizar archivo
-                        message = (
-                            f"chore: {'sync' if change.existing_sha else 'add'} "
-                            f"workflow {change.filename}"
-                        )
-                        self._client.create_or_update_file(
-                            repo=repo,
-                            path=file_path,
-                            content=change.content,
-                            message=message,
-                            branch=branch_name,
-                            sha=change.existing_sha,
-                        )
-                        files_updated.append(change.filename)
-                        logger.debug(
-                            "Archivo %s actualizado en %s", change.filename, repo.name
-                        )
+            existing_content, sha = result
+            if existing_content.strip() != new_content.strip():
+                changes.append(
+                    FileChange(filename=filename, content=new_content, existing_sha=sha)
+                )
+                logger.debug(
+                    "Archivo %s necesita actualización en %s", filename, repo.name
+                )
 
-                except Exception as e:
-                    logger.error(
-                        "Error procesando %s en %s: %s",
-                        change.filename,
-                        repo.name,
-                        str(e),
+        # Archivos a eliminar (existen en destino pero no en fuente); en modo
+        # delta solo los eliminados de la fuente dentro del rango
+        for existing_file, sha in self._in_scope(target_tree).items():
+            if existing_file not in self._source_workflows:
+                changes.append(
+                    FileChange(
+                        filename=existing_file,
+                        existing_sha=sha,
+                        is_deletion=True,
                     )
-                    files_failed.append(change.filename)
-
-            # Si ningún archivo se procesó, cleanup y error
-            if not files_updated and not files_deleted:
-                self._client.delete_branch(repo, branch_name)
-                return SyncResult(
-                    repo_name=repo.name,
-                    status=SyncStatus.ERROR,
-                    message="Todas las operaciones fallaron",
-                    files_failed=files_failed,
-                    branch_created=branch_name,
+                )
+                logger.debug(
+                    "Archivo %s será eliminado en %s (no existe en fuente)",
+                    existing_file,
+                    repo.name,
                 )
 
-            # Crear PR
-            pr_body = PRBodyGenerator.generate(
-                org=self._config.org,
-                source_repo=self._config.source_repo,
-                files_updated=files_updated,
-                files_deleted=files_deleted,
-                files_failed=files_failed,
-            )
-
-            pr_url, pr_number = self._client.create_pull_request(
-                repo=repo,
-                title="chore: sync GitHub Actions workflows",
-                body=pr_body,
-                head=branch_name,
-                base=repo.default_branch,
-            )
-
-            # Auto-merge si está habilitado
-            merged = False
-            if self._config.auto_merge:
-                logger.debug("Auto-mergeando PR #%d en %s", pr_number, repo.name)
-                merged = self._client.merge_pull_request(repo, pr_number)
-                if merged:
-                    logger.debug("PR #%d mergeado exitosamente", pr_number)
-
-            all_files = files_updated + files_deleted
-            message = f"{len(files_updated)} actualizado(s), {len(files_deleted)} eliminado(s)"
-            if merged:
-                message += " [MERGEADO]"
-
-            return SyncResult(
-                repo_name=repo.name,
-                status=SyncStatus.SUCCESS,
-                pr_url=pr_url,
-                message=message,
-                files_updated=all_files,
-                files_failed=files_failed,
-                branch_created=branch_name if not merged else None,
-            )
-
-        except Exception as e:
-            if branch_name:
-                self._client.delete_branch(repo, branch_name)
+        return changes
 
-            logger.exception("Error creando PR para %s", repo.name)
-            return SyncResult(
-                repo_name=repo.name,
-                status=SyncStatus.ERROR,
-                message=f"Error: {str(e)}",
-                files_updated=files_updated,
-                files_failed=files_failed,
-                branch_created=branch_name,
-            )
+    def _success_result(
+        self, job: SyncJob, merged: bool, note: str | None = None
+    ) -> SyncResult:
+        """Construye el resultado de un repo con PR creado.
 
-    def _generate_unique_branch_name(self, repo: Repository) -> str:
-        """Genera un nombre de branch único."""
-        timestamp = int(time.time() * 1000)
-        branch_name = f"{self.BRANCH_PREFIX}-{timestamp}"
+        Args:
+            job: Estado del repo.
+            merged: Si el PR quedó mergeado.
+            note: Estado de merge a mostrar si no se mergeó (ej: en cola).
+        """
+        files_updated, files_deleted = self._split_changes(job.changes)
+        message = f"{len(files_updated)} actualizado(s), {len(files_deleted)} eliminado(s)"
+        if merged:
+            message += " [MERGEADO]"
+        elif note:
+            message += f" [{note}]"
+
+        return SyncResult(
+            repo_name=job.repo.name,
+            status=SyncStatus.SUCCESS,
+            pr_url=job.pr_url,
+            message=message,
+            files_updated=files_updated + files_deleted,
+            branch_created=job.branch_name if not merged else None,
+        )
 
-        if self._client.branch_exists(repo, branch_name):
-            branch_name = f"{branch_name}-{random.randint(1000, 9999)}"
-            logger.debug("Branch existía, usando %s", branch_name)
+    @staticmethod
+    def _split_changes(changes: list[FileChange]) -> tuple[list[str], list[str]]:
+        """Separa los cambios en (actualizados, eliminados)."""
+        files_updated = [c.filename for c in changes if not c.is_deletion]
+        files_deleted = [c.filename for c in changes if c.is_deletion]
+        return files_updated, files_deleted
 
-        return branch_name
+    @staticmethod
+    def _build_commit_message(
+        files_updated: list[str], files_deleted: list[str]
+    ) -> str:
+        """Genera el mensaje del commit de sincronización."""
+        lines = ["chore: sync GitHub Actions workflows", ""]
+        lines.extend(f"- sync {f}" for f in files_updated)
+        lines.extend(f"- remove {f}" for f in files_deleted)
+        return "\n".join(lines)
 
     def _log_result(self, result: SyncResult) -> None:
         """Registra el resultado de sincronización."""
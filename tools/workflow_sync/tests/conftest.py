@@ -0,0 +1,7 @@
+"""Configuración común de los tests de workflow_sync."""
+
+import sys
+from pathlib import Path
+
+# Los módulos del paquete se importan por su ruta (models, services...)
+sys.path.insert(0, str(Path(__file__).parent.parent))
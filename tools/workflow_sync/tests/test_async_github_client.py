@@ -0,0 +1,77 @@
+"""Tests del transporte aiohttp contra un servidor HTTP local."""
+
+import asyncio
+import threading
+
+import pytest
+
+pytest.importorskip("github")
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web
+
+from clients.async_github_client import AsyncGitHubClient
+
+
+@pytest.fixture
+def server():
+    """Servidor local con un repo renombrado (301) y una redirección a otro host."""
+
+    async def renamed(request):
+        raise web.HTTPMovedPermanently(f"/repositories/42?{request.query_string}")
+
+    async def repository(request):
+        return web.json_response(
+            {"id": 42, "page": request.query.get("page"), "method": request.method}
+        )
+
+    async def elsewhere(request):
+        raise web.HTTPTemporaryRedirect("http://other.invalid/repositories/42")
+
+    app = web.Application()
+    app.router.add_route("*", "/repos/org/old", renamed)
+    app.router.add_route("*", "/repositories/42", repository)
+    app.router.add_get("/repos/org/moved-away", elsewhere)
+
+    loop = asyncio.new_event_loop()
+    runner = web.AppRunner(app)
+    loop.run_until_complete(runner.setup())
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    loop.run_until_complete(site.start())
+    port = site._server.sockets[0].getsockname()[1]
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    yield f"http://127.0.0.1:{port}"
+
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=5)
+    loop.run_until_complete(runner.cleanup())
+    loop.close()
+
+
+@pytest.fixture
+def client(server):
+    client = AsyncGitHubClient("token", base_url=server)
+    yield client
+    client.close()
+
+
+def test_follows_renamed_repository_redirects(client):
+    status, _, body = client._send("GET", "/repos/org/old", {"page": 2}, {}, None)
+
+    assert status == 200
+    assert '"page": "2"' in body
+
+
+def test_preserves_the_method_on_redirect(client):
+    status, _, body = client._send("PATCH", "/repos/org/old", None, {}, {"name": "x"})
+
+    assert status == 200
+    assert '"method": "PATCH"' in body
+
+
+def test_does_not_follow_redirects_to_other_hosts(client):
+    status, headers, _ = client._send("GET", "/repos/org/moved-away", None, {}, None)
+
+    assert status == 307
+    assert headers["Location"] == "http://other.invalid/repositories/42"
@@ -0,0 +1,66 @@
+"""Tests de BranchGarbageCollector con un cliente falso."""
+
+from models import BranchRef, DiscoveryMode, RepositoryInfo
+from services.branch_gc import BranchGarbageCollector
+
+
+class FakeClient:
+    """Cliente mínimo: dos repos con topic y una rama de sync en cada uno."""
+
+    def __init__(self) -> None:
+        self.discovered_with: list[str] = []
+        self.deleted: list[tuple[str, str]] = []
+        self.repos = [
+            RepositoryInfo(name="a", full_name="org/a", default_branch="main"),
+            RepositoryInfo(name="b", full_name="org/b", default_branch="main"),
+            RepositoryInfo(name="old", full_name="org/old", default_branch="main", archived=True),
+        ]
+
+    def search_repositories_by_topic(self, org, topic):
+        self.discovered_with.append("search")
+        return iter(self.repos)
+
+    def list_org_repositories_by_topic(self, org, topic):
+        self.discovered_with.append("org_listing")
+        return iter(self.repos)
+
+    def get_branches_with_prefix(self, repos, prefix):
+        assert all(not repo.archived for repo in repos)
+        return [
+            BranchRef(repo="org/a", name=f"{prefix}1", sha="a" * 40, has_open_pr=True),
+            BranchRef(repo="org/b", name=f"{prefix}2", sha="b" * 40),
+        ]
+
+    def delete_branch(self, repo, branch_name):
+        self.deleted.append((repo.full_name, branch_name))
+        return True
+
+
+def test_deletes_only_branches_without_open_pr():
+    client = FakeClient()
+
+    report = BranchGarbageCollector(client).collect("org", "ci", "sync/")
+
+    assert client.discovered_with == ["search"]
+    assert client.deleted == [("org/b", "sync/2")]
+    assert [b.name for b in report.kept] == ["sync/1"]
+    assert report.repos_scanned == 2
+
+
+def test_dry_run_deletes_nothing():
+    client = FakeClient()
+
+    report = BranchGarbageCollector(client).collect("org", "ci", "sync/", dry_run=True)
+
+    assert client.deleted == []
+    assert [b.name for b in report.deleted] == ["sync/2"]
+
+
+def test_org_listing_discovery():
+    client = FakeClient()
+
+    BranchGarbageCollector(client, discovery=DiscoveryMode.ORG_LISTING).collect(
+        "org", "ci", "sync/", dry_run=True
+    )
+
+    assert client.discovered_with == ["org_listing"]
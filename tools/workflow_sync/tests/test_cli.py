@@ -0,0 +1,35 @@
+"""Tests de la resolución del token en la línea de comandos."""
+
+import pytest
+
+pytest.importorskip("github")
+
+import cli
+import interactive
+
+
+@pytest.fixture
+def saved_token(monkeypatch):
+    monkeypatch.setattr(interactive, "load_saved_token", lambda: "saved-token")
+
+
+def test_exported_token_wins_over_saved_token(monkeypatch, saved_token):
+    monkeypatch.setenv("GITHUB_TOKEN", "env-token")
+
+    assert cli.resolve_token() == "env-token"
+
+
+def test_saved_token_is_the_fallback(monkeypatch, saved_token):
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+
+    assert cli.resolve_token() == "saved-token"
+
+
+def test_resume_uses_the_exported_token(monkeypatch, saved_token):
+    monkeypatch.setenv("GITHUB_TOKEN", "env-token")
+    used = []
+    monkeypatch.setattr(interactive, "resume_run", lambda token, run_id: used.append(token))
+
+    cli.main(["--resume", "run-1"])
+
+    assert used == ["env-token"]
@@ -0,0 +1,111 @@
+"""Tests del grafo de dependencias workflows → composite actions."""
+
+from services.dependency_graph import ActionDependencyGraph
+
+SOURCE = "Org/template"
+WORKFLOWS_PATH = ".github/workflows"
+
+WORKFLOWS = {
+    "build.yml": """
+jobs:
+  build:
+    steps:
+      - uses: actions/checkout@v4
+      - uses: Org/template/actions/docker-build@main
+""",
+    "deploy.yml": """
+jobs:
+  deploy:
+    uses: Org/template/.github/workflows/build.yml@main
+""",
+    "lint.yml": """
+jobs:
+  lint:
+    steps:
+      - uses: 'org/template/actions/lint@v1'
+""",
+    "docs.yml": "jobs: {}\n",
+}
+ACTIONS = {
+    "actions/docker-build": """
+runs:
+  using: composite
+  steps:
+    - uses: Org/template/internal/docker-build-push@main
+""",
+    "actions/lint": "runs:\n  using: composite\n",
+    "internal/docker-build-push": "runs:\n  using: composite\n",
+}
+
+
+def build_graph() -> ActionDependencyGraph:
+    return ActionDependencyGraph.build(SOURCE, WORKFLOWS_PATH, WORKFLOWS, ACTIONS)
+
+
+def test_parses_uses_of_the_source_repo_only():
+    graph = build_graph()
+
+    assert graph.dependencies(".github/workflows/build.yml") == {"actions/docker-build"}
+    assert graph.dependencies(".github/workflows/deploy.yml") == {".github/workflows/build.yml"}
+    # La referencia al repo fuente no distingue mayúsculas; checkout es de terceros
+    assert graph.dependencies(".github/workflows/lint.yml") == {"actions/lint"}
+    assert graph.dependencies("actions/docker-build") == {"internal/docker-build-push"}
+    assert graph.dependencies(".github/workflows/docs.yml") == frozenset()
+
+
+def test_internal_action_change_reaches_workflows_transitively():
+    graph = build_graph()
+
+    assert graph.affected_workflows(["internal/docker-build-push/action.yml"]) == {
+        "build.yml",
+        "deploy.yml",
+    }
+
+
+def test_any_file_of_an_action_affects_its_users():
+    graph = build_graph()
+
+    assert graph.affected_workflows(["actions/lint/scripts/run.sh"]) == {"lint.yml"}
+
+
+def test_workflow_change_affects_itself_and_its_callers():
+    graph = build_graph()
+
+    assert graph.affected_workflows([".github/workflows/build.yml"]) == {
+        "build.yml",
+        "deploy.yml",
+    }
+    # Un workflow eliminado (ya no está en el grafo) sigue contando como afectado
+    assert graph.affected_workflows([".github/workflows/removed.yml"]) == {"removed.yml"}
+
+
+def test_unrelated_files_affect_nothing():
+    graph = build_graph()
+
+    assert graph.affected_workflows(["README.md", "tools/x.py", "actions/README.md"]) == set()
+
+
+def test_dependency_cycles_terminate():
+    graph = ActionDependencyGraph(
+        WORKFLOWS_PATH,
+        {
+            ".github/workflows/a.yml": {"actions/x"},
+            "actions/x": {"actions/y"},
+            "actions/y": {"actions/x"},
+        },
+    )
+
+    assert graph.affected_workflows(["actions/y/action.yml"]) == {"a.yml"}
+
+
+def test_save_and_load_round_trip(tmp_path):
+    graph = build_graph()
+    path = tmp_path / "graphs" / "abc.json"
+    graph.save(path)
+
+    loaded = ActionDependencyGraph.load(path)
+
+    assert loaded.nodes == graph.nodes
+    for node in graph.nodes:
+        assert loaded.dependencies(node) == graph.dependencies(node)
+    assert ActionDependencyGraph.load(tmp_path / "missing.json") is None
@@ -0,0 +1,89 @@
+"""Tests de la caché de diffs por árbol de workflows."""
+
+import threading
+import time
+
+import pytest
+
+from models import FileChange
+from services.diff_cache import DiffCache
+from services.state_store import SyncStateStore
+
+TREE = {"ci.yml": "1" * 40, "lint.yml": "2" * 40}
+
+
+def key(tree):
+    return SyncStateStore.fingerprint(tree)
+
+
+def test_same_tree_reuses_the_diff():
+    cache = DiffCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return [FileChange(filename="ci.yml", content="new")]
+
+    first = cache.get_or_compute(key(TREE), compute)
+    second = cache.get_or_compute(key(dict(reversed(list(TREE.items())))), compute)
+
+    assert first == second
+    assert first is not second
+    assert calls == [1]
+    assert cache.stats() == {"trees": 1, "hits": 1}
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        {**TREE, "ci.yml": "3" * 40},
+        {"ci.yml": TREE["ci.yml"]},
+        {**TREE, "new.yml": "4" * 40},
+        {"renamed.yml": TREE["ci.yml"], "lint.yml": TREE["lint.yml"]},
+    ],
+)
+def test_any_tree_change_gets_its_own_diff(other):
+    cache = DiffCache()
+    cache.get_or_compute(key(TREE), lambda: [FileChange(filename="a")])
+
+    changes = cache.get_or_compute(key(other), lambda: [FileChange(filename="b")])
+
+    assert changes == [FileChange(filename="b")]
+    assert cache.stats() == {"trees": 2, "hits": 0}
+
+
+def test_errors_are_not_cached():
+    cache = DiffCache()
+
+    def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_compute(key(TREE), fail)
+
+    assert cache.get_or_compute(key(TREE), lambda: []) == []
+    assert cache.stats() == {"trees": 1, "hits": 0}
+
+
+def test_concurrent_requests_compute_once():
+    cache = DiffCache()
+    calls = []
+    barrier = threading.Barrier(8)
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return [FileChange(filename="ci.yml")]
+
+    def worker():
+        barrier.wait()
+        cache.get_or_compute(key(TREE), compute)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [1]
+    assert cache.stats() == {"trees": 1, "hits": 7}
@@ -0,0 +1,146 @@
+"""Tests de GitTransportClient contra repositorios bare locales (file://)."""
+
+import base64
+import subprocess
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("github")
+
+from clients.git_transport_client import GitTransportClient
+from exceptions import BranchExistsError
+from models import FileChange, RepositoryInfo
+
+WORKFLOWS_PATH = ".github/workflows"
+REPO = RepositoryInfo(name="app", full_name="org/app", default_branch="main")
+
+
+def git(cwd: Path, *args: str) -> str:
+    """Ejecuta git en `cwd` y retorna su salida."""
+    env = {
+        "GIT_AUTHOR_NAME": "test",
+        "GIT_AUTHOR_EMAIL": "test@example.com",
+        "GIT_COMMITTER_NAME": "test",
+        "GIT_COMMITTER_EMAIL": "test@example.com",
+        "HOME": str(cwd),
+    }
+    result = subprocess.run(
+        ["git", *args], cwd=cwd, env=env, capture_output=True, check=True, text=True
+    )
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def remote(tmp_path: Path) -> Path:
+    """Repo bare org/app con un workflow en la rama main."""
+    bare = tmp_path / "remote" / "org" / "app.git"
+    bare.parent.mkdir(parents=True)
+    git(tmp_path, "init", "--quiet", "--bare", "--initial-branch=main", str(bare))
+    git(bare, "config", "uploadpack.allowFilter", "true")
+
+    work = tmp_path / "work"
+    git(tmp_path, "init", "--quiet", "--initial-branch=main", str(work))
+    (work / WORKFLOWS_PATH).mkdir(parents=True)
+    (work / WORKFLOWS_PATH / "ci.yml").write_text("name: ci\n")
+    (work / WORKFLOWS_PATH / "old.yml").write_text("name: old\n")
+    (work / "README.md").write_text("app\n")
+    git(work, "add", ".")
+    git(work, "commit", "--quiet", "-m", "init")
+    git(work, "push", "--quiet", str(bare), "main")
+    return bare
+
+
+@pytest.fixture
+def client(tmp_path: Path, remote: Path) -> GitTransportClient:
+    """Cliente cuyo remoto es el repo bare local."""
+    return GitTransportClient(
+        token="test-token",
+        mirror_dir=tmp_path / "mirrors",
+        remote_url=f"file://{tmp_path}/remote/{{full_name}}.git",
+    )
+
+
+def test_workflow_tree_matches_remote_blobs(client, remote):
+    tree = client.get_workflow_tree(REPO, WORKFLOWS_PATH)
+
+    assert set(tree) == {"ci.yml", "old.yml"}
+    assert tree["ci.yml"] == git(remote, "rev-parse", f"main:{WORKFLOWS_PATH}/ci.yml")
+    assert client.get_workflow_tree(REPO, "missing") is None
+
+
+def test_get_file_content(client):
+    content, sha = client.get_file_content(REPO, f"{WORKFLOWS_PATH}/ci.yml")
+
+    assert content == "name: ci\n"
+    assert sha == client.get_workflow_tree(REPO, WORKFLOWS_PATH)["ci.yml"]
+    assert client.get_file_content(REPO, f"{WORKFLOWS_PATH}/nope.yml") is None
+
+
+def test_commit_and_push_in_a_single_branch(client, remote):
+    base_sha = client.get_base_sha(REPO, "main")
+    commit = client.commit_changes(
+        REPO,
+        base_sha,
+        [
+            FileChange(filename="ci.yml", content="name: ci v2\n"),
+            FileChange(filename="new.yml", content="name: new\n"),
+            FileChange(filename="old.yml", is_deletion=True),
+        ],
+        message="chore: sync workflows",
+        path=WORKFLOWS_PATH,
+    )
+    client.create_branch(REPO, "sync/workflows", commit)
+
+    assert client.branch_exists(REPO, "sync/workflows")
+    assert git(remote, "rev-parse", "refs/heads/sync/workflows") == commit
+    assert git(remote, "rev-parse", f"{commit}^") == base_sha
+    files = git(remote, "ls-tree", "--name-only", f"{commit}:{WORKFLOWS_PATH}").split()
+    assert files == ["ci.yml", "new.yml"]
+    assert git(remote, "show", f"{commit}:{WORKFLOWS_PATH}/ci.yml") == "name: ci v2"
+    # Los archivos fuera de la carpeta de workflows no cambian
+    assert git(remote, "show", f"{commit}:README.md") == "app"
+
+
+def test_create_branch_lease_rejects_existing_branch(client, remote):
+    base_sha = client.get_base_sha(REPO, "main")
+    client.create_branch(REPO, "sync/workflows", base_sha)
+    commit = client.commit_changes(
+        REPO,
+        base_sha,
+        [FileChange(filename="ci.yml", content="name: other\n")],
+        message="other",
+        path=WORKFLOWS_PATH,
+    )
+
+    with pytest.raises(BranchExistsError):
+        client.create_branch(REPO, "sync/workflows", commit)
+    assert git(remote, "rev-parse", "refs/heads/sync/workflows") == base_sha
+
+    client.reset_branch(REPO, "sync/workflows", commit)
+    assert git(remote, "rev-parse", "refs/heads/sync/workflows") == commit
+
+
+def test_delete_branch(client):
+    client.create_branch(REPO, "sync/workflows", client.get_base_sha(REPO, "main"))
+
+    assert client.delete_branch(REPO, "sync/workflows")
+    assert not client.branch_exists(REPO, "sync/workflows")
+
+
+def test_credentials_are_scoped_to_the_remote_host(tmp_path):
+    enterprise = GitTransportClient(
+        token="test-token",
+        mirror_dir=tmp_path / "ghes",
+        remote_url="https://github.example.com/{full_name}.git",
+    )
+    local = GitTransportClient(
+        token="test-token",
+        mirror_dir=tmp_path / "local",
+        remote_url=f"file://{tmp_path}/{{full_name}}.git",
+    )
+
+    assert enterprise._env["GIT_CONFIG_KEY_0"] == "http.https://github.example.com/.extraheader"
+    credentials = base64.b64decode(enterprise._env["GIT_CONFIG_VALUE_0"].split()[-1])
+    assert credentials == b"x-access-token:test-token"
+    assert "GIT_CONFIG_KEY_0" not in local._env
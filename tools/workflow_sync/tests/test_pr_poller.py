@@ -0,0 +1,67 @@
+"""Tests del estado de los PRs y del sondeo en lote."""
+
+import pytest
+
+from models import MergeState, PullRequestStatus, RepositoryInfo
+from services import pr_poller
+from services.pr_poller import PullRequestPoller
+
+REPO = RepositoryInfo(name="app", full_name="org/app", default_branch="main")
+
+
+def status(**kwargs) -> PullRequestStatus:
+    return PullRequestStatus(repo="org/app", number=1, url="u", **kwargs)
+
+
+def test_no_checks_yet_is_pending_when_checks_are_required():
+    pr = status(merge_state=MergeState.MERGEABLE)
+
+    assert not pr.is_green
+    assert not pr.is_settled
+
+
+def test_no_checks_is_green_without_required_checks():
+    assert status(merge_state=MergeState.MERGEABLE, requires_checks=False).is_green
+
+
+@pytest.mark.parametrize(
+    "pr",
+    [
+        status(merge_state=MergeState.PENDING, review_decision="REVIEW_REQUIRED"),
+        status(merge_state=MergeState.PENDING, review_decision="CHANGES_REQUESTED"),
+        status(merge_state=MergeState.PENDING, draft=True),
+        status(merge_state=MergeState.CONFLICT),
+        status(merge_state=MergeState.MERGEABLE, checks="FAILURE"),
+    ],
+)
+def test_states_that_need_a_person_settle_as_failed(pr):
+    assert pr.is_failed
+    assert pr.is_settled
+    assert not pr.is_green
+
+
+class FakeClient:
+    def __init__(self, rounds):
+        self.rounds = list(rounds)
+        self.polls = 0
+
+    def get_pull_request_statuses(self, pulls):
+        self.polls += 1
+        return {("org/app", 1): self.rounds.pop(0)}
+
+
+def test_waits_before_the_first_poll(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(pr_poller.time, "sleep", sleeps.append)
+    client = FakeClient(
+        [
+            status(merge_state=MergeState.PENDING, checks="PENDING"),
+            status(merge_state=MergeState.MERGEABLE, checks="SUCCESS"),
+        ]
+    )
+
+    statuses = PullRequestPoller(client).wait_until_settled([(REPO, 1)])
+
+    assert statuses[("org/app", 1)].is_green
+    assert sleeps == [PullRequestPoller.INITIAL_INTERVAL, PullRequestPoller.INITIAL_INTERVAL * 2]
+    assert client.polls == 2
@@ -0,0 +1,141 @@
+"""Tests del token bucket compartido alimentado por las cabeceras de GitHub."""
+
+import pytest
+
+pytest.importorskip("github")
+
+from clients import rate_limiter as rate_limiter_module
+from clients.rate_limiter import RateLimiter
+
+
+class Clock:
+    """Reloj falso: sleep avanza el tiempo sin esperar."""
+
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+        self.sleeps: list[float] = []
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(rate_limiter_module.time, "time", clock.time)
+    monkeypatch.setattr(rate_limiter_module.time, "sleep", clock.sleep)
+    return clock
+
+
+def headers(remaining: int, reset: float, limit: int = 5000) -> dict[str, str]:
+    return {
+        "x-ratelimit-remaining": str(remaining),
+        "x-ratelimit-reset": str(int(reset)),
+        "x-ratelimit-limit": str(limit),
+    }
+
+
+def remaining(limiter: RateLimiter, resource: str = "core") -> int | None:
+    return limiter.snapshot()[resource]["remaining"]
+
+
+def test_first_request_goes_out_without_information(clock):
+    limiter = RateLimiter()
+
+    limiter.acquire()
+
+    assert clock.sleeps == []
+    assert remaining(limiter) is None
+
+
+def test_acquire_takes_tokens_locally(clock):
+    limiter = RateLimiter()
+    limiter.update("core", headers(4000, clock.now + 3600))
+
+    for _ in range(3):
+        limiter.acquire()
+
+    assert remaining(limiter) == 3997
+    assert clock.sleeps == []
+
+
+def test_same_window_never_gives_back_reserved_tokens(clock):
+    limiter = RateLimiter()
+    limiter.update("core", headers(4000, clock.now + 3600))
+    limiter.acquire()
+
+    # Respuesta rezagada de la misma ventana con un valor mayor
+    limiter.update("core", headers(4000, clock.now + 3600))
+    assert remaining(limiter) == 3999
+
+    # Ventana nueva: manda el valor de GitHub
+    limiter.update("core", headers(5000, clock.now + 7200))
+    assert remaining(limiter) == 5000
+
+
+def test_waits_for_reset_at_the_reserve_and_refills(clock):
+    limiter = RateLimiter(reserves={"core": 10})
+    reset = clock.now + 120
+    limiter.update("core", headers(10, reset))
+
+    limiter.acquire()
+
+    assert clock.now >= reset
+    assert sum(clock.sleeps) == pytest.approx(120, abs=1)
+    assert all(s <= RateLimiter.MAX_SLEEP_CHUNK for s in clock.sleeps)
+    # Tras el reset el bucket vuelve al límite y se toma un token
+    assert remaining(limiter) == 4999
+
+
+def test_paces_requests_below_the_pacing_fraction(clock):
+    limiter = RateLimiter(reserves={"core": 0})
+    limiter.update("core", headers(100, clock.now + 100, limit=1000))
+
+    limiter.acquire()
+    limiter.acquire()
+
+    # 99 tokens para 100 s: la segunda petición espera ~1 s
+    assert clock.sleeps == [pytest.approx(100 / 99)]
+
+
+def test_retry_after_blocks_every_caller(clock):
+    limiter = RateLimiter()
+    limiter.update("search", {"retry-after": "60"})
+
+    limiter.acquire("search")
+
+    assert sum(clock.sleeps) == pytest.approx(60)
+
+
+def test_resource_header_wins_and_resources_are_independent(clock):
+    limiter = RateLimiter()
+    search_headers = {**headers(20, clock.now + 60, limit=30), "x-ratelimit-resource": "search"}
+    limiter.update("core", search_headers)
+
+    assert remaining(limiter, "search") == 20
+    assert remaining(limiter, "core") is None
+
+
+def test_refund_is_capped_at_the_limit(clock):
+    limiter = RateLimiter()
+    limiter.update("core", headers(5000, clock.now + 3600))
+    limiter.acquire()
+
+    limiter.refund("core")
+    limiter.refund("core")
+
+    assert remaining(limiter) == 5000
+
+
+def test_wait_if_exhausted_does_not_take_tokens(clock):
+    limiter = RateLimiter(reserves={"graphql": 50})
+    limiter.update("graphql", headers(50, clock.now + 30))
+
+    limiter.wait_if_exhausted("graphql")
+
+    assert sum(clock.sleeps) == pytest.approx(30)
+    assert remaining(limiter, "graphql") == 5000
@@ -0,0 +1,210 @@
+"""Tests del diario de ejecución y de la reanudación entre fases."""
+
+import json
+
+import pytest
+
+from exceptions import WorkflowSyncError
+from models import DiscoveryMode, MergeMode, RepositoryInfo, SyncConfig, SyncResult, SyncStatus
+from services.run_journal import JournalPhase, RunJournal
+from services.sync_service import WorkflowSyncService
+
+REPO = RepositoryInfo(name="app", full_name="org/app", default_branch="main")
+SOURCE = {"ci.yml": "name: ci\n"}
+
+
+@pytest.fixture
+def config() -> SyncConfig:
+    return SyncConfig(
+        token="secret",
+        org="org",
+        topic="ci",
+        source_repo="template",
+        discovery=DiscoveryMode.ORG_LISTING,
+        merge_mode=MergeMode.NATIVE,
+    )
+
+
+def reopen(journal: RunJournal, directory) -> RunJournal:
+    journal.close()
+    return RunJournal.open(directory, journal.run_id)
+
+
+def test_config_round_trip_without_token(tmp_path, config):
+    journal = RunJournal.start(tmp_path, config)
+
+    header = json.loads(journal.path.read_text().splitlines()[0])
+    assert "token" not in header["config"]
+    assert reopen(journal, tmp_path).config("other-token") == SyncConfig(
+        **{**config.__dict__, "token": "other-token"}
+    )
+
+
+def test_replays_phases_and_ignores_truncated_last_line(tmp_path, config):
+    journal = RunJournal.start(tmp_path, config)
+    journal.record_source("fingerprint", "abc123")
+    journal.record(
+        "org/app",
+        JournalPhase.FILES_WRITTEN,
+        commit_sha="c1",
+        files_updated=["ci.yml"],
+        files_deleted=["old.yml"],
+    )
+    journal.record("org/app", JournalPhase.BRANCH_CREATED, branch_name="sync/x")
+    journal.record("org/app", JournalPhase.PR_OPENED, pr_url="https://gh/pull/3", pr_number=3)
+    journal.close()
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write('{"event": "repo", "repo": "org/app", "pha')
+
+    resumed = RunJournal.open(tmp_path, journal.run_id)
+    state = resumed.state("org/app")
+
+    assert resumed.source_fingerprint == "fingerprint"
+    assert resumed.source_commit_sha == "abc123"
+    assert (state.commit_sha, state.branch_name, state.pr_number) == ("c1", "sync/x", 3)
+    assert state.files_updated == ["ci.yml"]
+    assert state.files_deleted == ["old.yml"]
+    assert not state.reuse_pr and not state.merged and state.result is None
+
+
+def test_replays_completed_result(tmp_path, config):
+    journal = RunJournal.start(tmp_path, config)
+    result = SyncResult(repo_name="app", status=SyncStatus.SUCCESS, pr_url="u", message="ok")
+    journal.record_result("org/app", result)
+
+    assert reopen(journal, tmp_path).state("org/app").result == result
+
+
+def test_rejects_unknown_run_and_version(tmp_path, config):
+    with pytest.raises(WorkflowSyncError):
+        RunJournal.open(tmp_path, "missing")
+
+    journal = RunJournal.start(tmp_path, config)
+    journal.close()
+    journal.path.write_text(json.dumps({"event": "run_started", "version": 99}) + "\n")
+    with pytest.raises(WorkflowSyncError):
+        RunJournal.open(tmp_path, journal.run_id)
+
+
+class FakeClient:
+    """Cliente que registra las escrituras de la reanudación."""
+
+    def __init__(self, existing_branches=()):
+        self.calls: list[tuple] = []
+        self.existing_branches = set(existing_branches)
+
+    def commit_changes(self, **kwargs):
+        self.calls.append(("commit_changes",))
+        return "new-commit"
+
+    def get_base_sha(self, repo, branch):
+        return "base"
+
+    def branch_exists(self, repo, branch_name):
+        return branch_name in self.existing_branches
+
+    def create_branch(self, repo, branch_name, sha):
+        self.calls.append(("create_branch", branch_name, sha))
+
+    def reset_branch(self, repo, branch_name, sha):
+        self.calls.append(("reset_branch", branch_name, sha))
+
+    def get_open_prs_with_prefix(self, repo, prefix):
+        return {}
+
+    def create_pull_request(self, repo, title, body, head, base):
+        self.calls.append(("create_pull_request", head))
+        return "https://gh/org/app/pull/9", 9
+
+    def update_pull_request(self, repo, number, body):
+        self.calls.append(("update_pull_request", number))
+
+
+def resume(tmp_path, config, client, *entries):
+    """Registra las fases indicadas, simula el corte y reanuda el repo."""
+    journal = RunJournal.start(tmp_path, config)
+    for phase, data in entries:
+        journal.record("org/app", phase, **data)
+    journal = reopen(journal, tmp_path)
+
+    service = WorkflowSyncService(client, journal.config("token"), journal=journal)
+    service._set_source(SOURCE, "source-commit")
+    result = service.sync_single_repo(REPO)
+    return service, journal, result
+
+
+FILES_WRITTEN = (
+    JournalPhase.FILES_WRITTEN,
+    {"commit_sha": "c1", "files_updated": ["ci.yml"], "files_deleted": []},
+)
+
+
+def test_crash_after_commit_pushes_the_journaled_commit(tmp_path, config):
+    client = FakeClient()
+
+    service, journal, result = resume(tmp_path, config, client, FILES_WRITTEN)
+
+    branch = service._branch_name
+    assert client.calls == [("create_branch", branch, "c1"), ("create_pull_request", branch)]
+    assert result.status == SyncStatus.SUCCESS
+    assert journal.state("org/app").branch_name == branch
+
+
+def test_crash_after_commit_on_reused_pr_updates_that_pr(tmp_path, config):
+    client = FakeClient()
+    phase, data = FILES_WRITTEN
+    reused = {
+        **data,
+        "reuse_pr": True,
+        "branch_name": "sync/workflows-update-old",
+        "pr_url": "https://gh/org/app/pull/7",
+        "pr_number": 7,
+    }
+
+    _, _, result = resume(tmp_path, config, client, (phase, reused))
+
+    assert client.calls == [
+        ("reset_branch", "sync/workflows-update-old", "c1"),
+        ("update_pull_request", 7),
+    ]
+    assert result.pr_url == "https://gh/org/app/pull/7"
+
+
+def test_crash_after_branch_opens_the_pull_request(tmp_path, config):
+    client = FakeClient(existing_branches={"sync/x"})
+
+    resume(
+        tmp_path,
+        config,
+        client,
+        FILES_WRITTEN,
+        (JournalPhase.BRANCH_CREATED, {"branch_name": "sync/x"}),
+    )
+
+    assert client.calls == [("create_pull_request", "sync/x")]
+
+
+def test_crash_after_pull_request_writes_nothing(tmp_path, config):
+    client = FakeClient(existing_branches={"sync/x"})
+
+    _, _, result = resume(
+        tmp_path,
+        config,
+        client,
+        FILES_WRITTEN,
+        (JournalPhase.BRANCH_CREATED, {"branch_name": "sync/x"}),
+        (JournalPhase.PR_OPENED, {"pr_url": "https://gh/org/app/pull/3", "pr_number": 3}),
+    )
+
+    assert client.calls == []
+    assert result.pr_url == "https://gh/org/app/pull/3"
+
+
+def test_completed_repo_keeps_its_result(tmp_path, config):
+    client = FakeClient()
+    done = {"repo_name": "app", "status": "no_changes", "message": "al día"}
+
+    _, _, result = resume(tmp_path, config, client, (JournalPhase.COMPLETED, {"result": done}))
+
+    assert client.calls == []
+    assert result.status == SyncStatus.NO_CHANGES
@@ -0,0 +1,111 @@
+"""Tests de la serialización del plan de sincronización."""
+
+import json
+
+import pytest
+
+from exceptions import WorkflowSyncError
+from models import FileChange, MergeMode, RepositoryInfo, SyncConfig
+from services.sync_plan import PlannedRepo, SyncPlan
+
+SOURCE = {"ci.yml": "name: ci\n", "lint.yml": "name: lint\n"}
+
+
+def make_plan() -> SyncPlan:
+    config = SyncConfig(
+        token="secret",
+        org="org",
+        topic="ci",
+        source_repo="template",
+        auto_merge=True,
+        merge_mode=MergeMode.WAIT_GREEN,
+    )
+    repos = [
+        PlannedRepo(
+            repo=RepositoryInfo(name="b", full_name="org/b", default_branch="main"),
+            base_sha="b" * 40,
+            changes=[
+                FileChange(filename="ci.yml", content=SOURCE["ci.yml"], existing_sha="1" * 40),
+                FileChange(filename="old.yml", existing_sha="2" * 40, is_deletion=True),
+            ],
+        ),
+        PlannedRepo(
+            repo=RepositoryInfo(name="a", full_name="org/a", default_branch="develop"),
+            base_sha="a" * 40,
+            changes=[FileChange(filename="lint.yml", content=SOURCE["lint.yml"])],
+        ),
+    ]
+    return SyncPlan(config, "source-commit", SOURCE, repos, created_at=1700000000.0)
+
+
+def test_round_trip(tmp_path):
+    plan = make_plan()
+    path = tmp_path / "plan.json"
+    plan.save(path)
+
+    loaded = SyncPlan.load(path, "other-token")
+
+    assert "secret" not in path.read_text()
+    assert loaded.config.token == "other-token"
+    assert loaded.config.merge_mode == MergeMode.WAIT_GREEN
+    assert loaded.source_commit_sha == "source-commit"
+    assert loaded.source_workflows == SOURCE
+    assert [p.repo.full_name for p in loaded.repos] == ["org/a", "org/b"]
+    assert [(p.repo, p.base_sha, p.changes) for p in loaded.repos] == [
+        (p.repo, p.base_sha, p.changes) for p in plan.repos
+    ]
+
+
+def test_contents_are_stored_once(tmp_path):
+    path = tmp_path / "plan.json"
+    make_plan().save(path)
+
+    data = json.loads(path.read_text())
+
+    assert set(data["source"]["workflows"]) == set(SOURCE)
+    assert all("content" not in c for r in data["repos"] for c in r["changes"])
+
+
+def test_rejects_tampered_source(tmp_path):
+    path = tmp_path / "plan.json"
+    make_plan().save(path)
+    data = json.loads(path.read_text())
+    data["source"]["workflows"]["ci.yml"]["content"] = "name: evil\n"
+    path.write_text(json.dumps(data))
+
+    with pytest.raises(WorkflowSyncError, match="ci.yml"):
+        SyncPlan.load(path, "token")
+
+
+def test_rejects_change_without_source_content(tmp_path):
+    path = tmp_path / "plan.json"
+    make_plan().save(path)
+    data = json.loads(path.read_text())
+    del data["source"]["workflows"]["lint.yml"]
+    path.write_text(json.dumps(data))
+
+    with pytest.raises(WorkflowSyncError, match="org/a"):
+        SyncPlan.load(path, "token")
+
+
+def test_rejects_missing_invalid_or_unknown_version(tmp_path):
+    path = tmp_path / "plan.json"
+    with pytest.raises(WorkflowSyncError):
+        SyncPlan.load(path, "token")
+
+    path.write_text("{")
+    with pytest.raises(WorkflowSyncError):
+        SyncPlan.load(path, "token")
+
+    path.write_text(json.dumps({"version": 99}))
+    with pytest.raises(WorkflowSyncError):
+        SyncPlan.load(path, "token")
+
+
+def test_save_replaces_previous_plan_without_temp_files(tmp_path):
+    path = tmp_path / "plan.json"
+    path.write_text("previous")
+    make_plan().save(path)
+
+    assert json.loads(path.read_text())["version"] == SyncPlan.FORMAT_VERSION
+    assert list(tmp_path.iterdir()) == [path]
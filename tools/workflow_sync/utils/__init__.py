@@ -0,0 +1,5 @@
+"""Módulo de utilidades compartidas."""
+
+from .git_objects import git_blob_sha
+
+__all__ = ["git_blob_sha"]
@@ -0,0 +1,27 @@
+"""
+Utilidades para trabajar con objetos git sin necesidad de un repositorio local.
+
+Principio SOLID: Single Responsibility
+- Solo calcula identificadores de objetos git.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+
+def git_blob_sha(content: str | bytes) -> str:
+    """Calcula el SHA de un blob tal como lo haría `git hash-object`.
+
+    Permite comparar contenido local contra los SHAs que devuelve la API de
+    GitHub sin descargar el archivo remoto.
+
+    Args:
+        content: Contenido del archivo (str se codifica en UTF-8).
+
+    Returns:
+        SHA-1 hexadecimal del blob.
+    """
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    header = f"blob {len(data)}\0".encode("ascii")
+    return hashlib.sha1(header + data).hexdigest()
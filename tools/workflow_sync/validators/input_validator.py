@@ -124,6 +124,24 @@ class WorkflowFilePattern(ValidationPattern):
         return "Must be alphanumeric with .yml or .yaml extension"
 
 
+class GitRefPattern(ValidationPattern):
+    """Patrón para refs de git (branch, tag o SHA)."""
+
+    _pattern = re.compile(r"^(?!.*\.\.)(?!/)(?!.*/$)[a-zA-Z0-9._/-]{1,255}$")
+
+    @property
+    def pattern(self) -> re.Pattern[str]:
+        return self._pattern
+
+    @property
+    def field_name(self) -> str:
+        return "git ref"
+
+    @property
+    def error_message(self) -> str:
+        return "Must be a branch, tag or commit SHA"
+
+
 class InputValidator:
     """Validador de inputs del usuario.
 
@@ -139,6 +157,7 @@ class InputValidator:
     _repo_pattern = RepositoryNamePattern()
     _topic_pattern = TopicPattern()
     _workflow_pattern = WorkflowFilePattern()
+    _ref_pattern = GitRefPattern()
 
     @classmethod
     def validate_organization(cls, value: str) -> str:
@@ -155,6 +174,29 @@ class InputValidator:
         """Valida topic (convierte a lowercase primero)."""
         return cls._topic_pattern.validate(value.lower())
 
+    @classmethod
+    def validate_git_ref(cls, value: str) -> str:
+        """Valida ref de git (branch, tag o SHA)."""
+        return cls._ref_pattern.validate(value)
+
+    @classmethod
+    def validate_commit_range(cls, value: str) -> tuple[str, str]:
+        """Valida un rango de commits `base..head` (o `base...head`).
+
+        Returns:
+            (base, head) validados.
+
+        Raises:
+            ValidationError: Si no tiene la forma base..head o algún ref es inválido.
+        """
+        base, separator, head = value.partition("..")
+        head = head[1:] if head.startswith(".") else head
+        if not (separator and base and head):
+            raise ValidationError(
+                f"Invalid commit range: '{value}'. Must be BASE..HEAD"
+            )
+        return cls.validate_git_ref(base), cls.validate_git_ref(head)
+
     @classmethod
     def validate_workflow_file(cls, filename: str) -> str:
         """Valida nombre de archivo de workflow.